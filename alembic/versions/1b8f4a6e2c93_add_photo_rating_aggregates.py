@@ -0,0 +1,42 @@
+"""Add photo rating aggregates
+
+Revision ID: 1b8f4a6e2c93
+Revises: e5a9c3f07d21
+Create Date: 2026-10-18 15:20:46.902357
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '1b8f4a6e2c93'
+down_revision: Union[str, None] = 'e5a9c3f07d21'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column('photos', sa.Column('rating_count', sa.Integer(), server_default='0', nullable=False))
+    op.add_column('photos', sa.Column('rating_sum', sa.Integer(), server_default='0', nullable=False))
+    op.create_index('ix_ratings_photo_id', 'ratings', ['photo_id'], unique=False)
+    op.execute(
+        """
+        UPDATE photos p
+        SET rating_count = r.rating_count, rating_sum = r.rating_sum
+        FROM (
+            SELECT photo_id, count(*) AS rating_count, coalesce(sum(rating), 0) AS rating_sum
+            FROM ratings
+            GROUP BY photo_id
+        ) r
+        WHERE p.id = r.photo_id
+        """
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_ratings_photo_id', table_name='ratings')
+    op.drop_column('photos', 'rating_sum')
+    op.drop_column('photos', 'rating_count')
@@ -0,0 +1,26 @@
+"""Add comments (photo_id, created_at, id) index
+
+Revision ID: 2e7a9c4b6d18
+Revises: 9b3d5f2e8a14
+Create Date: 2026-10-18 17:51:09.442817
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '2e7a9c4b6d18'
+down_revision: Union[str, None] = '9b3d5f2e8a14'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index('ix_comments_photo_id_created_at_id', 'comments', ['photo_id', 'created_at', 'id'], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index('ix_comments_photo_id_created_at_id', table_name='comments')
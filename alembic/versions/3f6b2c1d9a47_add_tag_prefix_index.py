@@ -0,0 +1,26 @@
+"""Add tag prefix index
+
+Revision ID: 3f6b2c1d9a47
+Revises: 875c90320594
+Create Date: 2026-10-18 10:12:41.203114
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '3f6b2c1d9a47'
+down_revision: Union[str, None] = '875c90320594'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index('ix_tags_name_lower_prefix', 'tags', [sa.text('lower(name) text_pattern_ops')], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index('ix_tags_name_lower_prefix', table_name='tags')
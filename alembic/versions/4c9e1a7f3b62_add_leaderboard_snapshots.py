@@ -0,0 +1,44 @@
+"""Add leaderboard snapshots
+
+Adds ratings.created_at for the daily and weekly rankings and the leaderboard_entries table the
+ranking job writes to. Existing ratings keep a NULL timestamp and only count towards all-time rankings.
+
+Revision ID: 4c9e1a7f3b62
+Revises: 7d2e6b9a0f45
+Create Date: 2026-10-18 16:48:12.905114
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '4c9e1a7f3b62'
+down_revision: Union[str, None] = '7d2e6b9a0f45'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column('ratings', sa.Column('created_at', sa.DateTime(), nullable=True))
+    op.create_index(op.f('ix_ratings_created_at'), 'ratings', ['created_at'], unique=False)
+    op.create_table(
+        'leaderboard_entries',
+        sa.Column('period', sa.String(), nullable=False),
+        sa.Column('rank', sa.Integer(), nullable=False),
+        sa.Column('photo_id', sa.Integer(), nullable=False),
+        sa.Column('score', sa.Float(), nullable=False),
+        sa.Column('rating_count', sa.Integer(), nullable=False),
+        sa.Column('average_rating', sa.Float(), nullable=False),
+        sa.Column('computed_at', sa.DateTime(), nullable=True),
+        sa.ForeignKeyConstraint(['photo_id'], ['photos.id'], ondelete='CASCADE'),
+        sa.PrimaryKeyConstraint('period', 'rank'),
+    )
+
+
+def downgrade() -> None:
+    op.drop_table('leaderboard_entries')
+    op.drop_index(op.f('ix_ratings_created_at'), table_name='ratings')
+    op.drop_column('ratings', 'created_at')
@@ -0,0 +1,46 @@
+"""Add comment moderation
+
+Revision ID: 6f1c8d3a5e27
+Revises: 2e7a9c4b6d18
+Create Date: 2026-10-18 18:34:52.207613
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '6f1c8d3a5e27'
+down_revision: Union[str, None] = '2e7a9c4b6d18'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        'banned_terms',
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('term', sa.String(), nullable=False),
+        sa.Column('action', sa.String(), nullable=False),
+        sa.Column('created_at', sa.DateTime(), nullable=True),
+        sa.PrimaryKeyConstraint('id'),
+        sa.UniqueConstraint('term'),
+    )
+    op.create_table(
+        'moderation_queue',
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('comment_id', sa.Integer(), nullable=False),
+        sa.Column('status', sa.String(), nullable=False),
+        sa.Column('matched_terms', sa.JSON(), nullable=False),
+        sa.Column('created_at', sa.DateTime(), nullable=True),
+        sa.ForeignKeyConstraint(['comment_id'], ['comments.id'], ondelete='CASCADE'),
+        sa.PrimaryKeyConstraint('id'),
+        sa.UniqueConstraint('comment_id'),
+    )
+
+
+def downgrade() -> None:
+    op.drop_table('moderation_queue')
+    op.drop_table('banned_terms')
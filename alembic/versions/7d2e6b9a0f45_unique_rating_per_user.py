@@ -0,0 +1,51 @@
+"""Unique rating per user and photo
+
+Revision ID: 7d2e6b9a0f45
+Revises: 1b8f4a6e2c93
+Create Date: 2026-10-18 16:02:33.417580
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '7d2e6b9a0f45'
+down_revision: Union[str, None] = '1b8f4a6e2c93'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Keep the first rating of every user per photo, then fix the aggregates that counted the duplicates.
+    op.execute(
+        """
+        DELETE FROM ratings a
+        USING ratings b
+        WHERE a.photo_id = b.photo_id AND a.user_id = b.user_id AND a.id > b.id
+        """
+    )
+    op.execute(
+        """
+        UPDATE photos p
+        SET rating_count = r.rating_count, rating_sum = r.rating_sum
+        FROM (
+            SELECT photos.id AS photo_id, count(ratings.id) AS rating_count,
+                   coalesce(sum(ratings.rating), 0) AS rating_sum
+            FROM photos
+            LEFT JOIN ratings ON ratings.photo_id = photos.id
+            GROUP BY photos.id
+        ) r
+        WHERE p.id = r.photo_id
+          AND (p.rating_count <> r.rating_count OR p.rating_sum <> r.rating_sum)
+        """
+    )
+    op.drop_index('ix_ratings_photo_id', table_name='ratings')
+    op.create_unique_constraint('uq_ratings_photo_id_user_id', 'ratings', ['photo_id', 'user_id'])
+
+
+def downgrade() -> None:
+    op.drop_constraint('uq_ratings_photo_id_user_id', 'ratings', type_='unique')
+    op.create_index('ix_ratings_photo_id', 'ratings', ['photo_id'], unique=False)
@@ -0,0 +1,36 @@
+"""Index photo_m2m_tag
+
+Revision ID: 8a1e5d73c2b0
+Revises: 3f6b2c1d9a47
+Create Date: 2026-10-18 11:03:17.550921
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '8a1e5d73c2b0'
+down_revision: Union[str, None] = '3f6b2c1d9a47'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Drop duplicate links so the unique constraint can be created.
+    op.execute(
+        """
+        DELETE FROM photo_m2m_tag a
+        USING photo_m2m_tag b
+        WHERE a.tag = b.tag AND a.photo = b.photo AND a.id > b.id
+        """
+    )
+    op.create_unique_constraint('uq_photo_m2m_tag_tag_photo', 'photo_m2m_tag', ['tag', 'photo'])
+    op.create_index('ix_photo_m2m_tag_photo', 'photo_m2m_tag', ['photo'], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index('ix_photo_m2m_tag_photo', table_name='photo_m2m_tag')
+    op.drop_constraint('uq_photo_m2m_tag_tag_photo', 'photo_m2m_tag', type_='unique')
@@ -0,0 +1,52 @@
+"""Add rating histogram
+
+Adds one counter per star value to photos and backfills them from ratings.
+
+Revision ID: 9b3d5f2e8a14
+Revises: 4c9e1a7f3b62
+Create Date: 2026-10-18 17:20:46.118392
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '9b3d5f2e8a14'
+down_revision: Union[str, None] = '4c9e1a7f3b62'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+BATCH_SIZE = 10000
+RATING_VALUES = range(1, 6)
+
+
+def upgrade() -> None:
+    for stars in RATING_VALUES:
+        op.add_column('photos', sa.Column(f'rating_count_{stars}', sa.Integer(), server_default='0', nullable=False))
+
+    conn = op.get_bind()
+    max_photo_id = conn.execute(sa.text("SELECT COALESCE(MAX(photo_id), 0) FROM ratings")).scalar()
+    assignments = ", ".join(f"rating_count_{stars} = t.rating_count_{stars}" for stars in RATING_VALUES)
+    counters = ", ".join(f"COUNT(*) FILTER (WHERE rating = {stars}) AS rating_count_{stars}" for stars in RATING_VALUES)
+    for first_photo_id in range(1, max_photo_id + 1, BATCH_SIZE):
+        conn.execute(sa.text(
+            f"""
+            UPDATE photos p
+            SET {assignments}
+            FROM (
+                SELECT photo_id, {counters}
+                FROM ratings
+                WHERE photo_id BETWEEN :first AND :last
+                GROUP BY photo_id
+            ) t
+            WHERE p.id = t.photo_id
+            """
+        ), {"first": first_photo_id, "last": first_photo_id + BATCH_SIZE - 1})
+
+
+def downgrade() -> None:
+    for stars in RATING_VALUES:
+        op.drop_column('photos', f'rating_count_{stars}')
@@ -0,0 +1,27 @@
+"""Add people directory index
+
+Revision ID: a3d7f1e9c254
+Revises: 6f1c8d3a5e27
+Create Date: 2026-10-18 23:14:52.318406
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'a3d7f1e9c254'
+down_revision: Union[str, None] = '6f1c8d3a5e27'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index('ix_users_active_username_c', 'users', [sa.text('username COLLATE "C"')], unique=False,
+                    postgresql_where=sa.text('is_active = true'))
+
+
+def downgrade() -> None:
+    op.drop_index('ix_users_active_username_c', table_name='users')
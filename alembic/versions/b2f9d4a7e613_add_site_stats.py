@@ -0,0 +1,41 @@
+"""Add site stats snapshot and photos.created_at
+
+Revision ID: b2f9d4a7e613
+Revises: f8a4c6d2b9e3
+Create Date: 2026-10-19 00:21:44.870215
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b2f9d4a7e613'
+down_revision: Union[str, None] = 'f8a4c6d2b9e3'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column('photos', sa.Column('created_at', sa.DateTime(), nullable=True))
+    op.create_index(op.f('ix_photos_created_at'), 'photos', ['created_at'], unique=False)
+    op.create_table(
+        'site_stats',
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('users', sa.Integer(), nullable=False),
+        sa.Column('active_users', sa.Integer(), nullable=False),
+        sa.Column('photos', sa.Integer(), nullable=False),
+        sa.Column('comments', sa.Integer(), nullable=False),
+        sa.Column('ratings', sa.Integer(), nullable=False),
+        sa.Column('daily', sa.JSON(), nullable=False),
+        sa.Column('computed_at', sa.DateTime(), nullable=True),
+        sa.PrimaryKeyConstraint('id'),
+    )
+
+
+def downgrade() -> None:
+    op.drop_table('site_stats')
+    op.drop_index(op.f('ix_photos_created_at'), table_name='photos')
+    op.drop_column('photos', 'created_at')
@@ -0,0 +1,48 @@
+"""Add related tags
+
+Revision ID: c47d0e9b18f3
+Revises: 8a1e5d73c2b0
+Create Date: 2026-10-18 12:26:54.118407
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c47d0e9b18f3'
+down_revision: Union[str, None] = '8a1e5d73c2b0'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table('job_checkpoints',
+    sa.Column('name', sa.String(), nullable=False),
+    sa.Column('position', sa.BigInteger(), nullable=False),
+    sa.Column('updated_at', sa.DateTime(), nullable=True),
+    sa.PrimaryKeyConstraint('name')
+    )
+    op.create_table('tag_cooccurrence',
+    sa.Column('tag_id', sa.Integer(), nullable=False),
+    sa.Column('related_tag_id', sa.Integer(), nullable=False),
+    sa.Column('count', sa.Integer(), nullable=False),
+    sa.ForeignKeyConstraint(['tag_id'], ['tags.id'], ondelete='CASCADE'),
+    sa.ForeignKeyConstraint(['related_tag_id'], ['tags.id'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('tag_id', 'related_tag_id')
+    )
+    op.create_table('related_tags',
+    sa.Column('tag_id', sa.Integer(), nullable=False),
+    sa.Column('neighbors', sa.JSON(), nullable=False),
+    sa.Column('updated_at', sa.DateTime(), nullable=True),
+    sa.ForeignKeyConstraint(['tag_id'], ['tags.id'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('tag_id')
+    )
+
+
+def downgrade() -> None:
+    op.drop_table('related_tags')
+    op.drop_table('tag_cooccurrence')
+    op.drop_table('job_checkpoints')
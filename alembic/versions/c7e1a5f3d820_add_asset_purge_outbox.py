@@ -0,0 +1,38 @@
+"""Add asset purge outbox
+
+Revision ID: c7e1a5f3d820
+Revises: b2f9d4a7e613
+Create Date: 2026-10-19 00:47:12.336058
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c7e1a5f3d820'
+down_revision: Union[str, None] = 'b2f9d4a7e613'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        'asset_purges',
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('public_id', sa.String(), nullable=False),
+        sa.Column('attempts', sa.Integer(), nullable=False),
+        sa.Column('next_attempt_at', sa.DateTime(), nullable=False),
+        sa.Column('last_error', sa.String(), nullable=True),
+        sa.Column('created_at', sa.DateTime(), nullable=True),
+        sa.PrimaryKeyConstraint('id'),
+        sa.UniqueConstraint('public_id'),
+    )
+    op.create_index(op.f('ix_asset_purges_next_attempt_at'), 'asset_purges', ['next_attempt_at'], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index(op.f('ix_asset_purges_next_attempt_at'), table_name='asset_purges')
+    op.drop_table('asset_purges')
@@ -0,0 +1,26 @@
+"""Add photos (user_id, id) index
+
+Revision ID: d5c2e8b4f716
+Revises: a3d7f1e9c254
+Create Date: 2026-10-18 23:41:07.592631
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'd5c2e8b4f716'
+down_revision: Union[str, None] = 'a3d7f1e9c254'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index('ix_photos_user_id_id', 'photos', ['user_id', 'id'], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index('ix_photos_user_id_id', table_name='photos')
@@ -0,0 +1,113 @@
+"""Normalize tag names
+
+Adds tags.normalized_name, merges tags that only differ in case, spacing or Unicode form
+into the oldest of them and rewrites photo_m2m_tag accordingly.
+
+Revision ID: e5a9c3f07d21
+Revises: c47d0e9b18f3
+Create Date: 2026-10-18 14:41:08.730265
+
+"""
+import re
+import unicodedata
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e5a9c3f07d21'
+down_revision: Union[str, None] = 'c47d0e9b18f3'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+BATCH_SIZE = 10000
+TAG_MAX_LENGTH = 50
+WHITESPACE = re.compile(r"\s+")
+
+
+def clean(name: str) -> str:
+    # Frozen copy of app.src.services.tag_normalizer, so later changes there don't alter this migration.
+    name = unicodedata.normalize("NFKC", name)
+    return WHITESPACE.sub(" ", name).strip()[:TAG_MAX_LENGTH].strip()
+
+
+def normalize(name: str) -> str:
+    return clean(clean(name).casefold())
+
+
+def upgrade() -> None:
+    conn = op.get_bind()
+    op.add_column('tags', sa.Column('normalized_name', sa.String(), nullable=True))
+
+    canonical = {}
+    updates = []
+    merges = []
+    for tag_id, name in conn.execute(sa.text("SELECT id, name FROM tags ORDER BY id")):
+        normalized_name = normalize(name)
+        if normalized_name in canonical:
+            merges.append({"dup_id": tag_id, "canonical_id": canonical[normalized_name]})
+        else:
+            canonical[normalized_name] = tag_id
+            updates.append({"id": tag_id, "normalized_name": normalized_name})
+
+    for start in range(0, len(updates), BATCH_SIZE):
+        conn.execute(sa.text("UPDATE tags SET normalized_name = :normalized_name WHERE id = :id"),
+                     updates[start:start + BATCH_SIZE])
+
+    if merges:
+        conn.execute(sa.text("CREATE TEMPORARY TABLE tag_merge (dup_id integer PRIMARY KEY, canonical_id integer)"))
+        for start in range(0, len(merges), BATCH_SIZE):
+            conn.execute(sa.text("INSERT INTO tag_merge (dup_id, canonical_id) VALUES (:dup_id, :canonical_id)"),
+                         merges[start:start + BATCH_SIZE])
+
+        # Drop links that would collide after the merge: the photo already has the canonical tag,
+        # or an older link to another duplicate of the same canonical tag.
+        conn.execute(sa.text(
+            """
+            DELETE FROM photo_m2m_tag d
+            USING tag_merge m, photo_m2m_tag e
+            LEFT JOIN tag_merge me ON me.dup_id = e.tag
+            WHERE d.tag = m.dup_id
+              AND e.photo = d.photo
+              AND e.id <> d.id
+              AND COALESCE(me.canonical_id, e.tag) = m.canonical_id
+              AND (me.dup_id IS NULL OR e.id < d.id)
+            """
+        ))
+        while True:
+            result = conn.execute(sa.text(
+                """
+                UPDATE photo_m2m_tag p
+                SET tag = m.canonical_id
+                FROM tag_merge m
+                WHERE p.tag = m.dup_id
+                  AND p.id IN (
+                      SELECT id FROM photo_m2m_tag WHERE tag IN (SELECT dup_id FROM tag_merge) LIMIT :batch
+                  )
+                """
+            ), {"batch": BATCH_SIZE})
+            if result.rowcount == 0:
+                break
+
+        conn.execute(sa.text("DROP TABLE tag_merge"))
+        dup_ids = [merge["dup_id"] for merge in merges]
+        for start in range(0, len(dup_ids), BATCH_SIZE):
+            conn.execute(sa.text("DELETE FROM tags WHERE id = ANY(:ids)"), {"ids": dup_ids[start:start + BATCH_SIZE]})
+
+        # Pair counts of merged tags are stale; let the related tags job rebuild from scratch.
+        conn.execute(sa.text("DELETE FROM related_tags"))
+        conn.execute(sa.text("DELETE FROM tag_cooccurrence"))
+        conn.execute(sa.text("DELETE FROM job_checkpoints WHERE name = 'related_tags'"))
+
+    op.alter_column('tags', 'normalized_name', nullable=False)
+    op.drop_index('ix_tags_name_lower_prefix', table_name='tags')
+    op.create_index('ix_tags_normalized_name', 'tags', ['normalized_name'], unique=True,
+                    postgresql_ops={'normalized_name': 'text_pattern_ops'})
+
+
+def downgrade() -> None:
+    op.drop_index('ix_tags_normalized_name', table_name='tags')
+    op.create_index('ix_tags_name_lower_prefix', 'tags', [sa.text('lower(name) text_pattern_ops')], unique=False)
+    op.drop_column('tags', 'normalized_name')
@@ -0,0 +1,34 @@
+"""Add ratings indexes for the admin listings
+
+Revision ID: f8a4c6d2b9e3
+Revises: d5c2e8b4f716
+Create Date: 2026-10-18 23:58:36.104782
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'f8a4c6d2b9e3'
+down_revision: Union[str, None] = 'd5c2e8b4f716'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index('ix_ratings_created_at_id', 'ratings', ['created_at', 'id'], unique=False)
+    op.create_index('ix_ratings_rating_id', 'ratings', ['rating', 'id'], unique=False)
+    op.create_index('ix_ratings_user_id_id', 'ratings', ['user_id', 'id'], unique=False)
+    op.drop_index('ix_ratings_created_at', table_name='ratings')
+    op.drop_index('ix_ratings_rating', table_name='ratings', if_exists=True)
+
+
+def downgrade() -> None:
+    op.create_index('ix_ratings_rating', 'ratings', ['rating'], unique=False)
+    op.create_index('ix_ratings_created_at', 'ratings', ['created_at'], unique=False)
+    op.drop_index('ix_ratings_user_id_id', table_name='ratings')
+    op.drop_index('ix_ratings_rating_id', table_name='ratings')
+    op.drop_index('ix_ratings_created_at_id', table_name='ratings')
@@ -1,14 +1,25 @@
 import asyncio
 import sys
+from datetime import datetime
 import os
 import uvicorn
 from apscheduler.schedulers.asyncio import AsyncIOScheduler
 from sqlalchemy import event, select
 from sqlalchemy.exc import DisconnectionError
 from app.src.util.db import async_engine, init_db
+from app.src.config.config import settings
 
 from app.src.config.fastapi_config import app
 from app.src.util.crud.token import remove_expired_tokens, remove_blacklisted_tokens
+from app.src.util.crud.tag import refresh_tag_suggest_index
+from app.src.util.crud.tag_relation import update_related_tags
+from app.src.util.crud.rating import reconcile_rating_aggregates
+from app.src.util.crud.leaderboard import refresh_leaderboards
+from app.src.util.crud.moderation import refresh_moderation_filter
+from app.src.util.crud.site_stats import refresh_site_stats
+from app.src.util.crud.asset_purge import purge_assets
+from app.src.services.qr_generator import shutdown_qr_executor
+from app.src.services.event_broker import photo_event_broker
 
 sys.path.append(os.path.dirname(os.path.abspath(__file__)) + '/..')
 
@@ -17,6 +28,13 @@ scheduler = AsyncIOScheduler()
 
 scheduler.add_job(remove_expired_tokens, 'interval', minutes=30)
 scheduler.add_job(remove_blacklisted_tokens, 'interval', minutes=30)
+scheduler.add_job(refresh_tag_suggest_index, 'interval', minutes=60)
+scheduler.add_job(update_related_tags, 'interval', minutes=10)
+scheduler.add_job(reconcile_rating_aggregates, 'interval', hours=6)
+scheduler.add_job(refresh_leaderboards, 'interval', minutes=15)
+scheduler.add_job(refresh_moderation_filter, 'interval', minutes=settings.MODERATION_RELOAD_MINUTES)
+scheduler.add_job(refresh_site_stats, 'interval', minutes=settings.STATS_REFRESH_MINUTES, next_run_time=datetime.now())
+scheduler.add_job(purge_assets, 'interval', seconds=settings.ASSET_PURGE_INTERVAL_SECONDS, max_instances=1)
 
 scheduler.start()
 
@@ -24,6 +42,15 @@ scheduler.start()
 @app.on_event("startup")
 async def on_startup():
     await init_db()
+    await refresh_tag_suggest_index()
+    await refresh_moderation_filter()
+    await photo_event_broker.start()
+
+
+@app.on_event("shutdown")
+async def on_shutdown():
+    shutdown_qr_executor()
+    await photo_event_broker.stop()
 
 
 @event.listens_for(async_engine.sync_engine, "connect")
@@ -0,0 +1,199 @@
+import mimetypes
+import os
+import zlib
+from typing import List
+
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.responses import FileResponse, Response
+from starlette.staticfiles import NotModifiedResponse, StaticFiles
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+from app.src.config.config import settings
+from app.src.config.precompress import ENCODING_SUFFIXES, brotli
+
+AVAILABLE_ENCODINGS = ["br", "gzip"] if brotli is not None else ["gzip"]
+
+COMPRESSIBLE_TYPES = ("text/", "application/json", "application/javascript", "application/x-ndjson",
+                      "application/xml", "image/svg+xml")
+# Compressing these would buffer events behind the encoder and delay them.
+UNCOMPRESSIBLE_TYPES = ("text/event-stream",)
+
+
+def negotiate_encodings(headers: Headers, available: List[str]) -> List[str]:
+    """
+    Picks the content codings a client accepts from `Accept-Encoding`.
+
+    Args:
+        headers (Headers): The request headers.
+        available (List[str]): The codings that can be produced, in server preference order.
+
+    Returns:
+        List[str]: The acceptable codings, by descending q-value and then server preference; empty
+        if only the identity coding is acceptable.
+    """
+    accepted = {}
+    for item in headers.get("accept-encoding", "").split(","):
+        coding, _, parameters = item.partition(";")
+        quality = 1.0
+        parameters = parameters.strip()
+        if parameters.startswith("q="):
+            try:
+                quality = float(parameters[2:])
+            except ValueError:
+                quality = 0.0
+        accepted[coding.strip().lower()] = quality
+
+    wildcard = accepted.get("*", 0.0)
+    qualities = {coding: accepted.get(coding, wildcard) for coding in available}
+    return [coding for coding in sorted(available, key=lambda coding: -qualities[coding]) if qualities[coding] > 0]
+
+
+class StreamCompressor:
+    """
+    Incremental gzip or Brotli encoder. Each chunk is flushed, so a streamed response keeps streaming.
+    """
+
+    def __init__(self, encoding: str, gzip_level: int, brotli_quality: int):
+        self.encoding = encoding
+        if encoding == "br":
+            self._compressor = brotli.Compressor(quality=brotli_quality)
+        else:
+            self._compressor = zlib.compressobj(gzip_level, zlib.DEFLATED, zlib.MAX_WBITS | 16)
+
+    def compress(self, data: bytes, last: bool) -> bytes:
+        if self.encoding == "br":
+            return self._compressor.process(data) + (self._compressor.finish() if last else self._compressor.flush())
+        return self._compressor.compress(data) + self._compressor.flush(zlib.Z_FINISH if last else zlib.Z_SYNC_FLUSH)
+
+
+class CompressionMiddleware:
+    """
+    Compresses text responses with Brotli or gzip, whichever the client prefers. Brotli is only offered
+    when the `brotli` package is installed.
+
+    Responses that are already encoded, partial, event streams or smaller than `minimum_size` are sent
+    as they are. Streamed responses are compressed chunk by chunk.
+
+    Args:
+        app (ASGIApp): The wrapped application.
+        minimum_size (int): The smallest complete body, in bytes, worth compressing.
+        gzip_level (int): The gzip compression level.
+        brotli_quality (int): The Brotli quality.
+    """
+
+    def __init__(self, app: ASGIApp, minimum_size: int = settings.COMPRESSION_MIN_SIZE,
+                 gzip_level: int = settings.COMPRESSION_GZIP_LEVEL,
+                 brotli_quality: int = settings.COMPRESSION_BROTLI_QUALITY):
+        self.app = app
+        self.minimum_size = minimum_size
+        self.gzip_level = gzip_level
+        self.brotli_quality = brotli_quality
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        encodings = negotiate_encodings(Headers(scope=scope), AVAILABLE_ENCODINGS)
+        responder = CompressionResponder(self, encodings[0] if encodings else None, send)
+        await self.app(scope, receive, responder.send)
+
+
+class CompressionResponder:
+    """
+    Holds back the response start until the first body chunk shows whether the response is worth
+    compressing, then encodes the rest of the response on the way out.
+    """
+
+    def __init__(self, middleware: CompressionMiddleware, encoding, send: Send):
+        self.middleware = middleware
+        self.encoding = encoding
+        self.downstream = send
+        self.start_message = None
+        self.compressor = None
+
+    async def send(self, message: Message):
+        if message["type"] == "http.response.start":
+            self.start_message = message
+        elif message["type"] != "http.response.body":
+            await self.downstream(message)
+        elif self.start_message is not None:
+            start_message, self.start_message = self.start_message, None
+            await self.send_first_body(start_message, message)
+        elif self.compressor is not None:
+            more_body = message.get("more_body", False)
+            body = self.compressor.compress(message.get("body", b""), last=not more_body)
+            await self.downstream({"type": "http.response.body", "body": body, "more_body": more_body})
+        else:
+            await self.downstream(message)
+
+    async def send_first_body(self, start_message: Message, message: Message):
+        body = message.get("body", b"")
+        more_body = message.get("more_body", False)
+        headers = MutableHeaders(raw=start_message["headers"])
+        if not self.is_compressible(start_message["status"], headers, body, more_body):
+            await self.downstream(start_message)
+            await self.downstream(message)
+            return
+
+        if "accept-encoding" not in headers.get("vary", "").lower():
+            headers.add_vary_header("Accept-Encoding")
+        if self.encoding is None:
+            await self.downstream(start_message)
+            await self.downstream(message)
+            return
+
+        self.compressor = StreamCompressor(self.encoding, self.middleware.gzip_level, self.middleware.brotli_quality)
+        body = self.compressor.compress(body, last=not more_body)
+        headers["Content-Encoding"] = self.encoding
+        etag = headers.get("etag")
+        if etag is not None and not etag.startswith("W/"):
+            headers["ETag"] = f"W/{etag}"
+        if more_body:
+            del headers["Content-Length"]
+        else:
+            headers["Content-Length"] = str(len(body))
+        await self.downstream(start_message)
+        await self.downstream({"type": "http.response.body", "body": body, "more_body": more_body})
+
+    def is_compressible(self, status_code: int, headers: MutableHeaders, body: bytes, more_body: bool) -> bool:
+        if status_code < 200 or status_code in (204, 206, 304):
+            return False
+        if "content-encoding" in headers or "content-range" in headers:
+            return False
+        media_type = headers.get("content-type", "").split(";")[0].strip().lower()
+        if media_type in UNCOMPRESSIBLE_TYPES or not media_type.startswith(COMPRESSIBLE_TYPES):
+            return False
+        return more_body or len(body) >= self.middleware.minimum_size
+
+
+class PrecompressedStaticFiles(StaticFiles):
+    """
+    `StaticFiles` that serves the `.br` or `.gz` sibling of a file, written by `precompress_directory`,
+    when the client accepts that coding. Siblings older than their file are ignored.
+    """
+
+    def file_response(self, full_path, stat_result, scope: Scope, status_code: int = 200) -> Response:
+        siblings = {}
+        for encoding, suffix in ENCODING_SUFFIXES.items():
+            try:
+                sibling_stat = os.stat(f"{full_path}{suffix}")
+            except OSError:
+                continue
+            if sibling_stat.st_mtime >= stat_result.st_mtime:
+                siblings[encoding] = (f"{full_path}{suffix}", sibling_stat)
+        if not siblings:
+            return super().file_response(full_path, stat_result, scope, status_code)
+
+        request_headers = Headers(scope=scope)
+        encodings = negotiate_encodings(request_headers, [coding for coding in ENCODING_SUFFIXES if coding in siblings])
+        if encodings:
+            sibling_path, sibling_stat = siblings[encodings[0]]
+            response = FileResponse(sibling_path, status_code=status_code, stat_result=sibling_stat,
+                                    media_type=mimetypes.guess_type(str(full_path))[0] or "text/plain")
+            response.headers["Content-Encoding"] = encodings[0]
+        else:
+            response = FileResponse(full_path, status_code=status_code, stat_result=stat_result)
+        response.headers.add_vary_header("Accept-Encoding")
+
+        if self.is_not_modified(response.headers, request_headers):
+            return NotModifiedResponse(response.headers)
+        return response
@@ -8,6 +8,7 @@ load_dotenv()
 
 templates_path = os.path.join(os.path.dirname(__file__), '..', 'templates')
 templates = Jinja2Templates(directory=templates_path)
+static_directory = os.path.join(os.path.dirname(__file__), '..', 'static')
 
 
 class FrontEndpoints(Enum):
@@ -17,6 +18,7 @@ class FrontEndpoints(Enum):
     LOGIN_FORM = "/auth/login-form"
     LOGOUT_FORM = "/auth/logout-form"
     PEOPLE_FORM = "/discover/people"
+    TOP_PHOTOS = "/discover/top"
     PHOTO_UPLOAD_FORM = "/photo/upload-form"
     PROFILE_MY_PHOTOS = "/profile/my-photos"
     ADMIN_DASHBOARD = "/admin/dashboard"
@@ -45,8 +47,52 @@ class Settings(BaseSettings):
     ENVIRONMENT: str = os.getenv("ENVIRONMENT")
 
     MAX_TAGS: int = 5
+    TAG_MAX_LENGTH: int = 50
+    TAG_CACHE_SIZE: int = 10000
+    TAG_SUGGEST_TOP_K: int = 10
+    TAG_PAGE_SIZE: int = 24
+    RELATED_TAGS_TOP_N: int = 10
+    RELATED_TAGS_MIN_SUPPORT: int = 2
+    RELATED_TAGS_BATCH_SIZE: int = 5000
+
+    LEADERBOARD_SIZE: int = 100
+    LEADERBOARD_PRIOR_WEIGHT: float = 5.0
+    RATING_BATCH_LIMIT: int = 300
+    COMMENT_PAGE_SIZE: int = 20
+    PEOPLE_PAGE_SIZE: int = 30
+    PROFILE_PAGE_SIZE: int = 24
+    PROFILE_CACHE_SIZE: int = 10000
+    PROFILE_CACHE_TTL_SECONDS: int = 60
+    EXPORT_BATCH_SIZE: int = 1000
+    ADMIN_PAGE_SIZE: int = 50
+
+    EVENTS_CHANNEL: str = "photo_events"
+    EVENTS_MAX_CONNECTIONS: int = 1000
+    EVENTS_MAX_CONNECTIONS_PER_PHOTO: int = 200
+    EVENTS_QUEUE_SIZE: int = 100
+    EVENTS_KEEPALIVE_SECONDS: int = 15
+
+    MODERATION_RELOAD_MINUTES: int = 5
+    STATS_REFRESH_MINUTES: int = 10
+    STATS_DAYS: int = 30
+    STATS_ACTIVE_DAYS: int = 30
+    ASSET_PURGE_INTERVAL_SECONDS: int = 30
+    ASSET_PURGE_BATCH_SIZE: int = 100
+    ASSET_PURGE_MAX_ATTEMPTS: int = 8
+
+    COMPRESSION_MIN_SIZE: int = 1024
+    COMPRESSION_GZIP_LEVEL: int = 6
+    COMPRESSION_BROTLI_QUALITY: int = 4
+
+    BULK_DELETE_MAX_IDS: int = 10000
+    BULK_DELETE_CHUNK_SIZE: int = 1000
+
     USERNAME_LENGTH: int = 8
 
+    QR_BATCH_LIMIT: int = 100
+    QR_PROCESS_WORKERS: int = 2
+    QR_SHEET_COLUMNS: int = 4
+
     SECRET_KEY: str = os.getenv("SECRET_KEY", "your_secret_key")
     ALGORITHM: str = "HS256"
     ACCESS_TOKEN_EXPIRE_MINUTES: int = 30
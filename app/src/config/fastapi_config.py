@@ -1,14 +1,14 @@
-import os
-
 from fastapi import FastAPI, HTTPException, Request, Depends
 from fastapi.exceptions import RequestValidationError
 from starlette.responses import FileResponse, RedirectResponse
-from starlette.staticfiles import StaticFiles
-from app.src.config.config import settings
+from app.src.config.compression import CompressionMiddleware
+from app.src.config.config import settings, static_directory, templates
 from app.src.config.exceptions import custom_http_exception_handler, global_exception_handler, \
     validation_exception_handler, \
     custom_404_handler
-from app.src.routes import root, auth, user, photo, comment, rating, templating, admin_templating
+from app.src.routes import root, auth, user, photo, comment, rating, tag, event, moderation, bulk, export, \
+    templating, admin_templating
+from app.src.config.static_assets import FingerprintedStaticFiles, StaticManifest
 from starlette.middleware.cors import CORSMiddleware
 from starlette.exceptions import HTTPException as StarletteHTTPException
 
@@ -32,6 +32,14 @@ app.add_middleware(
     allow_methods=["*"],  # Allow all methods
     allow_headers=["*"],  # Allow all headers
 )
+app.add_middleware(CompressionMiddleware)
+
+
+# Registered before the routers, so that `/{user_id}` does not shadow it.
+@app.get("/favicon.ico")
+async def favicon():
+    return FileResponse(f"{static_directory}/favicon.png", headers={"Cache-Control": "public, max-age=86400"})
+
 
 # Include API routers
 app.include_router(root.router, prefix="", tags=["root"])
@@ -40,6 +48,11 @@ app.include_router(user.router, prefix="", tags=["users"])
 app.include_router(photo.router, prefix="", tags=["photos"])
 app.include_router(comment.router, prefix="", tags=["comments"])
 app.include_router(rating.router, prefix="", tags=["ratings"])
+app.include_router(tag.router, prefix="", tags=["tags"])
+app.include_router(event.router, prefix="", tags=["events"])
+app.include_router(moderation.router, prefix="", tags=["moderation"])
+app.include_router(bulk.router, prefix="", tags=["bulk"])
+app.include_router(export.router, prefix="", tags=["export"])
 app.include_router(templating.router, prefix="", tags=["front-end"])
 app.include_router(admin_templating.router, prefix="", tags=["admin front"])
 
@@ -50,10 +63,6 @@ app.add_exception_handler(StarletteHTTPException, custom_404_handler)
 app.add_exception_handler(HTTPException, custom_http_exception_handler)
 
 
-static_directory = os.path.join(os.path.dirname(__file__), '..', 'static')
-app.mount("/static", StaticFiles(directory=static_directory), name="static")
-
-
-@app.get("/favicon.ico")
-async def favicon():
-    return FileResponse(f"{static_directory}/favicon.png")
+static_manifest = StaticManifest(static_directory)
+templates.env.globals["static_url"] = static_manifest.url
+app.mount("/static", FingerprintedStaticFiles(directory=static_directory, manifest=static_manifest), name="static")
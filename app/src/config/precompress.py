@@ -0,0 +1,55 @@
+import gzip
+import os
+import sys
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+ENCODING_SUFFIXES = {"br": ".br", "gzip": ".gz"}
+PRECOMPRESSED_EXTENSIONS = {".css", ".js", ".map", ".svg", ".html", ".json", ".txt"}
+PRECOMPRESS_MIN_SIZE = 1024
+STATIC_DIRECTORY = os.path.join(os.path.dirname(__file__), '..', 'static')
+
+
+def precompress_directory(directory: str, minimum_size: int = PRECOMPRESS_MIN_SIZE) -> int:
+    """
+    Writes maximum-effort `.gz` and, when `brotli` is installed, `.br` siblings of the text files
+    under a directory. Run at build time, so requests for them cost no CPU:
+    `python -m app.src.config.precompress [directory]`. Does not load the settings, so the runtime
+    environment is not needed.
+
+    Args:
+        directory (str): The static files directory.
+        minimum_size (int): Files smaller than this are left uncompressed.
+
+    Returns:
+        int: The number of compressed files written.
+    """
+    written = 0
+    for root, _, names in os.walk(directory):
+        for name in names:
+            path = os.path.join(root, name)
+            if os.path.splitext(name)[1] not in PRECOMPRESSED_EXTENSIONS or os.path.getsize(path) < minimum_size:
+                continue
+            with open(path, "rb") as source:
+                data = source.read()
+
+            variants = {"gzip": gzip.compress(data, compresslevel=9, mtime=0)}
+            if brotli is not None:
+                variants["br"] = brotli.compress(data, quality=11)
+            for encoding, compressed in variants.items():
+                target = path + ENCODING_SUFFIXES[encoding]
+                if len(compressed) < len(data):
+                    with open(target, "wb") as output:
+                        output.write(compressed)
+                    written += 1
+                elif os.path.exists(target):
+                    os.remove(target)
+    return written
+
+
+if __name__ == "__main__":
+    directory = sys.argv[1] if len(sys.argv) > 1 else STATIC_DIRECTORY
+    print(f"Precompressed {precompress_directory(directory)} static files in {directory}")
@@ -73,6 +73,7 @@ async def get_current_user(request: Request, db: AsyncSession = Depends(get_db))
                 - If the token does not contain a valid email (subject).
                 - If the user associated with the token cannot be found in the database.
                 - In each case, a 401 Unauthorized error is raised with an appropriate message.
+                - If the user was banned, a 423 Locked error is raised, even while their tokens are unexpired.
 
     """
 
@@ -149,6 +150,8 @@ async def get_current_user(request: Request, db: AsyncSession = Depends(get_db))
                     detail="Could not validate credentials",
                     headers={"WWW-Authenticate": "Bearer"},
                 )
+            if not user.is_active:
+                raise HTTPException(status_code=status.HTTP_423_LOCKED, detail="Your account was disabled by admin.")
             new_access_token = await create_access_token(data={"sub": email}, user_id=user.id, db=db)
             response = JSONResponse(
                 content={"detail": "New access token issued"}
@@ -206,10 +209,31 @@ async def get_current_user(request: Request, db: AsyncSession = Depends(get_db))
             detail="Could not validate credentials",
             headers={"WWW-Authenticate": "Bearer"},
         )
+    if not user.is_active:
+        raise HTTPException(status_code=status.HTTP_423_LOCKED, detail="Your account was disabled by admin.")
 
     return user
 
 
+async def get_optional_current_user(request: Request, db: AsyncSession = Depends(get_db)):
+    """
+        Retrieves the authenticated user like `get_current_user`, for endpoints that also serve anonymous clients.
+
+        Args:
+            request (Request): The FastAPI request object, used to access the token cookies.
+            db (AsyncSession): The database session dependency.
+
+        Returns:
+            User: The authenticated user, or None if the request carries no tokens.
+
+        Raises:
+            HTTPException: If tokens are present but invalid, as in `get_current_user`.
+    """
+    if not request.cookies.get("access_token") and not request.cookies.get("refresh_token"):
+        return None
+    return await get_current_user(request, db)
+
+
 async def get_current_user_cookies(request: Request) -> str:
     """
         Retrieves the username of the currently logged-in user from the request cookies.
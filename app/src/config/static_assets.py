@@ -0,0 +1,79 @@
+import hashlib
+import os
+from typing import Optional
+
+from starlette.responses import Response
+from starlette.types import Scope
+from app.src.config.compression import PrecompressedStaticFiles
+from app.src.config.precompress import ENCODING_SUFFIXES
+
+IMMUTABLE_CACHE_CONTROL = "public, max-age=31536000, immutable"
+
+
+class StaticManifest:
+    """
+    Maps every file under the static directory to a fingerprinted name carrying a hash of its content,
+    e.g. `css/custom.css` to `css/custom.3f9a1c07b2.css`. A changed file gets a new URL, so fingerprinted
+    URLs can be cached forever.
+
+    Built once at startup; the `.br` and `.gz` siblings are served under their source file's name.
+
+    Args:
+        directory (str): The static files directory.
+        prefix (str): The URL path the directory is mounted at.
+    """
+
+    def __init__(self, directory: str, prefix: str = "/static"):
+        self.prefix = prefix
+        self._fingerprinted = {}
+        self._sources = {}
+        for root, _, names in os.walk(directory):
+            for name in names:
+                if os.path.splitext(name)[1] in ENCODING_SUFFIXES.values():
+                    continue
+                full_path = os.path.join(root, name)
+                path = os.path.relpath(full_path, directory).replace(os.sep, "/")
+                with open(full_path, "rb") as source:
+                    digest = hashlib.sha256(source.read()).hexdigest()[:10]
+                base, extension = os.path.splitext(path)
+                fingerprinted = f"{base}.{digest}{extension}"
+                self._fingerprinted[path] = fingerprinted
+                self._sources[fingerprinted] = path
+
+    def url(self, path: str) -> str:
+        """
+        Builds the URL of a static file; exposed to templates as `static_url`.
+
+        Args:
+            path (str): The path of the file relative to the static directory.
+
+        Returns:
+            str: The fingerprinted URL, or the plain one if the file was not there at startup.
+        """
+        path = path.lstrip("/")
+        return f"{self.prefix}/{self._fingerprinted.get(path, path)}"
+
+    def source(self, fingerprinted: str) -> Optional[str]:
+        """
+        Resolves a fingerprinted path to the path of its file, None if it is not fingerprinted.
+        """
+        return self._sources.get(fingerprinted)
+
+
+class FingerprintedStaticFiles(PrecompressedStaticFiles):
+    """
+    `PrecompressedStaticFiles` that also serves the fingerprinted names of a `StaticManifest`, with an
+    immutable `Cache-Control`. Plain names are served as before and revalidated by the browser.
+    """
+
+    def __init__(self, *args, manifest: StaticManifest, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.manifest = manifest
+
+    async def get_response(self, path: str, scope: Scope) -> Response:
+        source = self.manifest.source(path.replace(os.sep, "/"))
+        if source is None:
+            return await super().get_response(path, scope)
+        response = await super().get_response(source, scope)
+        response.headers["Cache-Control"] = IMMUTABLE_CACHE_CONTROL
+        return response
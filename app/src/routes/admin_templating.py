@@ -1,35 +1,60 @@
+from datetime import datetime
 from fastapi import APIRouter, Request, Depends,  HTTPException, Query
-from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import selectinload
 from fastapi.responses import HTMLResponse
 from app.src.config.config import templates, FrontEndpoints
 from app.src.config.security import get_current_user
+from app.src.util.crud.admin_listing import active_users_listing, photos_listing, ratings_listing, \
+    moderation_queue_listing
+from app.src.util.crud.moderation import get_banned_terms
+from app.src.util.crud.site_stats import get_site_stats
 from app.src.util.db import get_db
-from app.src.util.models import User, Photo
-from app.src.util.models.comment import Comment
-from app.src.util.models.rating import Rating
+from app.src.util.models import User
 
 
 router = APIRouter()
 
+ORDER_PATTERN = "^(asc|desc)$"
+
+
+def listing_context(request: Request, listing: dict) -> dict:
+    """
+    Builds the template variables shared by the paginated admin lists.
+
+    Args:
+        request (Request): The HTTP request object, whose filters are kept in the next page link.
+        listing (dict): A page returned by `AdminListing.page`.
+
+    Returns:
+        dict: The listing, the current filter values and the URLs of the first and next pages.
+    """
+    first_url = str(request.url.remove_query_params("cursor")) if "cursor" in request.query_params else None
+    next_url = None
+    if listing["next_cursor"]:
+        next_url = str(request.url.include_query_params(cursor=listing["next_cursor"]))
+    return {"listing": listing, "params": request.query_params, "first_url": first_url, "next_url": next_url}
+
 
 @router.get(FrontEndpoints.ADMIN_DASHBOARD.value, response_class=HTMLResponse)
-async def get_admin_panel(request: Request, current_user: User = Depends(get_current_user)):
+async def get_admin_panel(request: Request, db: AsyncSession = Depends(get_db),
+                          current_user: User = Depends(get_current_user)):
     """
-    Renders the Admin Panel dashboard page.
+    Renders the Admin Panel dashboard page with the precomputed site statistics.
 
     Args:
         request (Request): The HTTP request object.
+        db (AsyncSession): The database session.
         current_user (User): The current user.
 
     Returns:
-        TemplateResponse: The rendered admin_panel.html template.
+        TemplateResponse: The rendered admin_dashboard.html template.
     """
 
     if not request.cookies.get('admin_access'):
         raise HTTPException(status_code=403, detail="Access forbidden")
-    return templates.TemplateResponse("admin_base.html", {"request": request, "role": current_user.role.value})
+    stats = await get_site_stats(db)
+    return templates.TemplateResponse("admin_dashboard.html", {"request": request, "role": current_user.role.value,
+                                                               "stats": stats})
 
 
 @router.get(FrontEndpoints.ADMIN_BAN_USER.value, response_class=HTMLResponse)
@@ -38,33 +63,39 @@ async def get_ban_user_page(
         db: AsyncSession = Depends(get_db),
         message: str = Query(None),
         error: str = Query(None),
+        user: str = Query(None, max_length=100),
+        sort: str = Query(None),
+        order: str = Query("asc", pattern=ORDER_PATTERN),
+        cursor: str = Query(None),
         current_user: User = Depends(get_current_user)
 ):
     """
-    Renders the Ban User page with a list of users and optional messages.
+    Renders the Ban User page with one page of active users and optional messages.
 
     Args:
         request (Request): The HTTP request object.
         db (AsyncSession): The database session.
         message (str): Optional success message to display.
         error (str): Optional error message to display.
+        user (str): Only users whose username starts with this text.
+        sort (str): "username" or "id".
+        order (str): "asc" or "desc".
+        cursor (str): The cursor of the page to show; the first page when omitted.
         current_user: The current user.
 
     Returns:
         TemplateResponse: The rendered ban_user.html template.
     """
-
-    result = await db.execute(
-        select(User).filter(User.is_active == True, User.username != current_user.username)
-    )
-    users = result.scalars().all()
+    listing = await active_users_listing.page(db, sort=sort, order=order, cursor=cursor, user=user,
+                                              exclude_id=current_user.id)
 
     context = {
         "request": request,
-        "users": users,
+        "users": listing["items"],
         "message": message,
         "error": error,
         "role": current_user.role.value,
+        **listing_context(request, listing),
     }
 
     return templates.TemplateResponse("ban_user.html", context)
@@ -74,11 +105,14 @@ async def get_ban_user_page(
 async def get_photos_for_deletion(
         request: Request,
         db: AsyncSession = Depends(get_db), message: str = Query(None), error: str = Query(None),
+        user: str = Query(None, max_length=100),
+        order: str = Query("desc", pattern=ORDER_PATTERN),
+        cursor: str = Query(None),
         current_user: User = Depends(get_current_user)
 
 ):
     """
-    Renders the Delete Photo page with all available photos and optional messages.
+    Renders the Delete Photo page with one page of photos and optional messages.
 
     Args:
         request (Request): The HTTP request object.
@@ -86,19 +120,22 @@ async def get_photos_for_deletion(
         current_user (User): The current authenticated user.
         message (str): Optional success message to display.
         error (str): Optional error message to display.
+        user (str): Only photos of the user with this username.
+        order (str): "desc" for newest first, "asc" for oldest first.
+        cursor (str): The cursor of the page to show; the first page when omitted.
 
     Returns:
         TemplateResponse: The rendered delete_photo.html template.
     """
-    result = await db.execute(select(Photo))
-    photos = result.scalars().all()
+    listing = await photos_listing.page(db, order=order, cursor=cursor, user=user)
 
     context = {
         "request": request,
-        "photos": photos,
+        "photos": listing["items"],
         "message": message,
         "error": error,
         "role": current_user.role.value,
+        **listing_context(request, listing),
     }
 
     return templates.TemplateResponse("delete_photo.html", context)
@@ -106,37 +143,43 @@ async def get_photos_for_deletion(
 
 @router.get(FrontEndpoints.ADMIN_RATINGS.value, response_class=HTMLResponse)
 async def view_all_ratings(request: Request, db: AsyncSession = Depends(get_db),
+                           user: str = Query(None, max_length=100),
+                           created_from: datetime = Query(None), created_to: datetime = Query(None),
+                           rating: int = Query(None, ge=1, le=5),
+                           sort: str = Query(None), order: str = Query("desc", pattern=ORDER_PATTERN),
+                           cursor: str = Query(None),
                            current_user: User = Depends(get_current_user)):
     """
-    Display a list of all ratings with associated photos and users.
+    Display one page of ratings with associated photos and users, filtered by user, date range
+    and rating value, sorted by date, rating value or ID.
     """
-
-    result = await db.execute(
-        select(Rating)
-        .options(selectinload(Rating.photo), selectinload(Rating.owner))
-    )
-    ratings = result.scalars().all()
+    listing = await ratings_listing.page(db, sort=sort, order=order, cursor=cursor, user=user,
+                                         created_from=created_from, created_to=created_to, rating=rating)
     return templates.TemplateResponse("admin_ratings.html", {
         "request": request,
-        "ratings": ratings,
+        "ratings": listing["items"],
         "role": current_user.role.value,
+        **listing_context(request, listing),
     })
 
 
 @router.get(FrontEndpoints.ADMIN_COMMENTS.value, response_class=HTMLResponse)
 async def view_all_comments(request: Request, db: AsyncSession = Depends(get_db),
+                            user: str = Query(None, max_length=100),
+                            created_from: datetime = Query(None), created_to: datetime = Query(None),
+                            order: str = Query("asc", pattern=ORDER_PATTERN),
+                            cursor: str = Query(None),
                             current_user: User = Depends(get_current_user)):
     """
-    Display a list of all comments with associated photos and users.
+    Display one page of the comments flagged or held by the moderation filter, with their photos
+    and users, filtered by user and comment date, and the banned terms.
     """
-
-    result = await db.execute(
-        select(Comment)
-        .options(selectinload(Comment.photo), selectinload(Comment.user))
-    )
-    comments = result.scalars().all()
+    listing = await moderation_queue_listing.page(db, order=order, cursor=cursor, user=user,
+                                                  created_from=created_from, created_to=created_to)
     return templates.TemplateResponse("admin_comments.html", {
         "request": request,
-        "comments": comments,
+        "queue": listing["items"],
+        "banned_terms": await get_banned_terms(db),
         "role": current_user.role.value,
+        **listing_context(request, listing),
     })
@@ -31,9 +31,9 @@ async def signup(request: Request, db: AsyncSession = Depends(get_db),
     """
     Handle user signup.
 
-    This endpoint registers a new user in the database. It first checks if the provided
-    email is already registered. If so, it raises an HTTP 409 Conflict error. If the email
-    is not registered, it creates a new user and redirects to the signup form.
+    This endpoint registers a new user in the database and redirects to the signup form.
+    If the provided email is already registered, the insert fails on the unique email
+    constraint and an HTTP 409 Conflict error is raised.
 
     Args:
         request (Request): The request object.
@@ -47,9 +47,6 @@ async def signup(request: Request, db: AsyncSession = Depends(get_db),
     Raises:
         HTTPException: If the email is already registered (HTTP 409).
     """
-    db_user = await get_user_by_email(db, email=email)
-    if db_user:
-        raise HTTPException(status_code=409, detail="Email already registered")
     await user_crud.create_user(db, {"email": email, "password": password})
     message = "Profile created"
     encoded_message = urllib.parse.quote(message)
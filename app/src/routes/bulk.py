@@ -0,0 +1,60 @@
+from typing import Dict
+from fastapi import APIRouter, Depends
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.src.config.dependency import role_required
+from app.src.util.crud.bulk import bulk_delete_comments, bulk_delete_ratings, bulk_delete_photos
+from app.src.util.db import get_db
+from app.src.util.models.user import UserRole
+from app.src.util.schemas.bulk import BulkDeleteRequest
+
+router = APIRouter()
+
+
+@router.post("/admin/comments/bulk-delete", response_model=Dict[str, int],
+             dependencies=[Depends(role_required([UserRole.ADMIN, UserRole.MODERATOR]))])
+async def bulk_delete_comments_route(body: BulkDeleteRequest, db: AsyncSession = Depends(get_db)):
+    """
+    Delete many comments at once, by ID list, user or creation date.
+
+    Args:
+        body (BulkDeleteRequest): The IDs and filters selecting the comments.
+        db (AsyncSession): The database session dependency.
+
+    Returns:
+        Dict[str, int]: The number of deleted comments.
+    """
+    return await bulk_delete_comments(db, **body.dict())
+
+
+@router.post("/admin/ratings/bulk-delete", response_model=Dict[str, int],
+             dependencies=[Depends(role_required([UserRole.ADMIN, UserRole.MODERATOR]))])
+async def bulk_delete_ratings_route(body: BulkDeleteRequest, db: AsyncSession = Depends(get_db)):
+    """
+    Delete many ratings at once, by ID list, user or creation date. Photo rating averages and
+    histograms are updated in the same transaction.
+
+    Args:
+        body (BulkDeleteRequest): The IDs and filters selecting the ratings.
+        db (AsyncSession): The database session dependency.
+
+    Returns:
+        Dict[str, int]: The number of deleted ratings.
+    """
+    return await bulk_delete_ratings(db, **body.dict())
+
+
+@router.post("/admin/photos/bulk-delete", response_model=Dict[str, int],
+             dependencies=[Depends(role_required([UserRole.ADMIN]))])
+async def bulk_delete_photos_route(body: BulkDeleteRequest, db: AsyncSession = Depends(get_db)):
+    """
+    Delete many photos at once, by ID list, user or upload date, together with their comments and
+    ratings. Date filters never match photos uploaded before upload times were recorded.
+
+    Args:
+        body (BulkDeleteRequest): The IDs and filters selecting the photos.
+        db (AsyncSession): The database session dependency.
+
+    Returns:
+        Dict[str, int]: The number of deleted photos, comments and ratings.
+    """
+    return await bulk_delete_photos(db, **body.dict())
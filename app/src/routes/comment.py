@@ -1,14 +1,15 @@
-from fastapi import APIRouter, Depends, HTTPException, status, Form
+from fastapi import APIRouter, Depends, HTTPException, status, Form, Query
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
-from typing import List
+from typing import Optional
+from app.src.config.config import settings
 from app.src.config.logging_config import log_function
 from app.src.util.crud.photo import get_photo
 from app.src.util.db import get_db
 from app.src.config.security import get_current_user
 from app.src.util.models.comment import Comment
 from app.src.util.models.user import UserRole
-from app.src.util.schemas.comment import Comment as CommentSchema, CommentUpdate
+from app.src.util.schemas.comment import Comment as CommentSchema, CommentUpdate, CommentsPage
 from app.src.util.crud.comment import delete_comment, create_comment, update_comment, get_comments, \
     get_user_comment, get_comment_by_id
 from app.src.util.schemas.user import User
@@ -42,21 +43,31 @@ async def create_photo_comment(photo_id: int, content: str = Form(...), db: Asyn
     return RedirectResponse(url=next, status_code=status.HTTP_302_FOUND)
 
 
-@router.get("/photos/{photo_id}/comments/", response_model=List[CommentSchema], dependencies=[Depends(verify_api_key)])
+@router.get("/photos/{photo_id}/comments/", response_model=CommentsPage, dependencies=[Depends(verify_api_key)])
 @log_function
-async def read_photo_comments(photo_id: int, db: AsyncSession = Depends(get_db)):
+async def read_photo_comments(photo_id: int, cursor: Optional[str] = None,
+                              limit: int = Query(settings.COMMENT_PAGE_SIZE, ge=1, le=100),
+                              db: AsyncSession = Depends(get_db)):
     """
-    Retrieve all comments for a specific photo.
+    Retrieve the comments for a specific photo, oldest first, one page at a time.
 
     Args:
         photo_id (int): The ID of the photo to get comments for.
+        cursor (Optional[str]): The `next_cursor` of the previous page.
+        limit (int): The page size.
         db (Session): The database session dependency.
 
     Returns:
-        List[Comment]: A list of comments for the specified photo.
+        CommentsPage: The comments of the page and the cursor for the next page.
+
+    Raises:
+        HTTPException: If the photo is not found or the cursor is malformed.
     """
     photo = await get_photo(db, photo_id)
-    return await get_comments(db=db, photo_id=photo_id)
+    if not photo:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Photo not found")
+    comments, next_cursor = await get_comments(db=db, photo_id=photo_id, cursor=cursor, limit=limit)
+    return CommentsPage(comments=comments, next_cursor=next_cursor)
 
 
 @router.put("/comments/{comment_id}/", response_model=CommentSchema)
@@ -0,0 +1,72 @@
+import asyncio
+import json
+from fastapi import APIRouter, Depends, HTTPException, Request, status
+from fastapi.responses import StreamingResponse
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.src.config.config import settings
+from app.src.services.event_broker import photo_event_broker, SubscriberLimitReached
+from app.src.util.crud.photo import get_photo
+from app.src.util.db import get_db
+
+router = APIRouter()
+
+
+async def stream_photo_events(request: Request, photo_id: int, queue: asyncio.Queue):
+    """
+    Yields the events of a subscriber's queue as Server-Sent Events until the client disconnects.
+
+    A comment line is sent every `EVENTS_KEEPALIVE_SECONDS` without events, so proxies keep the
+    connection open and disconnected clients are noticed.
+
+    Args:
+        request (Request): The streaming request.
+        photo_id (int): The ID of the photo.
+        queue (asyncio.Queue): The subscriber's queue from `photo_event_broker.subscribe`.
+
+    Yields:
+        str: SSE frames.
+    """
+    try:
+        yield f"retry: {settings.EVENTS_KEEPALIVE_SECONDS * 1000}\n\n"
+        while not await request.is_disconnected():
+            try:
+                photo_event = await asyncio.wait_for(queue.get(), timeout=settings.EVENTS_KEEPALIVE_SECONDS)
+            except asyncio.TimeoutError:
+                yield ": keepalive\n\n"
+                continue
+            if photo_event is None:
+                break
+            yield f"event: {photo_event['type']}\ndata: {json.dumps(photo_event)}\n\n"
+    finally:
+        photo_event_broker.unsubscribe(photo_id, queue)
+
+
+@router.get("/photo/{photo_id}/events")
+async def photo_events(photo_id: int, request: Request, db: AsyncSession = Depends(get_db)):
+    """
+    Stream new, edited and deleted comments and rating changes of a photo as Server-Sent Events.
+
+    Args:
+        photo_id (int): The unique identifier of the photo.
+        request (Request): The HTTP request object.
+        db (AsyncSession): The SQLAlchemy asynchronous session.
+
+    Returns:
+        StreamingResponse: A `text/event-stream` response that stays open while the page is viewed.
+
+    Raises:
+        HTTPException: If the photo is not found, or 503 if the live connection limits are reached.
+    """
+    await get_photo(db, photo_id)
+    # Give the pooled connection back; the stream stays open for as long as the page.
+    await db.close()
+    try:
+        queue = photo_event_broker.subscribe(photo_id)
+    except SubscriberLimitReached as e:
+        raise HTTPException(status_code=status.HTTP_503_SERVICE_UNAVAILABLE, detail=str(e))
+
+    return StreamingResponse(
+        stream_photo_events(request, photo_id, queue),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
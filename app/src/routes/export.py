@@ -0,0 +1,71 @@
+from datetime import datetime
+from fastapi import APIRouter, Depends, Query
+from fastapi.responses import StreamingResponse
+from app.src.config.dependency import role_required
+from app.src.util.crud.export import export_rows, EXPORT_FORMATS
+from app.src.util.models.user import UserRole
+
+router = APIRouter()
+
+FORMAT_PATTERN = "^(csv|ndjson)$"
+
+
+def export_response(kind: str, export_format: str) -> StreamingResponse:
+    """
+    Wraps an export in a streaming download.
+
+    Args:
+        kind (str): "ratings", "comments" or "photos".
+        export_format (str): "csv" or "ndjson".
+
+    Returns:
+        StreamingResponse: The export as an attachment.
+    """
+    filename = f"{kind}-{datetime.utcnow():%Y%m%d-%H%M%S}.{export_format}"
+    return StreamingResponse(
+        export_rows(kind, export_format),
+        media_type=EXPORT_FORMATS[export_format],
+        headers={"Content-Disposition": f'attachment; filename="{filename}"'},
+    )
+
+
+@router.get("/admin/ratings/export", dependencies=[Depends(role_required([UserRole.ADMIN, UserRole.MODERATOR]))])
+async def export_ratings(format: str = Query("csv", pattern=FORMAT_PATTERN)):
+    """
+    Download all ratings with their photo and user.
+
+    Args:
+        format (str): "csv" or "ndjson".
+
+    Returns:
+        StreamingResponse: The ratings, streamed as they are read.
+    """
+    return export_response("ratings", format)
+
+
+@router.get("/admin/comments/export", dependencies=[Depends(role_required([UserRole.ADMIN, UserRole.MODERATOR]))])
+async def export_comments(format: str = Query("csv", pattern=FORMAT_PATTERN)):
+    """
+    Download all comments with their photo and user.
+
+    Args:
+        format (str): "csv" or "ndjson".
+
+    Returns:
+        StreamingResponse: The comments, streamed as they are read.
+    """
+    return export_response("comments", format)
+
+
+@router.get("/admin/photos/export", dependencies=[Depends(role_required([UserRole.ADMIN]))])
+async def export_photos(format: str = Query("csv", pattern=FORMAT_PATTERN)):
+    """
+    Download all photos with their owner and rating totals.
+
+    Args:
+        format (str): "csv" or "ndjson".
+
+    Returns:
+        StreamingResponse: The photos, streamed as they are read.
+    """
+    return export_response("photos", format)
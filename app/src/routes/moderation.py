@@ -0,0 +1,79 @@
+from typing import List, Literal
+from fastapi import APIRouter, Depends, Form, status
+from fastapi.responses import RedirectResponse
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.src.config.config import FrontEndpoints
+from app.src.config.dependency import role_required
+from app.src.util.crud.moderation import approve_comment, get_banned_terms, add_banned_term, delete_banned_term
+from app.src.util.db import get_db
+from app.src.util.models.user import UserRole
+from app.src.util.schemas.moderation import BannedTermResponse
+
+router = APIRouter()
+
+
+@router.post("/comments/{comment_id}/approve",
+             dependencies=[Depends(role_required([UserRole.ADMIN, UserRole.MODERATOR]))])
+async def approve_flagged_comment(comment_id: int, db: AsyncSession = Depends(get_db)):
+    """
+    Approve a comment from the moderation queue, publishing it if it was held.
+
+    Args:
+        comment_id (int): The ID of the comment.
+        db (AsyncSession): The database session dependency.
+
+    Returns:
+        RedirectResponse: Redirects back to the moderation queue.
+    """
+    await approve_comment(db, comment_id)
+    return RedirectResponse(url=FrontEndpoints.ADMIN_COMMENTS.value, status_code=status.HTTP_303_SEE_OTHER)
+
+
+@router.get("/moderation/terms", response_model=List[BannedTermResponse],
+            dependencies=[Depends(role_required([UserRole.ADMIN]))])
+async def list_banned_terms(db: AsyncSession = Depends(get_db)):
+    """
+    Retrieve the banned terms comments are checked for.
+
+    Args:
+        db (AsyncSession): The database session dependency.
+
+    Returns:
+        List[BannedTermResponse]: The banned terms, alphabetically.
+    """
+    return await get_banned_terms(db)
+
+
+@router.post("/moderation/terms", dependencies=[Depends(role_required([UserRole.ADMIN]))])
+async def create_banned_term(term: str = Form(...), action: Literal["flag", "hold"] = Form("flag"),
+                             db: AsyncSession = Depends(get_db)):
+    """
+    Add a banned term, or change its action. The filter is reloaded immediately in this process
+    and by the periodic refresh job in the others.
+
+    Args:
+        term (str): The word or phrase.
+        action (str): "flag" to queue matching comments, "hold" to also hide them until approved.
+        db (AsyncSession): The database session dependency.
+
+    Returns:
+        RedirectResponse: Redirects back to the moderation queue.
+    """
+    await add_banned_term(db, term, action)
+    return RedirectResponse(url=FrontEndpoints.ADMIN_COMMENTS.value, status_code=status.HTTP_303_SEE_OTHER)
+
+
+@router.delete("/moderation/terms/{term_id}", dependencies=[Depends(role_required([UserRole.ADMIN]))])
+async def remove_banned_term(term_id: int, db: AsyncSession = Depends(get_db)):
+    """
+    Delete a banned term.
+
+    Args:
+        term_id (int): The ID of the term.
+        db (AsyncSession): The database session dependency.
+
+    Returns:
+        dict: A confirmation message.
+    """
+    await delete_banned_term(db, term_id)
+    return {"detail": "Term deleted"}
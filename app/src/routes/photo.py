@@ -21,12 +21,14 @@ from app.src.util.models import User
 from app.src.util.db import get_db
 from fastapi.responses import JSONResponse
 from fastapi import APIRouter, Request, Depends, HTTPException
-from app.src.util.crud.photo import get_photo, PhotoService, update_photo_url
-from app.src.util.schemas.photo import PhotoResponse
+from app.src.util.crud.photo import get_photo, PhotoService, update_photo_url, get_photo_urls
+from app.src.util.schemas.photo import PhotoResponse, QRCodeBatchRequest
 from app.src.util.schemas.tag import TagResponse
 from fastapi.responses import RedirectResponse
 
 from app.src.services.aggregator import Aggregator
+from app.src.services.qr_generator import render_qr_codes, build_qr_zip, build_qr_svg_sheet, QR_MEDIA_TYPES
+from app.src.config.config import settings
 
 router = APIRouter()
 
@@ -143,6 +145,49 @@ async def delete_photo_route(
     return RedirectResponse("/", status_code=status.HTTP_303_SEE_OTHER)
 
 
+@router.post("/photos/generate_qrcode/batch", dependencies=[Depends(verify_api_key)])
+@log_function
+async def generate_qr_code_batch(body: QRCodeBatchRequest, db: AsyncSession = Depends(get_db)):
+    """
+        Generate QR codes for several photos in one request.
+
+        The codes are rendered in parallel on a process pool and returned either as a ZIP archive
+        with one image per photo or as a single printable SVG sheet.
+
+        Args:
+            body (QRCodeBatchRequest): The photo IDs, image format and bundle type.
+            db (AsyncSession): The SQLAlchemy asynchronous session.
+
+        Returns:
+            StreamingResponse: The ZIP archive or the SVG sheet.
+
+        Raises:
+            HTTPException: If too many photos are requested, a PNG sheet is requested,
+            or any of the photos does not exist.
+        """
+    photo_ids = list(dict.fromkeys(body.photo_ids))
+    if len(photo_ids) > settings.QR_BATCH_LIMIT:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST,
+                            detail=f"No more than {settings.QR_BATCH_LIMIT} photos per request")
+    if body.bundle == "sheet" and body.image_format != "svg":
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Sheets are only available as SVG")
+
+    photo_urls = await get_photo_urls(db, photo_ids)
+    missing = [photo_id for photo_id in photo_ids if photo_id not in photo_urls]
+    if missing:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND,
+                            detail=f"Photos not found: {', '.join(map(str, missing))}")
+
+    images = await render_qr_codes([photo_urls[photo_id] for photo_id in photo_ids], body.image_format)
+    codes = list(zip(photo_ids, images))
+
+    if body.bundle == "sheet":
+        return StreamingResponse(BytesIO(build_qr_svg_sheet(codes)), media_type=QR_MEDIA_TYPES["svg"],
+                                 headers={"Content-Disposition": "attachment; filename=qr_codes.svg"})
+    return StreamingResponse(build_qr_zip(codes, body.image_format), media_type="application/zip",
+                             headers={"Content-Disposition": "attachment; filename=qr_codes.zip"})
+
+
 @router.post("/photos/generate_qrcode/{photo_id}", dependencies=[Depends(verify_api_key)])
 @log_function
 async def generate_qr_code(photo_id: int, db: AsyncSession = Depends(get_db)):
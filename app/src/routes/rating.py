@@ -1,17 +1,19 @@
-from fastapi import APIRouter, Depends, HTTPException, status, Form
-from sqlalchemy import func
+from typing import List, Literal, Optional
+from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, status, Form, Query
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 from app.src.config.dependency import role_required, verify_api_key
-from app.src.util.crud.photo import get_photo
 from app.src.util.models.user import UserRole
-from app.src.util.schemas.rating import RatingResponse
-from app.src.util.crud.rating import get_rating, delete_rating
+from app.src.config.config import settings
+from app.src.util.schemas.rating import RatingResponse, LeaderboardEntryResponse, PhotoRatingsBatchRequest, \
+    PhotoRatingSummary
+from app.src.util.crud.leaderboard import get_leaderboard
+from app.src.util.crud.rating import get_rating, delete_rating, create_rating, get_rating_summaries, \
+    reconcile_rating_aggregates
 from app.src.util.db import get_db
 from sqlalchemy.future import select
-from app.src.util.models.rating import Rating
-from app.src.config.security import get_current_user
-from app.src.util.models import User
+from app.src.config.security import get_current_user, get_optional_current_user
+from app.src.util.models import User, Photo
 from fastapi.responses import RedirectResponse
 
 router = APIRouter()
@@ -31,11 +33,63 @@ async def get_photo_rating(photo_id: int, db: AsyncSession = Depends(get_db)):
         Returns:
         float: The average rating of the photo. If no ratings are found, returns 0.
         """
-    result = await db.execute(select(func.avg(Rating.rating)).where(Rating.photo_id == photo_id))
-    average_rating = result.scalar()
-    if average_rating is None:
+    result = await db.execute(select(Photo.rating_count, Photo.rating_sum).where(Photo.id == photo_id))
+    aggregates = result.first()
+    if aggregates is None or not aggregates.rating_count:
         return 0
-    return average_rating
+    return aggregates.rating_sum / aggregates.rating_count
+
+
+@router.get("/photos/{photo_id}/rating/summary", response_model=PhotoRatingSummary,
+            dependencies=[Depends(verify_api_key)])
+async def get_photo_rating_summary(photo_id: int, db: AsyncSession = Depends(get_db)):
+    """
+    Retrieve the average, count and 1-5 star histogram of a photo's ratings.
+
+    Parameters:
+    photo_id (int): The unique identifier of the photo.
+    db (AsyncSession, optional): The database session. Defaults to Depends(get_db).
+
+    Returns:
+    PhotoRatingSummary: The rating summary of the photo.
+
+    Raises:
+    HTTPException: If the photo does not exist.
+    """
+    summaries = await get_rating_summaries(db, [photo_id])
+    if photo_id not in summaries:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Photo not found")
+    return summaries[photo_id]
+
+
+@router.post("/photos/ratings:batch", response_model=List[PhotoRatingSummary], dependencies=[Depends(verify_api_key)])
+async def get_photo_ratings_batch(body: PhotoRatingsBatchRequest, db: AsyncSession = Depends(get_db),
+                                  viewer: Optional[User] = Depends(get_optional_current_user)):
+    """
+    Retrieve the rating summaries of several photos in one request.
+
+    Meant for clients rendering photo grids: the average, count and star histogram of every photo,
+    and the logged-in viewer's own rating, come from a single query over the per-photo aggregate
+    columns. Photos that do not exist are left out.
+
+    Parameters:
+    body (PhotoRatingsBatchRequest): The photo IDs.
+    db (AsyncSession, optional): The database session. Defaults to Depends(get_db).
+    viewer (Optional[User]): The authenticated user, None for anonymous requests.
+
+    Returns:
+    List[PhotoRatingSummary]: One summary per distinct photo ID found, in request order.
+
+    Raises:
+    HTTPException: If too many photos are requested.
+    """
+    photo_ids = list(dict.fromkeys(body.photo_ids))
+    if len(photo_ids) > settings.RATING_BATCH_LIMIT:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST,
+                            detail=f"No more than {settings.RATING_BATCH_LIMIT} photos per request")
+
+    summaries = await get_rating_summaries(db, photo_ids, viewer.id if viewer is not None else None)
+    return [summaries[photo_id] for photo_id in photo_ids if photo_id in summaries]
 
 
 @router.post("/photos/rate")
@@ -63,26 +117,31 @@ async def rate_photo(photo_id: int = Form(...), rating: int = Form(...), db: Asy
     if rating < 1 or rating > 5:
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Rating must be between 1 and 5")
 
-    photo = await get_photo(db, photo_id)
-    if not photo:
-        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Photo not found")
+    await create_rating(photo_id, rating, current_user.id, db)
 
-    if photo.user_id == current_user.id:
-        raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="You cannot rate your own photo")
+    return RedirectResponse(url=f"/photo/{photo_id}", status_code=status.HTTP_302_FOUND)
 
-    existing_rating = await db.execute(
-        select(Rating).where(Rating.photo_id == photo_id, Rating.user_id == current_user.id))
-    existing_rating = existing_rating.scalars().first()
 
-    if existing_rating:
-        raise HTTPException(status_code=status.HTTP_403_FORBIDDEN,
-                            detail="You cannot change your rating")
+@router.get("/ratings/top", response_model=List[LeaderboardEntryResponse], dependencies=[Depends(verify_api_key)])
+async def get_top_rated_photos(period: Literal["day", "week", "all"] = "all",
+                               limit: int = Query(20, ge=1, le=settings.LEADERBOARD_SIZE),
+                               db: AsyncSession = Depends(get_db)):
+    """
+    Retrieve the top-rated photos of a period.
 
-    new_rating = Rating(rating=rating, user_id=current_user.id, photo_id=photo_id)
-    db.add(new_rating)
-    await db.commit()
+    Photos are ranked by the Bayesian average of their ratings, so photos with only a few votes do not
+    outrank well-established ones. Rankings are precomputed by a background job; this endpoint only
+    reads the latest snapshot.
 
-    return RedirectResponse(url=f"/photo/{photo_id}", status_code=status.HTTP_302_FOUND)
+    Parameters:
+    period (str): "day", "week" or "all".
+    limit (int): Maximum number of photos.
+    db (AsyncSession, optional): The database session. Defaults to Depends(get_db).
+
+    Returns:
+    List[LeaderboardEntryResponse]: The ranked photos, best first.
+    """
+    return await get_leaderboard(db, period, limit)
 
 
 @router.get("/ratings/", response_model=RatingResponse,dependencies=[Depends(verify_api_key)])
@@ -121,3 +180,19 @@ async def delete_rate(rate_id: int, db: AsyncSession = Depends(get_db),
     if deleted_rate is None:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Rate not found or not available.")
     return deleted_rate
+
+
+@router.post("/ratings/backfill", status_code=status.HTTP_202_ACCEPTED,
+             dependencies=[Depends(role_required([UserRole.ADMIN]))])
+async def backfill_rating_aggregates(background_tasks: BackgroundTasks):
+    """
+    Starts recomputing every photo's rating aggregates and star histogram from the ratings table.
+
+    Parameters:
+    background_tasks (BackgroundTasks): Runs the backfill after the response is sent.
+
+    Returns:
+    dict: A confirmation message.
+    """
+    background_tasks.add_task(reconcile_rating_aggregates)
+    return {"detail": "Rating backfill started"}
@@ -0,0 +1,98 @@
+from typing import List, Optional
+from fastapi import APIRouter, Depends, Query
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.src.config.config import settings
+from app.src.config.dependency import verify_api_key
+from app.src.services.tag_suggest import tag_suggest_index
+from app.src.util.crud.tag import suggest_tags_from_db, get_tag_by_name, get_photos_by_tag, get_tag_photo_count
+from app.src.util.crud.tag_relation import get_related_tags
+from app.src.util.db import get_db
+from app.src.util.schemas.photo import PhotoResponse, TagPhotosPage
+from app.src.util.schemas.tag import TagSuggestion, TagResponse, RelatedTag
+
+router = APIRouter()
+
+
+@router.get("/tags/suggest", response_model=List[TagSuggestion])
+async def suggest_tags(q: str = Query(..., min_length=1, max_length=100),
+                       limit: int = Query(settings.TAG_SUGGEST_TOP_K, ge=1, le=settings.TAG_SUGGEST_TOP_K),
+                       db: AsyncSession = Depends(get_db)):
+    """
+    Suggest tags for autocomplete.
+
+    Returns the most used tags whose name starts with the given prefix, ignoring case. Answers come from
+    the in-memory suggestion index; the database is only queried while the index is not loaded yet.
+
+    Args:
+        q (str): The prefix typed by the user.
+        limit (int): Maximum number of suggestions.
+        db (AsyncSession): The asynchronous database session.
+
+    Returns:
+        List[TagSuggestion]: The suggested tags, most used first.
+    """
+    if tag_suggest_index.loaded:
+        suggestions = tag_suggest_index.suggest(q, limit)
+    else:
+        suggestions = await suggest_tags_from_db(db, q, limit)
+    return [TagSuggestion(name=name, count=count) for name, count in suggestions]
+
+
+@router.get("/tags/{tag_name}/photos", response_model=TagPhotosPage, dependencies=[Depends(verify_api_key)])
+async def get_tag_photos(tag_name: str, before: Optional[int] = None,
+                         limit: int = Query(settings.TAG_PAGE_SIZE, ge=1, le=100),
+                         db: AsyncSession = Depends(get_db)):
+    """
+    Retrieve photos with a tag, newest first, one page at a time.
+
+    Args:
+        tag_name (str): The name of the tag.
+        before (Optional[int]): The `next_cursor` of the previous page.
+        limit (int): The page size.
+        db (AsyncSession): The asynchronous database session.
+
+    Returns:
+        TagPhotosPage: The tag's photo count, the photos of the page and the cursor for the next page.
+
+    Raises:
+        HTTPException: If the tag does not exist.
+    """
+    tag = await get_tag_by_name(db, tag_name)
+    photos, next_cursor = await get_photos_by_tag(db, tag.id, before, limit)
+    return TagPhotosPage(
+        tag=tag.name,
+        photo_count=await get_tag_photo_count(db, tag),
+        photos=[
+            PhotoResponse(
+                id=photo.id,
+                description=photo.description,
+                url=photo.url,
+                user_id=photo.user_id,
+                tags=[TagResponse(name=photo_tag.name) for photo_tag in photo.tags]
+            )
+            for photo in photos
+        ],
+        next_cursor=next_cursor
+    )
+
+
+@router.get("/tags/{tag_name}/related", response_model=List[RelatedTag], dependencies=[Depends(verify_api_key)])
+async def get_tag_related(tag_name: str, db: AsyncSession = Depends(get_db)):
+    """
+    Retrieve the tags most often used together with a tag.
+
+    The ranking is precomputed by the related tags background job, so this is a single row lookup.
+
+    Args:
+        tag_name (str): The name of the tag.
+        db (AsyncSession): The asynchronous database session.
+
+    Returns:
+        List[RelatedTag]: The related tags, best first.
+
+    Raises:
+        HTTPException: If the tag does not exist.
+    """
+    tag = await get_tag_by_name(db, tag_name)
+    related = await get_related_tags(db, [tag.id])
+    return [RelatedTag(name=name, score=score) for name, score in related]
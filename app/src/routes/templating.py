@@ -9,9 +9,15 @@ from fastapi.responses import HTMLResponse
 from app.src.config.config import templates, FrontEndpoints
 from app.src.config.security import get_current_user, get_current_user_cookies
 from app.src.util.crud.photo import get_post_by_id, get_photo, PhotoService
+from app.src.util.crud.tag import get_tag_by_name, get_photos_by_tag, get_tag_photo_count
+from app.src.util.crud.tag_relation import get_related_tags
+from app.src.util.crud.leaderboard import get_leaderboard, LEADERBOARD_PERIODS
+from app.src.util.crud.comment import get_comments
+from app.src.util.crud.user import get_people_page
+from app.src.util.crud.profile import get_profile, get_profile_photos
 from app.src.util.db import get_db
 from app.src.util.models import User, Photo
-from app.src.util.schemas.user import User as UserSchema, UserProfile
+from app.src.util.schemas.user import UserProfile
 from app.src.services.aggregator import Aggregator
 
 router = APIRouter()
@@ -62,46 +68,50 @@ async def get_logout_form(request: Request):
 
 
 @router.get(FrontEndpoints.PEOPLE_FORM.value, response_class=HTMLResponse)
-async def get_user_profiles(request: Request, db: AsyncSession = Depends(get_db)):
+async def get_user_profiles(request: Request, q: str = Query(None, max_length=100), after: str = None,
+                            db: AsyncSession = Depends(get_db)):
     """
-    Handles GET requests to the user profiles endpoint.
+    Handles GET requests to the user profiles endpoint, one page at a time.
 
     Args:
         request (Request): The HTTP request object.
+        q (str): Only show users whose username starts with this text.
+        after (str): The cursor of the page to show; the first page when omitted.
         db (AsyncSession): The database session.
 
     Returns:
         HTMLResponse: Renders the user profiles template with the user data.
     """
-    result = await db.execute(select(User).filter(User.is_active == True))
-    users = result.scalars().all()
-    user_profiles = [UserSchema.from_orm(user).dict() for user in users]
-    return templates.TemplateResponse("people.html", {"request": request, "users": user_profiles})
+    q = q.strip() if q else None
+    people, next_cursor = await get_people_page(db, prefix=q, after=after)
+    return templates.TemplateResponse("people.html", {"request": request, "users": people, "q": q or "",
+                                                      "next_cursor": next_cursor})
 
 
 @router.get("/user/{username}", response_class=HTMLResponse)
-async def get_user_detail(request: Request, username: str, db: AsyncSession = Depends(get_db)):
+async def get_user_detail(request: Request, username: str, before: int = None, db: AsyncSession = Depends(get_db)):
     """
     Handles GET requests to the detailed user profile endpoint.
 
+    The summary and the first page of photos come from the profile cache; older pages are read
+    with a keyset cursor.
+
     Args:
         request (Request): The HTTP request object.
         username (str): The username of the user.
+        before (int): The cursor of the page of photos to show; the first page when omitted.
         db (AsyncSession): The database session.
 
     Returns:
         HTMLResponse: Renders the detailed user profile template with the user data and photos.
     """
-    result = await db.execute(select(User).filter(User.username == username))
-    user = result.scalars().first()
-    if not user:
-        raise HTTPException(status_code=404, detail="User not found")
-    user_profile = UserSchema.from_orm(user).dict()
-
-    photo_result = await db.execute(select(Photo).filter(Photo.user_id == user.id))
-    photos = photo_result.scalars().all()
+    profile = await get_profile(db, username)
+    photos, next_cursor = profile["photos"], profile["next_cursor"]
+    if before is not None:
+        photos, next_cursor = await get_profile_photos(db, profile["user"]["id"], before=before)
 
-    return templates.TemplateResponse("user_profile.html", {"request": request, "user": user_profile, "photos": photos})
+    return templates.TemplateResponse("user_profile.html", {"request": request, "user": profile["user"],
+                                                            "photos": photos, "next_cursor": next_cursor})
 
 
 @router.get(FrontEndpoints.PHOTO_UPLOAD_FORM.value, response_class=HTMLResponse)
@@ -126,7 +136,7 @@ async def view_photo(photo_id: int, request: Request, db: AsyncSession = Depends
                      current_user: User = Depends(get_current_user_cookies)):
     """
     Display the details of a specific photo, including its description, tags,
-    uploader's username, average rating, and comments.
+    uploader's username, average rating, and the first page of comments.
 
     Args:
         photo_id (int): The unique identifier of the photo.
@@ -143,10 +153,43 @@ async def view_photo(photo_id: int, request: Request, db: AsyncSession = Depends
     photo = await get_post_by_id(db, photo_id)
     if not photo:
         raise HTTPException(status_code=404, detail="Photo not found")
+    related_tags = await get_related_tags(db, [tag.id for tag in photo.tags],
+                                          exclude=tuple(tag.name for tag in photo.tags))
+    comments, next_cursor = await get_comments(db, photo_id)
 
     return templates.TemplateResponse("photo_detail.html", {
         "request": request,
         "photo": photo,
+        "photo_id": photo.id,
+        "comments": comments,
+        "next_cursor": next_cursor,
+        "related_tags": related_tags,
+        "current_user": current_user,
+    })
+
+
+@router.get("/photo/{photo_id}/comments", response_class=HTMLResponse)
+async def view_photo_comments(photo_id: int, request: Request, cursor: str, db: AsyncSession = Depends(get_db),
+                              current_user: User = Depends(get_current_user_cookies)):
+    """
+    Render the next page of a photo's comments as an HTML fragment for the "Show more" button.
+
+    Args:
+        photo_id (int): The unique identifier of the photo.
+        request (Request): The HTTP request object.
+        cursor (str): The cursor of the page to show.
+        db (AsyncSession): The SQLAlchemy asynchronous session.
+        current_user (User): The current authenticated user.
+
+    Returns:
+        TemplateResponse: The rendered comments fragment.
+    """
+    comments, next_cursor = await get_comments(db, photo_id, cursor)
+    return templates.TemplateResponse("comments_page.html", {
+        "request": request,
+        "photo_id": photo_id,
+        "comments": comments,
+        "next_cursor": next_cursor,
         "current_user": current_user,
     })
 
@@ -198,6 +241,67 @@ async def get_user_photos(request: Request, db: AsyncSession = Depends(get_db),
     return templates.TemplateResponse("user_photos.html", {"request": request, "photos": photos})
 
 
+@router.get("/tags/{tag_name}", response_class=HTMLResponse)
+async def view_tag(tag_name: str, request: Request, before: int = None, db: AsyncSession = Depends(get_db),
+                   current_user: User = Depends(get_current_user_cookies)):
+    """
+    Display the photos with a tag, newest first, one page at a time.
+
+    Args:
+        tag_name (str): The name of the tag.
+        request (Request): The HTTP request object.
+        before (int): The cursor of the page to show; the first page when omitted.
+        db (AsyncSession): The SQLAlchemy asynchronous session.
+        current_user (User): The current authenticated user.
+
+    Returns:
+        TemplateResponse: The rendered tag page.
+
+    Raises:
+        HTTPException: If the tag does not exist.
+    """
+    tag = await get_tag_by_name(db, tag_name)
+    photos, next_cursor = await get_photos_by_tag(db, tag.id, before)
+    return templates.TemplateResponse("tag_photos.html", {
+        "request": request,
+        "tag": tag,
+        "photo_count": await get_tag_photo_count(db, tag),
+        "photos": photos,
+        "next_cursor": next_cursor,
+        "related_tags": await get_related_tags(db, [tag.id]),
+        "current_user": current_user,
+    })
+
+
+@router.get(FrontEndpoints.TOP_PHOTOS.value, response_class=HTMLResponse)
+async def view_top_photos(request: Request, period: str = Query("week"), db: AsyncSession = Depends(get_db),
+                          current_user: User = Depends(get_current_user_cookies)):
+    """
+    Display the top-rated photos of a day, a week or all time.
+
+    Args:
+        request (Request): The HTTP request object.
+        period (str): "day", "week" or "all".
+        db (AsyncSession): The SQLAlchemy asynchronous session.
+        current_user (User): The current authenticated user.
+
+    Returns:
+        TemplateResponse: The rendered leaderboard page.
+
+    Raises:
+        HTTPException: If the period is unknown.
+    """
+    if period not in LEADERBOARD_PERIODS:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Unknown leaderboard period")
+    return templates.TemplateResponse("top_photos.html", {
+        "request": request,
+        "period": period,
+        "periods": {"day": "Today", "week": "This week", "all": "All time"},
+        "entries": await get_leaderboard(db, period),
+        "current_user": current_user,
+    })
+
+
 @router.get("/photo/show-qr/{photo_id}", response_class=HTMLResponse)
 async def display_qr_code(photo_id: int, request: Request, db: AsyncSession = Depends(get_db)):
     """
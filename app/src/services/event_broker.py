@@ -0,0 +1,155 @@
+import asyncio
+import json
+from collections import defaultdict
+from typing import Optional
+import asyncpg
+from sqlalchemy import event, text
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.src.config.config import settings
+from app.src.config.logging_config import logger
+from app.src.util.db import DATABASE_URL
+
+# Postgres rejects NOTIFY payloads of 8000 bytes or more.
+MAX_PAYLOAD_BYTES = 7900
+
+
+class SubscriberLimitReached(Exception):
+    """Raised when a new subscriber would exceed the configured connection limits."""
+
+
+class PhotoEventBroker:
+    """
+    In-process publish/subscribe broker for live photo page updates.
+
+    Every subscriber gets a bounded queue. A subscriber that falls `EVENTS_QUEUE_SIZE` events behind
+    is dropped instead of buffering without limit; its stream ends and the browser reconnects.
+
+    Once `start` has connected to Postgres, events are published with `pg_notify` in the publisher's
+    transaction and dispatched from `LISTEN`, so subscribers of every worker process receive them,
+    and only after the transaction commits. Without the bridge, events are dispatched locally after commit.
+    """
+
+    def __init__(self, channel: str = settings.EVENTS_CHANNEL):
+        self.channel = channel
+        self._subscribers = defaultdict(set)
+        self._subscriber_count = 0
+        self._connection: Optional[asyncpg.Connection] = None
+
+    @property
+    def bridged(self) -> bool:
+        return self._connection is not None and not self._connection.is_closed()
+
+    async def start(self):
+        """
+        Opens a dedicated connection that listens for events published by all workers.
+        """
+        try:
+            self._connection = await asyncpg.connect(DATABASE_URL.replace("postgresql+asyncpg://", "postgresql://"))
+            await self._connection.add_listener(self.channel, self._on_notification)
+        except (OSError, asyncpg.PostgresError) as e:
+            logger.warning(f"Photo events are not shared between workers, LISTEN failed: {e}")
+            self._connection = None
+
+    async def stop(self):
+        """
+        Closes the listening connection and ends all open streams.
+        """
+        if self._connection is not None:
+            await self._connection.close()
+            self._connection = None
+        for queues in self._subscribers.values():
+            for queue in queues:
+                self._close(queue)
+        self._subscribers.clear()
+        self._subscriber_count = 0
+
+    def subscribe(self, photo_id: int) -> asyncio.Queue:
+        """
+        Registers a subscriber for the events of a photo.
+
+        Args:
+            photo_id (int): The ID of the photo.
+
+        Returns:
+            asyncio.Queue: The queue the subscriber reads events from; None marks the end of the stream.
+
+        Raises:
+            SubscriberLimitReached: If the process or the photo already has the maximum number of subscribers.
+        """
+        if self._subscriber_count >= settings.EVENTS_MAX_CONNECTIONS:
+            raise SubscriberLimitReached("Too many live connections")
+        if len(self._subscribers[photo_id]) >= settings.EVENTS_MAX_CONNECTIONS_PER_PHOTO:
+            raise SubscriberLimitReached("Too many live connections for this photo")
+
+        queue = asyncio.Queue(maxsize=settings.EVENTS_QUEUE_SIZE)
+        self._subscribers[photo_id].add(queue)
+        self._subscriber_count += 1
+        return queue
+
+    def unsubscribe(self, photo_id: int, queue: asyncio.Queue):
+        """
+        Removes a subscriber registered with `subscribe`.
+
+        Args:
+            photo_id (int): The ID of the photo.
+            queue (asyncio.Queue): The subscriber's queue.
+        """
+        queues = self._subscribers.get(photo_id)
+        if queues is None or queue not in queues:
+            return
+        queues.discard(queue)
+        self._subscriber_count -= 1
+        if not queues:
+            del self._subscribers[photo_id]
+
+    def dispatch(self, photo_id: int, photo_event: dict):
+        """
+        Hands an event to the subscribers of a photo in this process.
+
+        Args:
+            photo_id (int): The ID of the photo.
+            photo_event (dict): The event, with at least a "type" key.
+        """
+        for queue in list(self._subscribers.get(photo_id, ())):
+            try:
+                queue.put_nowait(photo_event)
+            except asyncio.QueueFull:
+                self.unsubscribe(photo_id, queue)
+                self._close(queue)
+
+    async def publish(self, db: AsyncSession, photo_id: int, photo_event: dict):
+        """
+        Publishes an event about a photo once the current transaction of `db` commits.
+
+        Call it before committing; nothing is published if the transaction rolls back.
+
+        Args:
+            db (AsyncSession): The session whose transaction makes the change.
+            photo_id (int): The ID of the photo.
+            photo_event (dict): The event, with at least a "type" key.
+        """
+        if not self.bridged:
+            event.listen(db.sync_session, "after_commit", lambda session: self.dispatch(photo_id, photo_event),
+                         once=True)
+            return
+
+        payload = json.dumps({"photo_id": photo_id, "event": photo_event})
+        content = photo_event.get("content", "")
+        while len(payload.encode()) > MAX_PAYLOAD_BYTES and content:
+            content = content[:len(content) * MAX_PAYLOAD_BYTES // len(payload.encode()) - 1]
+            photo_event = {**photo_event, "content": content, "truncated": True}
+            payload = json.dumps({"photo_id": photo_id, "event": photo_event})
+        await db.execute(text("SELECT pg_notify(:channel, :payload)"), {"channel": self.channel, "payload": payload})
+
+    def _on_notification(self, connection, pid, channel, payload):
+        message = json.loads(payload)
+        self.dispatch(message["photo_id"], message["event"])
+
+    @staticmethod
+    def _close(queue: asyncio.Queue):
+        while not queue.empty():
+            queue.get_nowait()
+        queue.put_nowait(None)
+
+
+photo_event_broker = PhotoEventBroker()
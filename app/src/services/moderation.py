@@ -0,0 +1,126 @@
+from collections import deque
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+
+FLAG = "flag"
+HOLD = "hold"
+
+
+def normalize_term(text: str) -> str:
+    return " ".join(text.casefold().split())
+
+
+class AhoCorasick:
+    """
+    Aho-Corasick automaton that finds every occurrence of a fixed set of patterns in one pass over
+    the text, in time linear in the text length plus the number of matches.
+    """
+
+    def __init__(self, patterns: Iterable[str]):
+        self._goto: List[Dict[str, int]] = [{}]
+        self._fail: List[int] = [0]
+        self._output: List[List[str]] = [[]]
+
+        for pattern in patterns:
+            state = 0
+            for char in pattern:
+                if char not in self._goto[state]:
+                    self._goto.append({})
+                    self._fail.append(0)
+                    self._output.append([])
+                    self._goto[state][char] = len(self._goto) - 1
+                state = self._goto[state][char]
+            self._output[state].append(pattern)
+
+        queue = deque(self._goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for char, next_state in self._goto[state].items():
+                queue.append(next_state)
+                fallback = self._fail[state]
+                while fallback and char not in self._goto[fallback]:
+                    fallback = self._fail[fallback]
+                self._fail[next_state] = self._goto[fallback].get(char, 0)
+                self._output[next_state] = self._output[next_state] + self._output[self._fail[next_state]]
+
+    def iter_matches(self, text: str) -> Iterator[Tuple[int, str]]:
+        """
+        Yields every pattern occurrence in `text`.
+
+        Args:
+            text (str): The text to scan.
+
+        Yields:
+            Tuple[int, str]: The start index of the occurrence and the matched pattern.
+        """
+        state = 0
+        for index, char in enumerate(text):
+            while state and char not in self._goto[state]:
+                state = self._fail[state]
+            state = self._goto[state].get(char, 0)
+            for pattern in self._output[state]:
+                yield index - len(pattern) + 1, pattern
+
+
+class ModerationFilter:
+    """
+    Matches text against the banned terms, ignoring case and only at word boundaries.
+
+    `load` builds a new automaton and swaps it in with a single assignment, so the term list can be
+    reloaded while requests are being scanned.
+    """
+
+    def __init__(self):
+        self._state: Tuple[Dict[str, str], AhoCorasick] = ({}, AhoCorasick(()))
+
+    def load(self, terms: Iterable[Tuple[str, str]]):
+        """
+        Replaces the banned terms.
+
+        Args:
+            terms (Iterable[Tuple[str, str]]): Pairs of term and action, "flag" or "hold".
+        """
+        actions = {}
+        for term, action in terms:
+            term = normalize_term(term)
+            if term and actions.get(term) != HOLD:
+                actions[term] = action
+        self._state = (actions, AhoCorasick(actions))
+
+    def scan(self, text: str) -> Dict[str, str]:
+        """
+        Finds the banned terms used in a text.
+
+        Args:
+            text (str): The text to scan.
+
+        Returns:
+            Dict[str, str]: The matched terms and their actions.
+        """
+        actions, automaton = self._state
+        text = normalize_term(text)
+        matches = {}
+        for start, term in automaton.iter_matches(text):
+            end = start + len(term)
+            if (start == 0 or not text[start - 1].isalnum()) and (end == len(text) or not text[end].isalnum()):
+                matches[term] = actions[term]
+        return matches
+
+    def verdict(self, text: str) -> Tuple[Optional[str], List[str]]:
+        """
+        Decides what to do with a text.
+
+        Args:
+            text (str): The text to scan.
+
+        Returns:
+            Tuple[Optional[str], List[str]]: "held" if any matched term holds, "flagged" if terms only
+            flag, None for clean text; and the matched terms.
+        """
+        matches = self.scan(text)
+        if not matches:
+            return None, []
+        status = "held" if HOLD in matches.values() else "flagged"
+        return status, sorted(matches)
+
+
+moderation_filter = ModerationFilter()
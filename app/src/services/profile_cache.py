@@ -0,0 +1,97 @@
+import time
+from collections import OrderedDict
+from typing import Optional
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.src.config.config import settings
+
+
+class ProfileCache:
+    """
+    Process-wide read model of public profile pages: the user summary and the first page of photos.
+
+    Entries are dropped when the owner's profile changes, once the changing transaction commits.
+    Every invalidation bumps the user's generation, so a page read concurrently with a change is not
+    stored over it. Changes made by other worker processes are picked up when the entry expires
+    after `PROFILE_CACHE_TTL_SECONDS`.
+    """
+
+    def __init__(self, max_size: int = settings.PROFILE_CACHE_SIZE, ttl: float = settings.PROFILE_CACHE_TTL_SECONDS):
+        self.max_size = max_size
+        self.ttl = ttl
+        self._entries: OrderedDict = OrderedDict()
+        self._usernames = {}
+        self._generations = {}
+
+    def get(self, username: str) -> Optional[dict]:
+        """
+        Looks up the cached profile of a user.
+
+        Args:
+            username (str): The username.
+
+        Returns:
+            Optional[dict]: The cached profile, None if it is not cached or has expired.
+        """
+        cached = self._entries.get(username)
+        if cached is None:
+            return None
+        stored_at, profile = cached
+        if time.monotonic() - stored_at > self.ttl:
+            self._discard(username)
+            return None
+        self._entries.move_to_end(username)
+        return profile
+
+    def generation(self, user_id: int) -> int:
+        """
+        Returns the user's invalidation counter; read it before loading the profile to store.
+        """
+        return self._generations.get(user_id, 0)
+
+    def put(self, username: str, user_id: int, generation: int, profile: dict):
+        """
+        Stores a profile unless the user's profile was invalidated since `generation` was read.
+
+        Args:
+            username (str): The username.
+            user_id (int): The ID of the user.
+            generation (int): The value of `generation(user_id)` read before loading the profile.
+            profile (dict): The profile to cache.
+        """
+        if self.generation(user_id) != generation:
+            return
+        self._entries[username] = (time.monotonic(), profile)
+        self._entries.move_to_end(username)
+        self._usernames[user_id] = username
+        while len(self._entries) > self.max_size:
+            self._discard(next(iter(self._entries)))
+
+    def invalidate(self, user_id: int):
+        """
+        Drops the cached profile of a user.
+
+        Args:
+            user_id (int): The ID of the user.
+        """
+        self._generations[user_id] = self._generations.get(user_id, 0) + 1
+        username = self._usernames.pop(user_id, None)
+        if username is not None:
+            self._entries.pop(username, None)
+
+    def invalidate_after_commit(self, db: AsyncSession, user_id: int):
+        """
+        Drops the cached profile of a user once the current transaction of `db` commits.
+
+        Args:
+            db (AsyncSession): The session whose transaction changes the profile.
+            user_id (int): The ID of the user.
+        """
+        event.listen(db.sync_session, "after_commit", lambda session: self.invalidate(user_id), once=True)
+
+    def _discard(self, username: str):
+        _, profile = self._entries.pop(username)
+        self._usernames.pop(profile["user"]["id"], None)
+
+
+profile_cache = ProfileCache()
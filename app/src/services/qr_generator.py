@@ -0,0 +1,157 @@
+import asyncio
+import io
+import zipfile
+import xml.etree.ElementTree as ET
+from concurrent.futures import ProcessPoolExecutor
+from typing import List, Optional, Tuple
+import qrcode
+import qrcode.image.svg
+from app.src.config.config import settings
+
+SVG_NAMESPACE = "http://www.w3.org/2000/svg"
+
+QR_MEDIA_TYPES = {
+    "png": "image/png",
+    "svg": "image/svg+xml",
+}
+
+_executor: Optional[ProcessPoolExecutor] = None
+
+
+def render_qr_code(data: str, image_format: str = "png") -> bytes:
+    """
+    Renders a single QR code to raw image bytes.
+
+    Kept at module level so it can be pickled and executed in a worker process.
+
+    Args:
+        data (str): The data to encode, usually the photo URL.
+        image_format (str): Either "png" or "svg".
+
+    Returns:
+        bytes: The encoded image.
+    """
+    qr = qrcode.QRCode(
+        version=1,
+        error_correction=qrcode.constants.ERROR_CORRECT_L,
+        box_size=10,
+        border=4,
+    )
+    qr.add_data(data)
+    qr.make(fit=True)
+
+    if image_format == "svg":
+        return qr.make_image(image_factory=qrcode.image.svg.SvgPathImage).to_string()
+
+    qr_code_io = io.BytesIO()
+    qr.make_image(fill_color="black", back_color="white").save(qr_code_io)
+    return qr_code_io.getvalue()
+
+
+def get_qr_executor() -> ProcessPoolExecutor:
+    """
+    Returns the process pool used for QR rendering, creating it on first use.
+
+    Returns:
+        ProcessPoolExecutor: The shared process pool.
+    """
+    global _executor
+    if _executor is None:
+        _executor = ProcessPoolExecutor(max_workers=settings.QR_PROCESS_WORKERS)
+    return _executor
+
+
+def shutdown_qr_executor():
+    """Shuts down the QR process pool if it was started."""
+    global _executor
+    if _executor is not None:
+        _executor.shutdown(wait=False, cancel_futures=True)
+        _executor = None
+
+
+async def render_qr_codes(urls: List[str], image_format: str) -> List[bytes]:
+    """
+    Renders QR codes for several URLs in parallel on the process pool.
+
+    Args:
+        urls (List[str]): The URLs to encode.
+        image_format (str): Either "png" or "svg".
+
+    Returns:
+        List[bytes]: The rendered images, in the same order as `urls`.
+    """
+    loop = asyncio.get_running_loop()
+    executor = get_qr_executor()
+    return await asyncio.gather(
+        *(loop.run_in_executor(executor, render_qr_code, url, image_format) for url in urls)
+    )
+
+
+def build_qr_zip(codes: List[Tuple[int, bytes]], image_format: str) -> io.BytesIO:
+    """
+    Packs rendered QR codes into a ZIP archive, one file per photo.
+
+    Args:
+        codes (List[Tuple[int, bytes]]): Pairs of photo ID and rendered image.
+        image_format (str): The extension used for the archived files.
+
+    Returns:
+        io.BytesIO: The archive, positioned at the start.
+    """
+    archive = io.BytesIO()
+    with zipfile.ZipFile(archive, "w", compression=zipfile.ZIP_DEFLATED) as zip_file:
+        for photo_id, image in codes:
+            zip_file.writestr(f"photo_{photo_id}_qr.{image_format}", image)
+    archive.seek(0)
+    return archive
+
+
+def build_qr_svg_sheet(codes: List[Tuple[int, bytes]], columns: int = settings.QR_SHEET_COLUMNS,
+                       cell_size: int = 50) -> bytes:
+    """
+    Lays out SVG QR codes on a single printable sheet with the photo ID under each code.
+
+    Args:
+        codes (List[Tuple[int, bytes]]): Pairs of photo ID and rendered SVG image.
+        columns (int): Number of codes per row.
+        cell_size (int): Width and height of each code in millimetres.
+
+    Returns:
+        bytes: The sheet as an SVG document.
+    """
+    caption_height = 8
+    rows = (len(codes) + columns - 1) // columns
+    width = min(columns, len(codes)) * cell_size
+    height = rows * (cell_size + caption_height)
+
+    sheet = ET.Element(f"{{{SVG_NAMESPACE}}}svg", {
+        "width": f"{width}mm",
+        "height": f"{height}mm",
+        "viewBox": f"0 0 {width} {height}",
+        "version": "1.1",
+    })
+    for index, (photo_id, image) in enumerate(codes):
+        x = (index % columns) * cell_size
+        y = (index // columns) * (cell_size + caption_height)
+
+        code = ET.fromstring(image)
+        code.set("x", str(x))
+        code.set("y", str(y))
+        code.set("width", str(cell_size))
+        code.set("height", str(cell_size))
+        sheet.append(code)
+
+        caption = ET.SubElement(sheet, f"{{{SVG_NAMESPACE}}}text", {
+            "x": str(x + cell_size / 2),
+            "y": str(y + cell_size + caption_height / 2),
+            "font-size": "4",
+            "text-anchor": "middle",
+        })
+        caption.text = f"#{photo_id}"
+
+    # qrcode registers an "svg" prefix for the namespace on every render, so ElementTree would write
+    # `svg:` elements; declare it as the default namespace on the root instead.
+    for element in sheet.iter():
+        element.tag = element.tag.rpartition("}")[2]
+    sheet.set("xmlns", SVG_NAMESPACE)
+    return ET.tostring(sheet, xml_declaration=True, encoding="utf-8")
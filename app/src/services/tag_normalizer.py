@@ -0,0 +1,35 @@
+import re
+import unicodedata
+from app.src.config.config import settings
+
+_WHITESPACE = re.compile(r"\s+")
+
+
+def clean_tag_name(name: str, max_length: int = settings.TAG_MAX_LENGTH) -> str:
+    """
+    Tidies a tag name for display: Unicode NFKC, whitespace runs collapsed to one space, trimmed
+    and cut to `max_length` characters. Case is preserved.
+
+    Args:
+        name (str): The tag name as typed.
+        max_length (int): The maximum tag length.
+
+    Returns:
+        str: The cleaned name, empty if nothing is left.
+    """
+    name = unicodedata.normalize("NFKC", name)
+    return _WHITESPACE.sub(" ", name).strip()[:max_length].strip()
+
+
+def normalize_tag_name(name: str, max_length: int = settings.TAG_MAX_LENGTH) -> str:
+    """
+    Returns the canonical form of a tag name, used to decide whether two names are the same tag.
+
+    Args:
+        name (str): The tag name as typed.
+        max_length (int): The maximum tag length.
+
+    Returns:
+        str: The cleaned, case-folded name.
+    """
+    return clean_tag_name(clean_tag_name(name, max_length).casefold(), max_length)
@@ -0,0 +1,96 @@
+from typing import Iterable, List, Tuple
+from app.src.config.config import settings
+from app.src.services.tag_normalizer import normalize_tag_name
+
+
+class _TrieNode:
+    __slots__ = ("children", "top")
+
+    def __init__(self):
+        self.children = {}
+        self.top = []
+
+
+class TagSuggestIndex:
+    """
+    In-memory prefix index for tag autocomplete.
+
+    Tags are stored in a trie keyed by the normalized tag name. Every node keeps the names of the
+    `top_k` most used tags below it, so a lookup only walks the prefix and reads one short list.
+    """
+
+    def __init__(self, top_k: int = settings.TAG_SUGGEST_TOP_K):
+        self.top_k = top_k
+        self.loaded = False
+        self._root = _TrieNode()
+        self._counts = {}
+
+    def load(self, tag_counts: Iterable[Tuple[str, int]]):
+        """
+        Rebuilds the index from scratch.
+
+        Args:
+            tag_counts (Iterable[Tuple[str, int]]): Pairs of tag name and number of photos using it.
+        """
+        counts = dict(tag_counts)
+        root = _TrieNode()
+        for name in sorted(counts, key=counts.get, reverse=True):
+            node = root
+            for char in normalize_tag_name(name):
+                node = node.children.setdefault(char, _TrieNode())
+                if len(node.top) < self.top_k:
+                    node.top.append(name)
+
+        self._root, self._counts = root, counts
+        self.loaded = True
+
+    def add_usage(self, names: Iterable[str], increment: int = 1):
+        """
+        Adds tags or bumps their usage count, keeping the per-node rankings in order.
+
+        Args:
+            names (Iterable[str]): The tag names that were used.
+            increment (int): How much to add to each tag's count.
+        """
+        for name in names:
+            self._counts[name] = self._counts.get(name, 0) + increment
+            node = self._root
+            for char in normalize_tag_name(name):
+                node = node.children.setdefault(char, _TrieNode())
+                if name not in node.top:
+                    node.top.append(name)
+                node.top.sort(key=self._counts.get, reverse=True)
+                del node.top[self.top_k:]
+
+    def count(self, name: str) -> int:
+        """
+        Returns the number of photos using a tag, as last loaded or updated.
+
+        Args:
+            name (str): The tag name.
+
+        Returns:
+            int: The usage count, 0 for unknown tags.
+        """
+        return self._counts.get(name, 0)
+
+    def suggest(self, prefix: str, limit: int) -> List[Tuple[str, int]]:
+        """
+        Returns the most used tags whose normalized name starts with the normalized `prefix`.
+
+        Args:
+            prefix (str): The typed prefix.
+            limit (int): Maximum number of suggestions, capped at `top_k`.
+
+        Returns:
+            List[Tuple[str, int]]: Pairs of tag name and usage count, most used first.
+        """
+        node = self._root
+        for char in normalize_tag_name(prefix):
+            node = node.children.get(char)
+            if node is None:
+                return []
+        return [(name, self._counts[name]) for name in node.top[:limit]]
+
+
+tag_suggest_index = TagSuggestIndex()
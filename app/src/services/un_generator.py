@@ -1,24 +1,17 @@
 from nanoid import generate
-from sqlalchemy import select
-from sqlalchemy.ext.asyncio import AsyncSession
 from app.src.config.config import settings
-from app.src.util.models import User
 
 
-async def generate_unique_username(db: AsyncSession, size=settings.USERNAME_LENGTH) -> str:
+def generate_username(size=settings.USERNAME_LENGTH) -> str:
     """
-        Generates a unique username using the nanoid library and checks for its uniqueness in the database.
+        Generates a random username using the nanoid library.
+
+        Uniqueness is not checked here; the INSERT that stores the user enforces it.
 
         Args:
-            db (AsyncSession): The database session.
-            size (int): The size of the unique username.
+            size (int): The size of the username.
 
         Returns:
-            str: A unique username.
+            str: A random username.
         """
-    while True:
-        username = generate(size=size)
-        result = await db.execute(select(User).where(User.username == username))
-        existing_user = result.scalars().first()
-        if not existing_user:
-            return username
+    return generate(size=size)
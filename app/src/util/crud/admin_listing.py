@@ -0,0 +1,216 @@
+import base64
+import json
+from datetime import datetime
+from typing import Callable, Dict, Optional
+from fastapi import HTTPException, status
+from sqlalchemy import and_, text, true, tuple_
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import lazyload, selectinload
+from sqlalchemy.future import select
+from app.src.config.config import settings
+from app.src.util.models import Photo, User
+from app.src.util.models.comment import Comment
+from app.src.util.models.moderation import ModerationQueueItem
+from app.src.util.models.rating import Rating
+
+
+class AdminListing:
+    """
+    Keyset-paginated, filterable and sortable listing of one table, shared by the admin pages.
+
+    Every sort key is backed by an index, with the row ID breaking ties for non-unique keys, so a page
+    costs the same however deep it is. Totals are the planner's estimate from `pg_class.reltuples`
+    rather than a `COUNT(*)` over the table.
+
+    Args:
+        query (Select): The base query, selecting the listed entity and its eager loads.
+        table (str): The table whose row estimate is shown as the total.
+        id_column: The primary key column.
+        sort_columns (Dict[str, tuple]): Attribute name to `(sort expression, unique)`; the first one
+            is the default sort.
+        filters (Dict[str, Callable]): Filter name to a function building the condition from a value.
+        page_size (int): The number of rows per page.
+    """
+
+    def __init__(self, query, table: str, id_column, sort_columns: Dict[str, tuple],
+                 filters: Dict[str, Callable], page_size: int = settings.ADMIN_PAGE_SIZE):
+        self.query = query
+        self.table = table
+        self.id_column = id_column
+        self.sort_columns = sort_columns
+        self.filters = filters
+        self.page_size = page_size
+
+    async def page(self, db: AsyncSession, sort: Optional[str] = None, order: str = "desc",
+                   cursor: Optional[str] = None, **filter_values) -> dict:
+        """
+        Retrieves one page of the listing.
+
+        Args:
+            db (AsyncSession): The database session.
+            sort (Optional[str]): One of the sort names; the default sort when omitted.
+            order (str): "asc" or "desc".
+            cursor (Optional[str]): The `next_cursor` of the previous page; the first page when omitted.
+            **filter_values: Values of the listing's filters; None leaves a filter out.
+
+        Returns:
+            dict: "items", "next_cursor" (None on the last page), "estimated_total", and the
+            effective "sort" and "order".
+
+        Raises:
+            HTTPException: If the sort, order or cursor is invalid.
+        """
+        sort = sort or next(iter(self.sort_columns))
+        if sort not in self.sort_columns or order not in ("asc", "desc"):
+            raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Invalid sort")
+        column, unique = self.sort_columns[sort]
+        keys = [column] if unique else [column, self.id_column]
+        attributes = [sort] if unique else [sort, self.id_column.key]
+
+        query = self.query
+        for name, value in filter_values.items():
+            if value is not None and value != "":
+                query = query.where(self.filters[name](value))
+        query = query.order_by(*(key.asc() if order == "asc" else key.desc() for key in keys))
+
+        values = self.decode_cursor(cursor, keys) if cursor is not None else None
+        items = []
+        for condition in self.keyset_conditions(keys, order, values):
+            result = await db.execute(query.where(condition).limit(self.page_size + 1 - len(items)))
+            items += result.scalars().all()
+            if len(items) > self.page_size:
+                break
+        next_cursor = None
+        if len(items) > self.page_size:
+            items = items[:self.page_size]
+            next_cursor = self.encode_cursor(items[-1], attributes)
+
+        return {
+            "items": items,
+            "next_cursor": next_cursor,
+            "estimated_total": await estimate_rows(db, self.table),
+            "sort": sort,
+            "order": order,
+        }
+
+    @staticmethod
+    def keyset_conditions(keys: list, order: str, values: Optional[list]) -> list:
+        """
+        Builds the conditions selecting the rows after a cursor, to be queried in turn until the page is full.
+
+        Postgres sorts NULLs as the largest values: last in ascending and first in descending order, which is
+        also how an index on the sort key returns them. A row comparison involving NULL is never true, so a
+        nullable sort key splits the rows into a NULL and a non-NULL run, each an index range of its own.
+
+        Args:
+            keys (list): The sort expressions; a non-unique key is followed by the primary key.
+            order (str): "asc" or "desc".
+            values (Optional[list]): The decoded cursor; None for the first page.
+
+        Returns:
+            list: The conditions, in page order.
+        """
+        def after(position, cursor_values):
+            return position > cursor_values if order == "asc" else position < cursor_values
+
+        column = keys[0]
+        if len(keys) == 1 or not getattr(column, "nullable", False):
+            return [true() if values is None else after(tuple_(*keys), tuple_(*values))]
+
+        runs = [column.is_(None), column.isnot(None)]
+        if order == "asc":
+            runs.reverse()
+        if values is None:
+            return runs
+        if values[0] is None:
+            conditions = [and_(column.is_(None), after(keys[1], values[1]))]
+            return conditions + ([column.isnot(None)] if order == "desc" else [])
+        conditions = [after(tuple_(*keys), tuple_(*values))]
+        return conditions + ([column.is_(None)] if order == "asc" else [])
+
+    @staticmethod
+    def encode_cursor(item, attributes: list) -> str:
+        values = [getattr(item, attribute) for attribute in attributes]
+        values = [value.isoformat() if isinstance(value, datetime) else value for value in values]
+        return base64.urlsafe_b64encode(json.dumps(values).encode()).decode()
+
+    @staticmethod
+    def decode_cursor(cursor: str, keys: list) -> list:
+        try:
+            values = json.loads(base64.urlsafe_b64decode(cursor.encode()))
+            if len(values) != len(keys):
+                raise ValueError(cursor)
+            return [datetime.fromisoformat(value) if value is not None and key.type.python_type is datetime else value
+                    for key, value in zip(keys, values)]
+        except (ValueError, TypeError):
+            raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Invalid cursor")
+
+
+async def estimate_rows(db: AsyncSession, table: str) -> Optional[int]:
+    """
+    Reads the planner's row estimate of a table, kept up to date by autovacuum.
+
+    Args:
+        db (AsyncSession): The database session.
+        table (str): The table name.
+
+    Returns:
+        Optional[int]: The estimated number of rows, None if the table was never analyzed.
+    """
+    result = await db.execute(
+        text("SELECT reltuples::bigint FROM pg_class WHERE oid = to_regclass(:table)"), {"table": table}
+    )
+    estimate = result.scalar()
+    return estimate if estimate is not None and estimate >= 0 else None
+
+
+def user_id_by_username(username: str):
+    return select(User.id).where(User.username == username).scalar_subquery()
+
+
+active_users_listing = AdminListing(
+    select(User).where(User.is_active == True),
+    table="users",
+    id_column=User.id,
+    sort_columns={"username": (User.username.collate("C"), True), "id": (User.id, True)},
+    filters={
+        "user": lambda prefix: User.username.collate("C").startswith(prefix, autoescape=True),
+        "exclude_id": lambda user_id: User.id != user_id,
+    },
+)
+
+photos_listing = AdminListing(
+    select(Photo).options(lazyload(Photo.owner), lazyload(Photo.tags)),
+    table="photos",
+    id_column=Photo.id,
+    sort_columns={"id": (Photo.id, True)},
+    filters={"user": lambda username: Photo.user_id == user_id_by_username(username)},
+)
+
+ratings_listing = AdminListing(
+    select(Rating).options(
+        selectinload(Rating.photo).options(lazyload(Photo.owner), lazyload(Photo.tags)),
+        selectinload(Rating.owner),
+    ),
+    table="ratings",
+    id_column=Rating.id,
+    sort_columns={"created_at": (Rating.created_at, False), "rating": (Rating.rating, False), "id": (Rating.id, True)},
+    filters={
+        "user": lambda username: Rating.user_id == user_id_by_username(username),
+        "created_from": lambda created_from: Rating.created_at >= created_from,
+        "created_to": lambda created_to: Rating.created_at < created_to,
+        "rating": lambda rating: Rating.rating == rating,
+    },
+)
+
+moderation_queue_listing = AdminListing(
+    select(ModerationQueueItem).join(Comment, Comment.id == ModerationQueueItem.comment_id),
+    table="moderation_queue",
+    id_column=ModerationQueueItem.id,
+    sort_columns={"id": (ModerationQueueItem.id, True)},
+    filters={
+        "user": lambda username: Comment.user_id == user_id_by_username(username),
+        "created_from": lambda created_from: Comment.created_at >= created_from,
+        "created_to": lambda created_to: Comment.created_at < created_to,
+    },
+)
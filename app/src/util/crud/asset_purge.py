@@ -0,0 +1,77 @@
+import asyncio
+from datetime import datetime, timedelta
+import cloudinary.api
+from sqlalchemy import delete
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.future import select
+from app.src.config.config import settings
+from app.src.config.logging_config import logger
+from app.src.util.db import get_db
+from app.src.util.models import AssetPurge
+
+# Cloudinary accepts at most 100 public IDs per delete_resources call.
+MAX_IDS_PER_CALL = 100
+MAX_RETRY_DELAY = timedelta(hours=6)
+
+
+def retry_delay(attempts: int) -> timedelta:
+    return min(timedelta(seconds=30 * 2 ** attempts), MAX_RETRY_DELAY)
+
+
+async def purge_batch(db: AsyncSession) -> int:
+    """
+    Deletes one batch of queued images from Cloudinary and settles their outbox entries.
+
+    The entries are locked with `SKIP LOCKED`, so several workers never purge the same image. Images
+    Cloudinary reports as deleted or not found leave the outbox; the others are retried later with
+    exponential backoff, up to `ASSET_PURGE_MAX_ATTEMPTS` times.
+
+    Args:
+        db (AsyncSession): The database session.
+
+    Returns:
+        int: The number of entries handled, 0 when nothing is due.
+    """
+    result = await db.execute(
+        select(AssetPurge)
+        .where(AssetPurge.next_attempt_at <= datetime.utcnow(),
+               AssetPurge.attempts < settings.ASSET_PURGE_MAX_ATTEMPTS)
+        .order_by(AssetPurge.id)
+        .limit(min(settings.ASSET_PURGE_BATCH_SIZE, MAX_IDS_PER_CALL))
+        .with_for_update(skip_locked=True)
+    )
+    entries = result.scalars().all()
+    if not entries:
+        await db.rollback()
+        return 0
+
+    public_ids = [entry.public_id for entry in entries]
+    try:
+        # Derived images (resized, filtered) are deleted together with their original.
+        response = await asyncio.to_thread(cloudinary.api.delete_resources, public_ids, invalidate=True)
+        statuses = response.get("deleted", {})
+        error = "Not deleted"
+    except Exception as e:
+        logger.warning(f"Purging {len(public_ids)} images from Cloudinary failed: {e}")
+        statuses = {}
+        error = str(e)[:500]
+
+    purged = [public_id for public_id in public_ids if statuses.get(public_id) in ("deleted", "not_found")]
+    if purged:
+        await db.execute(delete(AssetPurge).where(AssetPurge.public_id.in_(purged)))
+    for entry in entries:
+        if entry.public_id not in purged:
+            entry.next_attempt_at = datetime.utcnow() + retry_delay(entry.attempts)
+            entry.attempts += 1
+            entry.last_error = statuses.get(entry.public_id) or error
+    await db.commit()
+    return len(entries)
+
+
+async def purge_assets():
+    """
+    Background job that drains the asset purge outbox, one `delete_resources` call per batch.
+    """
+    async for session in get_db():
+        while await purge_batch(session) == min(settings.ASSET_PURGE_BATCH_SIZE, MAX_IDS_PER_CALL):
+            pass
@@ -0,0 +1,243 @@
+from datetime import datetime
+from typing import List, Optional
+from fastapi import HTTPException, status
+from sqlalchemy import Integer, any_, delete, func, literal, update
+from sqlalchemy.dialects.postgresql import ARRAY, insert
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.future import select
+from app.src.config.config import settings
+from app.src.config.logging_config import log_function
+from app.src.services.profile_cache import profile_cache
+from app.src.util.crud.rating import RATING_VALUES
+from app.src.util.models import AssetPurge, Photo, User
+from app.src.util.models.comment import Comment
+from app.src.util.models.rating import Rating
+
+RATING_AGGREGATE_COLUMNS = ["rating_count", "rating_sum"] + [f"rating_count_{stars}" for stars in RATING_VALUES]
+
+
+def id_in(column, ids: List[int]):
+    """
+    Builds `column = ANY(:ids)`, which sends the IDs as one array parameter however many there are.
+
+    Args:
+        column: The ID column.
+        ids (List[int]): The IDs.
+
+    Returns:
+        ColumnElement: The condition.
+    """
+    return column == any_(literal(ids, ARRAY(Integer)))
+
+
+def chunks(ids: List[int], size: int = settings.BULK_DELETE_CHUNK_SIZE):
+    for start in range(0, len(ids), size):
+        yield ids[start:start + size]
+
+
+async def select_ids(db: AsyncSession, model, ids: Optional[List[int]] = None, user_id: Optional[int] = None,
+                     created_from: Optional[datetime] = None, created_to: Optional[datetime] = None) -> List[int]:
+    """
+    Resolves bulk delete criteria to the IDs of the existing rows that match all of them.
+
+    Args:
+        db (AsyncSession): The database session.
+        model: The mapped class, with `id`, `user_id` and optionally `created_at` columns.
+        ids (Optional[List[int]]): Only consider these IDs.
+        user_id (Optional[int]): Only rows of this user.
+        created_from (Optional[datetime]): Only rows created at or after this time.
+        created_to (Optional[datetime]): Only rows created before this time.
+
+    Returns:
+        List[int]: The matching IDs, ascending.
+
+    Raises:
+        HTTPException: If no criteria are given, or a date range is given for rows without a timestamp.
+    """
+    if ids is None and user_id is None and created_from is None and created_to is None:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Give IDs or at least one filter")
+
+    query = select(model.id).order_by(model.id)
+    if ids is not None:
+        query = query.where(id_in(model.id, ids))
+    if user_id is not None:
+        query = query.where(model.user_id == user_id)
+    if created_from is not None or created_to is not None:
+        created_at = getattr(model, "created_at", None)
+        if created_at is None:
+            raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST,
+                                detail=f"{model.__tablename__} cannot be filtered by date")
+        if created_from is not None:
+            query = query.where(created_at >= created_from)
+        if created_to is not None:
+            query = query.where(created_at < created_to)
+
+    result = await db.execute(query)
+    return result.scalars().all()
+
+
+async def delete_ratings_by_ids(db: AsyncSession, rating_ids: List[int]) -> int:
+    """
+    Deletes ratings and takes them out of their photos' aggregates and histograms.
+
+    Each chunk is one statement: the `DELETE ... RETURNING` feeds a grouped CTE that decrements the
+    photo counters. Does not commit.
+
+    Args:
+        db (AsyncSession): The database session.
+        rating_ids (List[int]): The IDs of the ratings.
+
+    Returns:
+        int: The number of deleted ratings.
+    """
+    deleted_count = 0
+    for chunk in chunks(rating_ids):
+        deleted = (
+            delete(Rating)
+            .where(id_in(Rating.id, chunk))
+            .returning(Rating.photo_id, Rating.rating)
+            .cte("deleted")
+        )
+        totals = (
+            select(
+                deleted.c.photo_id,
+                func.count().label("rating_count"),
+                func.sum(deleted.c.rating).label("rating_sum"),
+                *(func.count().filter(deleted.c.rating == stars).label(f"rating_count_{stars}")
+                  for stars in RATING_VALUES),
+            )
+            .group_by(deleted.c.photo_id)
+            .cte("totals")
+        )
+        updated = (
+            update(Photo)
+            .where(Photo.id == totals.c.photo_id)
+            .values({column: getattr(Photo, column) - totals.c[column] for column in RATING_AGGREGATE_COLUMNS})
+            .returning(Photo.id)
+            .cte("updated")
+        )
+        result = await db.execute(select(func.count()).select_from(deleted).add_cte(updated))
+        deleted_count += result.scalar()
+    return deleted_count
+
+
+async def delete_comments_by_ids(db: AsyncSession, comment_ids: List[int]) -> int:
+    """
+    Deletes comments in chunks; their moderation queue entries go with them. Does not commit.
+
+    Args:
+        db (AsyncSession): The database session.
+        comment_ids (List[int]): The IDs of the comments.
+
+    Returns:
+        int: The number of deleted comments.
+    """
+    deleted_count = 0
+    for chunk in chunks(comment_ids):
+        result = await db.execute(delete(Comment).where(id_in(Comment.id, chunk)))
+        deleted_count += result.rowcount
+    return deleted_count
+
+
+async def delete_photos_by_ids(db: AsyncSession, photo_ids: List[int]) -> dict:
+    """
+    Deletes photos with their comments and ratings, and lowers their owners' `photos_uploaded`.
+
+    Tag links and leaderboard entries are removed by their foreign keys. The images are queued in
+    the asset purge outbox by the same statement that deletes the photos, and the owners' cached
+    profiles are dropped once the transaction commits. Does not commit.
+
+    Args:
+        db (AsyncSession): The database session.
+        photo_ids (List[int]): The IDs of the photos.
+
+    Returns:
+        dict: The number of deleted photos, comments and ratings.
+    """
+    counts = {"photos": 0, "comments": 0, "ratings": 0}
+    for chunk in chunks(photo_ids):
+        result = await db.execute(delete(Comment).where(id_in(Comment.photo_id, chunk)))
+        counts["comments"] += result.rowcount
+        result = await db.execute(delete(Rating).where(id_in(Rating.photo_id, chunk)))
+        counts["ratings"] += result.rowcount
+
+        deleted = (
+            delete(Photo)
+            .where(id_in(Photo.id, chunk))
+            .returning(Photo.user_id, Photo.public_id)
+            .cte("deleted")
+        )
+        # Column defaults are not applied to an INSERT inside a CTE, so every column is given here.
+        now = datetime.utcnow()
+        queued = (
+            insert(AssetPurge)
+            .from_select(
+                ["public_id", "attempts", "next_attempt_at", "created_at"],
+                select(deleted.c.public_id, literal(0), literal(now), literal(now))
+                .where(deleted.c.public_id.isnot(None)),
+            )
+            .on_conflict_do_nothing(index_elements=[AssetPurge.public_id])
+            .returning(AssetPurge.id)
+            .cte("queued")
+        )
+        per_user = (
+            select(deleted.c.user_id, func.count().label("photo_count"))
+            .group_by(deleted.c.user_id)
+            .cte("per_user")
+        )
+        updated = (
+            update(User)
+            .where(User.id == per_user.c.user_id)
+            .values(photos_uploaded=User.photos_uploaded - per_user.c.photo_count)
+            .returning(User.id)
+            .cte("updated")
+        )
+        result = await db.execute(select(per_user.c.user_id, per_user.c.photo_count).add_cte(updated, queued))
+        for user_id, photo_count in result.all():
+            counts["photos"] += photo_count
+            profile_cache.invalidate_after_commit(db, user_id)
+    return counts
+
+
+@log_function
+async def bulk_delete_comments(db: AsyncSession, **criteria) -> dict:
+    """
+    Deletes all comments matching the criteria of `select_ids` in one transaction.
+
+    Returns:
+        dict: The number of deleted comments.
+    """
+    comment_ids = await select_ids(db, Comment, **criteria)
+    counts = {"comments": await delete_comments_by_ids(db, comment_ids)}
+    await db.commit()
+    return counts
+
+
+@log_function
+async def bulk_delete_ratings(db: AsyncSession, **criteria) -> dict:
+    """
+    Deletes all ratings matching the criteria of `select_ids` in one transaction, keeping the photo
+    rating aggregates consistent.
+
+    Returns:
+        dict: The number of deleted ratings.
+    """
+    rating_ids = await select_ids(db, Rating, **criteria)
+    counts = {"ratings": await delete_ratings_by_ids(db, rating_ids)}
+    await db.commit()
+    return counts
+
+
+@log_function
+async def bulk_delete_photos(db: AsyncSession, **criteria) -> dict:
+    """
+    Deletes all photos matching the criteria of `select_ids` in one transaction, keeping the owners'
+    photo counters consistent.
+
+    Returns:
+        dict: The number of deleted photos, comments and ratings.
+    """
+    photo_ids = await select_ids(db, Photo, **criteria)
+    counts = await delete_photos_by_ids(db, photo_ids)
+    await db.commit()
+    return counts
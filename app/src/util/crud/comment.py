@@ -1,8 +1,15 @@
+from typing import Optional
 from fastapi import HTTPException, status
+from sqlalchemy import tuple_
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import selectinload, lazyload
 from datetime import datetime
+from app.src.config.config import settings
 from app.src.config.logging_config import log_function
+from app.src.services.event_broker import photo_event_broker
 from app.src.util.crud.photo import get_photo
+from app.src.util.crud.moderation import moderate_comment, comment_is_visible, HELD
+from app.src.util.models import User
 from app.src.util.models.comment import Comment
 from app.src.util.schemas.comment import CommentUpdate
 from sqlalchemy.future import select
@@ -13,6 +20,9 @@ async def create_comment(db: AsyncSession, comment: str, user_id: int, photo_id:
     """
     Creates a new comment in the database.
 
+    The content is scanned for banned terms; matching comments are queued for moderation and,
+    for terms that hold, hidden until a moderator approves them.
+
     Parameters:
     db (AsyncSession): The database session.
     comment (CommentCreate): The comment data.
@@ -35,39 +45,88 @@ async def create_comment(db: AsyncSession, comment: str, user_id: int, photo_id:
         user_id=user_id
     )
     db.add(new_comment)
+    await db.flush()
+    if await moderate_comment(db, new_comment) != HELD:
+        author = await db.get(User, user_id)
+        await photo_event_broker.publish(db, photo_id, {
+            "type": "comment_created",
+            "id": new_comment.id,
+            "username": author.username,
+            "content": new_comment.content,
+        })
     await db.commit()
     await db.refresh(new_comment)
     return new_comment
 
 
+def encode_comment_cursor(comment: Comment) -> str:
+    """
+    Builds the pagination cursor pointing right after a comment.
+
+    Args:
+        comment (Comment): The last comment of a page.
+
+    Returns:
+        str: The cursor, the comment's creation time and ID.
+    """
+    return f"{comment.created_at.isoformat()},{comment.id}"
+
+
+def decode_comment_cursor(cursor: str) -> tuple:
+    """
+    Parses a cursor built by `encode_comment_cursor`.
+
+    Args:
+        cursor (str): The cursor.
+
+    Returns:
+        tuple: The creation time and ID of the last comment of the previous page.
+
+    Raises:
+        HTTPException: If the cursor is malformed.
+    """
+    try:
+        created_at, comment_id = cursor.rsplit(",", 1)
+        return datetime.fromisoformat(created_at), int(comment_id)
+    except ValueError:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Invalid cursor")
+
+
 @log_function
-async def get_comments(db: AsyncSession, photo_id: int):
+async def get_comments(db: AsyncSession, photo_id: int, cursor: Optional[str] = None,
+                       limit: int = settings.COMMENT_PAGE_SIZE) -> tuple:
     """
-    Retrieve all comments for a specific photo.
+    Retrieve one page of comments for a specific photo, oldest first, using keyset pagination.
+
+    Pages are read through the `(photo_id, created_at, id)` index, so the cost does not depend on how
+    many comments the photo has or how deep the page is. Comments held for moderation are left out.
 
     Args:
         db (AsyncSession): The database session.
         photo_id (int): The ID of the photo.
+        cursor (Optional[str]): The `next_cursor` of the previous page; the first page when omitted.
+        limit (int): The page size.
 
     Returns:
-        List[Comment]: A list of comments for the photo.
+        tuple: The comments of the page and the cursor for the next page, or None on the last page.
 
     Raises:
-        HTTPException: If the photo is not found or if there is a database error.
+        HTTPException: If the cursor is malformed.
     """
-    try:
+    query = (
+        select(Comment)
+        .where(Comment.photo_id == photo_id, comment_is_visible())
+        .options(selectinload(Comment.user), lazyload(Comment.photo))
+        .order_by(Comment.created_at, Comment.id)
+        .limit(limit + 1)
+    )
+    if cursor is not None:
+        query = query.where(tuple_(Comment.created_at, Comment.id) > decode_comment_cursor(cursor))
 
-        photo_result = await get_photo(db, photo_id)
-        if not photo_result:
-            raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Photo not found")
-        comments_result = await db.execute(select(Comment).filter(Comment.photo_id == photo_id))
-        comments = comments_result.scalars().all()
-        return comments
-
-    except HTTPException as http_exc:
-        raise http_exc
-    except Exception as e:
-        raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail=str(e))
+    result = await db.execute(query)
+    comments = result.scalars().all()
+    next_cursor = encode_comment_cursor(comments[limit - 1]) if len(comments) > limit else None
+    return comments[:limit], next_cursor
 
 
 @log_function
@@ -75,6 +134,8 @@ async def update_comment(db: AsyncSession, comment_id: int, comment: CommentUpda
     """
     Update an existing comment in the database.
 
+    The new content is scanned for banned terms again, which can queue, hold or release the comment.
+
     Args:
         db (Session): The database session.
         comment_id (int): The ID of the comment to update.
@@ -89,6 +150,15 @@ async def update_comment(db: AsyncSession, comment_id: int, comment: CommentUpda
     if db_comment:
         db_comment.content = comment.content
         db_comment.updated_at = datetime.utcnow()
+        await db.flush()
+        if await moderate_comment(db, db_comment) == HELD:
+            await photo_event_broker.publish(db, db_comment.photo_id, {"type": "comment_deleted", "id": db_comment.id})
+        else:
+            await photo_event_broker.publish(db, db_comment.photo_id, {
+                "type": "comment_updated",
+                "id": db_comment.id,
+                "content": db_comment.content,
+            })
         await db.commit()
         await db.refresh(db_comment)
     return db_comment
@@ -140,6 +210,7 @@ async def delete_comment(db: AsyncSession, comment_id: int):
     db_comment = await get_comment_by_id(db, comment_id)
 
     await db.delete(db_comment)
+    await photo_event_broker.publish(db, db_comment.photo_id, {"type": "comment_deleted", "id": db_comment.id})
     await db.commit()
     return db_comment
 
@@ -0,0 +1,106 @@
+import csv
+import io
+import json
+from typing import AsyncIterator, List
+from sqlalchemy.future import select
+from app.src.config.config import settings
+from app.src.util.db import AsyncSessionLocal
+from app.src.util.models import Photo, User
+from app.src.util.models.comment import Comment
+from app.src.util.models.rating import Rating
+
+EXPORT_FORMATS = {
+    "csv": "text/csv",
+    "ndjson": "application/x-ndjson",
+}
+
+
+def export_query(kind: str):
+    """
+    Builds the query of an export: plain columns, joined with the usernames, in ID order. Rows without a
+    user are kept, without a username.
+
+    Args:
+        kind (str): "ratings", "comments" or "photos".
+
+    Returns:
+        Select: The query.
+    """
+    if kind == "ratings":
+        return (
+            select(Rating.id, Rating.rating, Rating.photo_id, Rating.user_id, User.username, Rating.created_at)
+            .outerjoin(User, User.id == Rating.user_id)
+            .order_by(Rating.id)
+        )
+    if kind == "comments":
+        return (
+            select(Comment.id, Comment.photo_id, Comment.user_id, User.username, Comment.content,
+                   Comment.created_at, Comment.updated_at)
+            .outerjoin(User, User.id == Comment.user_id)
+            .order_by(Comment.id)
+        )
+    if kind == "photos":
+        return (
+            select(Photo.id, Photo.user_id, User.username, Photo.description, Photo.url, Photo.public_id,
+                   Photo.rating_count, Photo.rating_sum)
+            .outerjoin(User, User.id == Photo.user_id)
+            .order_by(Photo.id)
+        )
+    raise ValueError(f"Unknown export: {kind}")
+
+
+async def stream_row_batches(query, batch_size: int = settings.EXPORT_BATCH_SIZE) -> AsyncIterator[List[dict]]:
+    """
+    Runs a query over a server-side cursor and yields its rows in batches.
+
+    Uses its own session, held for the whole iteration: a streaming response outlives the
+    request's `get_db` session.
+
+    Args:
+        query (Select): The query.
+        batch_size (int): The number of rows fetched per round trip.
+
+    Yields:
+        List[dict]: The rows of a batch, as column name to value mappings.
+    """
+    async with AsyncSessionLocal() as session:
+        result = await session.stream(query.execution_options(yield_per=batch_size))
+        async for partition in result.mappings().partitions():
+            yield partition
+
+
+def encode_csv(rows: List[dict], fieldnames: List[str], header: bool = False) -> str:
+    buffer = io.StringIO()
+    writer = csv.DictWriter(buffer, fieldnames=fieldnames)
+    if header:
+        writer.writeheader()
+    writer.writerows(rows)
+    return buffer.getvalue()
+
+
+def encode_ndjson(rows: List[dict]) -> str:
+    return "".join(json.dumps(dict(row), default=str) + "\n" for row in rows)
+
+
+async def export_rows(kind: str, export_format: str) -> AsyncIterator[str]:
+    """
+    Encodes an export batch by batch, so memory use does not depend on the table size and the
+    first rows are sent before the query has finished.
+
+    Args:
+        kind (str): "ratings", "comments" or "photos".
+        export_format (str): "csv" or "ndjson".
+
+    Yields:
+        str: Encoded chunks of the export.
+    """
+    query = export_query(kind)
+    fieldnames = list(query.selected_columns.keys())
+    if export_format == "csv":
+        # Sent up front, so an empty table still exports its header.
+        yield encode_csv([], fieldnames, header=True)
+    async for rows in stream_row_batches(query):
+        if export_format == "csv":
+            yield encode_csv(rows, fieldnames)
+        else:
+            yield encode_ndjson(rows)
@@ -0,0 +1,35 @@
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.src.util.models.job import JobCheckpoint
+
+
+async def get_job_position(db: AsyncSession, name: str) -> int:
+    """
+    Retrieves how far an incremental background job has progressed.
+
+    Args:
+        db (AsyncSession): The database session.
+        name (str): The name of the job.
+
+    Returns:
+        int: The last processed source row ID, 0 if the job never ran.
+    """
+    checkpoint = await db.get(JobCheckpoint, name)
+    return checkpoint.position if checkpoint else 0
+
+
+async def set_job_position(db: AsyncSession, name: str, position: int):
+    """
+    Stores the progress of an incremental background job in the caller's transaction.
+
+    Args:
+        db (AsyncSession): The database session.
+        name (str): The name of the job.
+        position (int): The last processed source row ID.
+    """
+    stmt = insert(JobCheckpoint).values(name=name, position=position)
+    stmt = stmt.on_conflict_do_update(
+        index_elements=[JobCheckpoint.name],
+        set_={"position": stmt.excluded.position, "updated_at": stmt.excluded.updated_at}
+    )
+    await db.execute(stmt)
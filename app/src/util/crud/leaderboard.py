@@ -0,0 +1,132 @@
+from datetime import datetime, timedelta
+from sqlalchemy import delete, func, literal
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.future import select
+from app.src.config.config import settings
+from app.src.util.db import get_db
+from app.src.util.models import Photo
+from app.src.util.models.leaderboard import LeaderboardEntry
+from app.src.util.models.rating import Rating
+
+LEADERBOARD_PERIODS = {
+    "day": timedelta(days=1),
+    "week": timedelta(weeks=1),
+    "all": None,
+}
+
+
+async def get_leaderboard(db: AsyncSession, period: str, limit: int = settings.LEADERBOARD_SIZE) -> list:
+    """
+    Retrieves the latest snapshot of a top-rated photos ranking.
+
+    Reads the first `limit` rows of the period by primary key; no ratings are aggregated here.
+
+    Args:
+        db (AsyncSession): The database session.
+        period (str): One of `LEADERBOARD_PERIODS`.
+        limit (int): Maximum number of entries.
+
+    Returns:
+        list: `LeaderboardEntry` objects with their photo loaded, best first.
+    """
+    result = await db.execute(
+        select(LeaderboardEntry)
+        .where(LeaderboardEntry.period == period)
+        .order_by(LeaderboardEntry.rank)
+        .limit(limit)
+    )
+    return result.scalars().all()
+
+
+async def rank_photos(db: AsyncSession, period: str, limit: int = settings.LEADERBOARD_SIZE) -> list:
+    """
+    Ranks photos by the Bayesian average of the ratings they received in a period.
+
+    The score `(C * m + sum) / (C + count)` pulls photos with few ratings towards the mean rating `m`
+    of the period, so a single 5-star vote cannot top the ranking. `C` is `LEADERBOARD_PRIOR_WEIGHT`.
+    The all-time ranking reads the per-photo aggregates on `photos`; shorter periods aggregate the
+    `ratings` given since the start of the window.
+
+    Args:
+        db (AsyncSession): The database session.
+        period (str): One of `LEADERBOARD_PERIODS`.
+        limit (int): Number of photos to rank.
+
+    Returns:
+        list: Rows of `photo_id`, `rating_count`, `rating_sum` and `score`, best first.
+    """
+    window = LEADERBOARD_PERIODS[period]
+    if window is None:
+        aggregates = (
+            select(Photo.id.label("photo_id"), Photo.rating_count, Photo.rating_sum)
+            .where(Photo.rating_count > 0)
+            .subquery()
+        )
+    else:
+        aggregates = (
+            select(
+                Rating.photo_id,
+                func.count(Rating.id).label("rating_count"),
+                func.sum(Rating.rating).label("rating_sum"),
+            )
+            .where(Rating.created_at >= datetime.utcnow() - window)
+            .group_by(Rating.photo_id)
+            .subquery()
+        )
+
+    totals = (await db.execute(
+        select(func.sum(aggregates.c.rating_sum), func.sum(aggregates.c.rating_count))
+    )).first()
+    if not totals[1]:
+        return []
+
+    prior_weight = settings.LEADERBOARD_PRIOR_WEIGHT
+    prior_mean = float(totals[0]) / float(totals[1])
+    score = (
+        (literal(prior_weight * prior_mean) + aggregates.c.rating_sum)
+        / (literal(prior_weight) + aggregates.c.rating_count)
+    ).label("score")
+    result = await db.execute(
+        select(aggregates.c.photo_id, aggregates.c.rating_count, aggregates.c.rating_sum, score)
+        .order_by(score.desc(), aggregates.c.photo_id)
+        .limit(limit)
+    )
+    return result.all()
+
+
+async def refresh_leaderboard(db: AsyncSession, period: str):
+    """
+    Replaces the stored snapshot of one ranking with a freshly computed one.
+
+    The old rows are deleted and the new ones inserted in the same transaction, so readers always see
+    a complete ranking.
+
+    Args:
+        db (AsyncSession): The database session.
+        period (str): One of `LEADERBOARD_PERIODS`.
+    """
+    rows = await rank_photos(db, period)
+    computed_at = datetime.utcnow()
+    await db.execute(delete(LeaderboardEntry).where(LeaderboardEntry.period == period))
+    db.add_all([
+        LeaderboardEntry(
+            period=period,
+            rank=rank,
+            photo_id=row.photo_id,
+            score=round(float(row.score), 4),
+            rating_count=row.rating_count,
+            average_rating=round(row.rating_sum / row.rating_count, 2),
+            computed_at=computed_at,
+        )
+        for rank, row in enumerate(rows, start=1)
+    ])
+    await db.commit()
+
+
+async def refresh_leaderboards():
+    """
+    Background job that recomputes the snapshots of every leaderboard period.
+    """
+    async for session in get_db():
+        for period in LEADERBOARD_PERIODS:
+            await refresh_leaderboard(session, period)
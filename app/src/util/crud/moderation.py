@@ -0,0 +1,178 @@
+from typing import Optional
+from fastapi import HTTPException, status
+from sqlalchemy import delete, exists
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.future import select
+from app.src.config.logging_config import log_function
+from app.src.services.event_broker import photo_event_broker
+from app.src.services.moderation import moderation_filter, normalize_term
+from app.src.util.db import get_db
+from app.src.util.models import User
+from app.src.util.models.comment import Comment
+from app.src.util.models.moderation import BannedTerm, ModerationQueueItem
+
+HELD = "held"
+
+
+def comment_is_visible():
+    """
+    Returns a filter that leaves out comments held for moderation.
+
+    Returns:
+        ColumnElement: A `NOT EXISTS` condition on `moderation_queue` for `Comment`.
+    """
+    return ~exists().where(ModerationQueueItem.comment_id == Comment.id, ModerationQueueItem.status == HELD)
+
+
+async def moderate_comment(db: AsyncSession, comment: Comment) -> Optional[str]:
+    """
+    Scans a new or edited comment for banned terms and queues or releases it accordingly.
+
+    Does not commit; call it in the same transaction as the change to the comment, after a flush.
+
+    Args:
+        db (AsyncSession): The database session.
+        comment (Comment): The comment, with an ID.
+
+    Returns:
+        Optional[str]: "held" or "flagged" when the comment was queued, None when it is clean.
+    """
+    verdict, matched_terms = moderation_filter.verdict(comment.content)
+    if verdict is None:
+        await db.execute(delete(ModerationQueueItem).where(ModerationQueueItem.comment_id == comment.id))
+        return None
+
+    await db.execute(
+        insert(ModerationQueueItem)
+        .values(comment_id=comment.id, status=verdict, matched_terms=matched_terms)
+        .on_conflict_do_update(
+            index_elements=[ModerationQueueItem.comment_id],
+            set_={"status": verdict, "matched_terms": matched_terms},
+        )
+    )
+    return verdict
+
+
+@log_function
+async def approve_comment(db: AsyncSession, comment_id: int):
+    """
+    Removes a comment from the moderation queue. A held comment is published and announced to the
+    viewers of its photo, as if it had just been posted.
+
+    Args:
+        db (AsyncSession): The database session.
+        comment_id (int): The ID of the comment.
+
+    Raises:
+        HTTPException: If the comment is not in the queue.
+    """
+    result = await db.execute(
+        delete(ModerationQueueItem)
+        .where(ModerationQueueItem.comment_id == comment_id)
+        .returning(ModerationQueueItem.status)
+    )
+    verdict = result.scalar()
+    if verdict is None:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Comment is not awaiting moderation")
+    if verdict == HELD:
+        # Held comments were never shown on the live photo page; flagged ones already were.
+        result = await db.execute(
+            select(Comment.photo_id, Comment.content, User.username)
+            .outerjoin(User, User.id == Comment.user_id)
+            .where(Comment.id == comment_id)
+        )
+        comment = result.one()
+        await photo_event_broker.publish(db, comment.photo_id, {
+            "type": "comment_created",
+            "id": comment_id,
+            "username": comment.username,
+            "content": comment.content,
+        })
+    await db.commit()
+
+
+async def get_banned_terms(db: AsyncSession) -> list:
+    """
+    Retrieves all banned terms, alphabetically.
+
+    Args:
+        db (AsyncSession): The database session.
+
+    Returns:
+        list: `BannedTerm` objects.
+    """
+    result = await db.execute(select(BannedTerm).order_by(BannedTerm.term))
+    return result.scalars().all()
+
+
+@log_function
+async def add_banned_term(db: AsyncSession, term: str, action: str) -> BannedTerm:
+    """
+    Adds a banned term, or changes the action of an existing one, and reloads the filter.
+
+    Args:
+        db (AsyncSession): The database session.
+        term (str): The word or phrase.
+        action (str): "flag" or "hold".
+
+    Returns:
+        BannedTerm: The stored term.
+
+    Raises:
+        HTTPException: If the term is empty.
+    """
+    term = normalize_term(term)
+    if not term:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Term must not be empty")
+
+    result = await db.execute(
+        insert(BannedTerm)
+        .values(term=term, action=action)
+        .on_conflict_do_update(index_elements=[BannedTerm.term], set_={"action": action})
+        .returning(BannedTerm)
+    )
+    banned_term = result.scalar_one()
+    await db.commit()
+    await reload_moderation_filter(db)
+    return banned_term
+
+
+@log_function
+async def delete_banned_term(db: AsyncSession, term_id: int):
+    """
+    Deletes a banned term and reloads the filter.
+
+    Comments already in the queue stay there until a moderator handles them.
+
+    Args:
+        db (AsyncSession): The database session.
+        term_id (int): The ID of the term.
+
+    Raises:
+        HTTPException: If the term does not exist.
+    """
+    result = await db.execute(delete(BannedTerm).where(BannedTerm.id == term_id).returning(BannedTerm.id))
+    if result.scalar() is None:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Term not found")
+    await db.commit()
+    await reload_moderation_filter(db)
+
+
+async def reload_moderation_filter(db: AsyncSession):
+    """
+    Rebuilds the in-memory moderation filter from the banned terms table.
+
+    Args:
+        db (AsyncSession): The database session.
+    """
+    result = await db.execute(select(BannedTerm.term, BannedTerm.action))
+    moderation_filter.load(result.all())
+
+
+async def refresh_moderation_filter():
+    """
+    Background job that picks up banned terms changed through other worker processes.
+    """
+    async for session in get_db():
+        await reload_moderation_filter(session)
@@ -2,7 +2,7 @@ import base64
 import io
 from base64 import b64encode
 
-from sqlalchemy import and_, func, desc
+from sqlalchemy import and_, desc, insert
 from sqlalchemy.orm import joinedload, selectinload
 from io import BytesIO
 from uuid import uuid4
@@ -15,10 +15,10 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.future import select
 from app.src.config.config import settings
 from app.src.config.logging_config import log_function
+from app.src.services.profile_cache import profile_cache
+from app.src.util.crud.bulk import delete_photos_by_ids
 from app.src.util.crud.tag import parse_tags
-from app.src.util.crud.user import get_user
-from app.src.util.models.photo import Photo
-from app.src.util.models.rating import Rating
+from app.src.util.models.photo import Photo, photo_m2m_tag
 from app.src.util.models.user import User
 from tenacity import retry, wait_fixed, stop_after_attempt
 
@@ -142,15 +142,17 @@ async def create_photo_in_db(description: str, file, user_id: int, db: AsyncSess
             Photo: The created Photo object.
         """
     public_id, photo_url = await PhotoService.upload_photo(file)
-    tag_instances = await parse_tags(db, tag_names, settings.MAX_TAGS)
+    tag_ids = await parse_tags(db, tag_names, settings.MAX_TAGS)
     new_photo = Photo(
         description=description,
         url=photo_url,
         public_id=public_id,
-        user_id=user_id,
-        tags=tag_instances
+        user_id=user_id
     )
     db.add(new_photo)
+    await db.flush()
+    if tag_ids:
+        await db.execute(insert(photo_m2m_tag), [{"photo": new_photo.id, "tag": tag_id} for tag_id in tag_ids])
 
     user_result = await db.execute(select(User).where(User.id == user_id))
     user = user_result.scalars().first()
@@ -158,6 +160,7 @@ async def create_photo_in_db(description: str, file, user_id: int, db: AsyncSess
         user.photos_uploaded = user.photos_uploaded + 1
         db.add(user)
 
+    profile_cache.invalidate_after_commit(db, user_id)
     await db.commit()
     await db.refresh(new_photo)
 
@@ -205,6 +208,7 @@ async def update_photo_description(photo_id: int, new_description: str, db: Asyn
     photo = await get_photo(db, photo_id)
     photo.description = new_description
     db.add(photo)
+    profile_cache.invalidate_after_commit(db, photo.user_id)
     await db.commit()
     await db.refresh(photo)
     return photo
@@ -213,7 +217,10 @@ async def update_photo_description(photo_id: int, new_description: str, db: Asyn
 @log_function
 async def delete_photo(db: AsyncSession, photo_id: int):
     """
-    Deletes a photo from the database and decrements the owner's photo counter.
+    Deletes a photo with its comments and ratings and decrements the owner's photo counter.
+
+    The work is a few set-based statements in one transaction; the image is queued in the asset
+    purge outbox and removed from Cloudinary in the background.
 
     Parameters:
     db (AsyncSession): The database session.
@@ -222,14 +229,10 @@ async def delete_photo(db: AsyncSession, photo_id: int):
     Raises:
     HTTPException: If the photo is not found.
     """
-    photo = await get_photo(db, photo_id)
-
-    user = await get_user(db, photo.user_id)
-    if user:
-        user.photos_uploaded -= 1
-        db.add(user)
-
-    await db.delete(photo)
+    counts = await delete_photos_by_ids(db, [photo_id])
+    if not counts["photos"]:
+        await db.rollback()
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Photo not found")
     await db.commit()
 
 
@@ -248,11 +251,28 @@ async def update_photo_url(db: AsyncSession, photo_id: int, new_url: str, ) -> P
     photo = await get_photo(db, photo_id)
     photo.url = new_url
     db.add(photo)
+    profile_cache.invalidate_after_commit(db, photo.user_id)
     await db.commit()
     await db.refresh(photo)
     return photo
 
 
+@log_function
+async def get_photo_urls(db: AsyncSession, photo_ids: list) -> dict:
+    """
+    Retrieves the URLs of several photos with a single query.
+
+    Args:
+        db (AsyncSession): The database session.
+        photo_ids (list): The IDs of the photos.
+
+    Returns:
+        dict: Mapping of photo ID to URL for the photos that exist.
+    """
+    result = await db.execute(select(Photo.id, Photo.url).where(Photo.id.in_(photo_ids)))
+    return {photo_id: url for photo_id, url in result.all()}
+
+
 @retry(wait=wait_fixed(1), stop=stop_after_attempt(3))
 @log_function
 async def get_photos_with_details(db: AsyncSession):
@@ -267,30 +287,22 @@ async def get_photos_with_details(db: AsyncSession):
 
 async def get_post_by_id(db: AsyncSession, photo_id: int) -> Photo:
     """
-    Retrieve a photo by its ID, including related tags, comments, and the owner.
-    Also calculates the average rating for the photo.
+    Retrieve a photo by its ID, including related tags and the owner.
+    The average rating is read from the photo's rating aggregates; comments are paginated
+    separately with `get_comments`.
 
     Args:
         db (AsyncSession): The SQLAlchemy asynchronous session.
         photo_id (int): The unique identifier of the photo.
 
     Returns:
-        Photo: The photo object with related tags, comments, owner, and average rating.
+        Photo: The photo object with related tags, owner, and average rating.
         None: If the photo is not found.
     """
 
     result = await db.execute(
         select(Photo)
-        .options(selectinload(Photo.tags), selectinload(Photo.comments), selectinload(Photo.owner))
+        .options(selectinload(Photo.tags), selectinload(Photo.owner))
         .filter(Photo.id == photo_id)
-        .outerjoin(Rating)
-        .group_by(Photo.id)
-        .add_columns(func.round(func.avg(Rating.rating), 2).label("average_rating"))
     )
-
-    photo, average_rating = result.first() or (None, None)
-
-    if photo:
-        photo.average_rating = average_rating  # Attach the calculated average rating to the photo
-
-    return photo
+    return result.scalars().first()
@@ -0,0 +1,80 @@
+from typing import Optional
+from fastapi import HTTPException, status
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.future import select
+from app.src.config.config import settings
+from app.src.services.profile_cache import profile_cache
+from app.src.util.models import Photo, User
+
+
+async def get_profile_photos(db: AsyncSession, user_id: int, before: Optional[int] = None,
+                             limit: int = settings.PROFILE_PAGE_SIZE) -> tuple:
+    """
+    Retrieves one page of a user's photos, newest first, using keyset pagination on the
+    `(user_id, id)` index.
+
+    Args:
+        db (AsyncSession): The database session.
+        user_id (int): The ID of the user.
+        before (Optional[int]): The `next_cursor` of the previous page; the first page when omitted.
+        limit (int): The page size.
+
+    Returns:
+        tuple: The photos of the page as dicts with `id`, `url` and `description`, and the cursor
+        for the next page, or None on the last page.
+    """
+    query = (
+        select(Photo.id, Photo.url, Photo.description)
+        .where(Photo.user_id == user_id)
+        .order_by(Photo.id.desc())
+        .limit(limit + 1)
+    )
+    if before is not None:
+        query = query.where(Photo.id < before)
+
+    result = await db.execute(query)
+    photos = [dict(row) for row in result.mappings().all()]
+    next_cursor = photos[limit - 1]["id"] if len(photos) > limit else None
+    return photos[:limit], next_cursor
+
+
+async def get_profile(db: AsyncSession, username: str) -> dict:
+    """
+    Retrieves the public profile of an active user: the user summary and the first page of photos.
+
+    Served from `profile_cache` when possible; on a miss the profile is loaded and cached.
+
+    Args:
+        db (AsyncSession): The database session.
+        username (str): The username.
+
+    Returns:
+        dict: "user" with `id`, `username`, `registered_at` and `photos_uploaded`; "photos", the
+        first page of photos; and "next_cursor" for the following page.
+
+    Raises:
+        HTTPException: If there is no active user with this username.
+    """
+    profile = profile_cache.get(username)
+    if profile is not None:
+        return profile
+
+    result = await db.execute(select(User.id).where(User.username == username))
+    user_id = result.scalar()
+    if user_id is None:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="User not found")
+
+    # Read before loading, so a change committed meanwhile keeps this load out of the cache.
+    generation = profile_cache.generation(user_id)
+    result = await db.execute(
+        select(User.id, User.username, User.registered_at, User.photos_uploaded)
+        .where(User.id == user_id, User.is_active == True)
+    )
+    user = result.mappings().first()
+    if user is None:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="User not found")
+
+    photos, next_cursor = await get_profile_photos(db, user_id)
+    profile = {"user": dict(user), "photos": photos, "next_cursor": next_cursor}
+    profile_cache.put(username, user_id, generation, profile)
+    return profile
@@ -1,11 +1,60 @@
+from typing import Optional
+from datetime import datetime
+from sqlalchemy import delete, update, func, and_, or_, literal
+from sqlalchemy.dialects.postgresql import insert
 from sqlalchemy.ext.asyncio import AsyncSession
 from fastapi import HTTPException, status
 from sqlalchemy.orm import Session
+from app.src.config.logging_config import log_function
+from app.src.services.event_broker import photo_event_broker
+from app.src.util.db import get_db
 from app.src.util.models.rating import Rating
 from app.src.util.schemas.rating import RatingCreate
 from sqlalchemy.future import select
 from app.src.util.models import User, Photo
 
+RECONCILE_BATCH_SIZE = 10000
+RATING_VALUES = range(1, 6)
+
+
+def rating_aggregate_values(rating: int, count: int = 1) -> dict:
+    """
+    Builds the relative `UPDATE photos` values that add or remove one rating from the aggregates.
+
+    Args:
+        rating (int): The rating value.
+        count (int): 1 when a rating is added, -1 when it is removed.
+
+    Returns:
+        dict: Column name to SQL expression, including the star histogram counter when `rating`
+        is between 1 and 5.
+    """
+    values = {"rating_count": Photo.rating_count + count, "rating_sum": Photo.rating_sum + rating * count}
+    if rating in RATING_VALUES:
+        column = f"rating_count_{rating}"
+        values[column] = getattr(Photo, column) + count
+    return values
+
+
+async def apply_rating_to_photo(db: AsyncSession, photo_id: int, rating: int, count: int = 1):
+    """
+    Adds a rating to, or with `count=-1` removes it from, the photo's rating aggregates.
+
+    The update is a single relative `UPDATE`, so concurrent ratings cannot lose increments. It does
+    not commit; call it in the same transaction as the change to `ratings`.
+
+    Args:
+        db (AsyncSession): The database session.
+        photo_id (int): The ID of the rated photo.
+        rating (int): The rating value.
+        count (int): 1 when a rating is added, -1 when it is removed.
+    """
+    await db.execute(
+        update(Photo)
+        .where(Photo.id == photo_id)
+        .values(**rating_aggregate_values(rating, count))
+    )
+
 async def get_rating(db: AsyncSession, rating_id: int) -> Rating:
     """
     Retrieve a rating by its ID from the database.
@@ -27,14 +76,15 @@ async def get_rating(db: AsyncSession, rating_id: int) -> Rating:
     return rating
 
 
-async def create_rating(photo_id: int, rate: int, user_id, db: AsyncSession) -> Rating:
+@log_function
+async def create_rating(photo_id: int, rate: int, user_id, db: AsyncSession) -> int:
     """
-    Asynchronously rates a photo by a given user if not already rated by them and if the photo does not belong to them.
+    Rates a photo by a given user if not already rated by them and if the photo does not belong to them.
 
-    This function performs several checks before adding a new rating:
-    - It ensures the photo exists.
-    - It prevents users from rating their own photos.
-    - It prevents users from rating the same photo more than once.
+    The rating is inserted and the photo's rating aggregates are updated by one statement:
+    an `INSERT ... SELECT ... ON CONFLICT (photo_id, user_id) DO NOTHING RETURNING` that only selects
+    the photo when it belongs to someone else, wrapped in a CTE that bumps the aggregates.
+    Only when nothing was inserted is the photo looked up, to tell the caller why.
 
     Args:
         photo_id (int): The ID of the photo to be rated.
@@ -43,38 +93,50 @@ async def create_rating(photo_id: int, rate: int, user_id, db: AsyncSession) ->
         db (AsyncSession): The database session used to execute asynchronous queries.
 
     Returns:
-        Rating: An instance of the Rating model with the new rating details if successful.
+        int: The ID of the new rating.
 
     Raises:
         HTTPException: An error with status code 404 if no photo is found,
-                       with status code 423 if the user tries to rate their own photo or rate the same photo twice.
-
-    Example:
-        >>> user = User(id=1, name="John Doe")
-        >>> db_session = AsyncSession()
-        >>> await rate_photo(photo_id=123, rate=5, user=user, db=db_session)
-        <Rating>
+                       with status code 403 if the user tries to rate their own photo or rate the same photo twice.
     """
-    result = await db.execute(select(Photo).filter(Photo.id == photo_id))
-    photo = result.scalars().first()
-    if photo is None:
-        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Photo not found.")
-    is_self_photo = photo.user_id == user_id
-
-    result = await db.execute(select(Rating).filter(Rating.photo_id == photo_id, Rating.user_id == user_id))
-    already_rated = result.scalars().first()
-
-    if is_self_photo:
-        raise HTTPException(status_code=status.HTTP_423_LOCKED, detail="It's not possible to rate own photo.")
-    if already_rated:
-        raise HTTPException(status_code=status.HTTP_423_LOCKED, detail="It's not possible to rate twice.")
-
-    new_rating = Rating(photo_id=photo_id, rate=rate, user_id=user_id)
-    db.add(new_rating)
-    await db.commit()
-    await db.refresh(new_rating)
-    return new_rating
+    inserted = (
+        insert(Rating)
+        .from_select(
+            ["rating", "user_id", "photo_id", "created_at"],
+            select(literal(rate), literal(user_id), Photo.id, literal(datetime.utcnow()))
+            .where(Photo.id == photo_id, Photo.user_id != user_id)
+        )
+        .on_conflict_do_nothing(index_elements=[Rating.photo_id, Rating.user_id])
+        .returning(Rating.id, Rating.photo_id, Rating.rating)
+        .cte("inserted")
+    )
+    result = await db.execute(
+        update(Photo)
+        .where(Photo.id == inserted.c.photo_id)
+        .values(**rating_aggregate_values(rate))
+        .returning(inserted.c.id, Photo.rating_count, Photo.rating_sum,
+                   *(getattr(Photo, f"rating_count_{stars}") for stars in RATING_VALUES))
+        .execution_options(synchronize_session=False)
+    )
+    row = result.first()
+    if row is not None:
+        rating_id, rating_count, rating_sum, *histogram = row
+        await photo_event_broker.publish(db, photo_id, {
+            "type": "rating",
+            "average": round(rating_sum / rating_count, 2),
+            "count": rating_count,
+            "histogram": dict(zip(RATING_VALUES, histogram)),
+        })
+        await db.commit()
+        return rating_id
 
+    result = await db.execute(select(Photo.user_id).where(Photo.id == photo_id))
+    owner = result.first()
+    if owner is None:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Photo not found")
+    if owner.user_id == user_id:
+        raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="You cannot rate your own photo")
+    raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="You cannot change your rating")
 
 
 async def update_rating(db: AsyncSession, rating_id: int, body: RatingCreate) -> Rating:
@@ -93,17 +155,19 @@ async def update_rating(db: AsyncSession, rating_id: int, body: RatingCreate) ->
     rating_db = result.scalars().first()
 
     if rating_db:
+        await apply_rating_to_photo(db, rating_db.photo_id, rating_db.rating, count=-1)
 
         for key, value in body.dict().items():
             setattr(rating_db, key, value)
 
+        await apply_rating_to_photo(db, rating_db.photo_id, rating_db.rating)
         await db.commit()
         await db.refresh(rating_db)
 
     return rating_db
 
 
-async def delete_rating(rate_id: int, db: AsyncSession, user: User) -> None:
+async def delete_rating(rate_id: int, db: AsyncSession, user: User) -> Optional[dict]:
     """
     The delete_rating function deletes a rating from the database.
 
@@ -113,17 +177,117 @@ async def delete_rating(rate_id: int, db: AsyncSession, user: User) -> None:
         user (User): The User object that removes the rate.
 
     Returns:
-        None
+        dict: The deleted rating, or None if no rating has this id.
     """
-    result = await db.execute(select(Rating).filter(Rating.id == rate_id))
-    rate = result.scalars().first()
+    # Only the transaction whose DELETE removed the row gets it back, so concurrent deletes of the
+    # same rating decrement the photo's aggregates once.
+    result = await db.execute(
+        delete(Rating)
+        .where(Rating.id == rate_id)
+        .returning(Rating.id, Rating.rating, Rating.user_id, Rating.photo_id, Rating.created_at)
+    )
+    rate = result.mappings().first()
 
     if rate:
-        await db.delete(rate)  # Perform deletion
+        await apply_rating_to_photo(db, rate["photo_id"], rate["rating"], count=-1)
         await db.commit()  # Commit the transaction
-        return rate
+        return dict(rate)
     return None
 
 
+@log_function
+async def reconcile_photo_ratings(db: AsyncSession, first_photo_id: int, last_photo_id: int) -> int:
+    """
+    Recomputes the rating aggregates and star histograms of photos in an ID range from `ratings`
+    and fixes drifted rows. The photos stay locked until the caller commits.
+
+    Args:
+        db (AsyncSession): The database session.
+        first_photo_id (int): The first photo ID of the range.
+        last_photo_id (int): The last photo ID of the range.
+
+    Returns:
+        int: The number of photos that were corrected.
+    """
+    # Rating writers update the photo row in the same transaction as the rating. Locking the photos
+    # first waits for writers in flight, so the totals below see their ratings, and makes later ones
+    # apply their increments on top of the corrected counters.
+    await db.execute(
+        select(Photo.id)
+        .where(Photo.id.between(first_photo_id, last_photo_id))
+        .order_by(Photo.id)
+        .with_for_update()
+    )
+    columns = ["rating_count", "rating_sum"] + [f"rating_count_{stars}" for stars in RATING_VALUES]
+    totals = (
+        select(
+            Photo.id.label("photo_id"),
+            func.count(Rating.id).label("rating_count"),
+            func.coalesce(func.sum(Rating.rating), 0).label("rating_sum"),
+            *(func.count(Rating.id).filter(Rating.rating == stars).label(f"rating_count_{stars}")
+              for stars in RATING_VALUES),
+        )
+        .outerjoin(Rating, Rating.photo_id == Photo.id)
+        .where(Photo.id.between(first_photo_id, last_photo_id))
+        .group_by(Photo.id)
+        .subquery()
+    )
+    result = await db.execute(
+        update(Photo)
+        .where(and_(
+            Photo.id == totals.c.photo_id,
+            or_(*(getattr(Photo, column) != totals.c[column] for column in columns)),
+        ))
+        .values({column: totals.c[column] for column in columns})
+        .execution_options(synchronize_session=False)
+    )
+    return result.rowcount
+
+
+async def reconcile_rating_aggregates():
+    """
+    Background job that repairs the per-photo rating aggregates, one ID range per transaction.
+
+    Also backfills the star histogram counters of photos rated before they existed.
+    """
+    async for session in get_db():
+        max_photo_id = (await session.execute(select(func.max(Photo.id)))).scalar() or 0
+        for first_photo_id in range(1, max_photo_id + 1, RECONCILE_BATCH_SIZE):
+            await reconcile_photo_ratings(session, first_photo_id, first_photo_id + RECONCILE_BATCH_SIZE - 1)
+            await session.commit()
+
+
+async def get_rating_summaries(db: AsyncSession, photo_ids: list, user_id: int = None) -> dict:
+    """
+    Reads the average, count and star histogram of several photos from their aggregate columns.
+
+    Args:
+        db (AsyncSession): The database session.
+        photo_ids (list): The IDs of the photos.
+        user_id (int, optional): A user whose own rating of each photo should be included; it is
+            joined into the same query.
 
+    Returns:
+        dict: Maps every found photo ID to a dict with `photo_id`, `average`, `count`, `histogram`
+        and `user_rating`.
+    """
+    histogram_columns = [getattr(Photo, f"rating_count_{stars}") for stars in RATING_VALUES]
+    user_rating = Rating.rating if user_id is not None else literal(None)
+    query = (
+        select(Photo.id, Photo.rating_count, Photo.rating_sum, user_rating, *histogram_columns)
+        .where(Photo.id.in_(photo_ids))
+    )
+    if user_id is not None:
+        query = query.outerjoin(Rating, and_(Rating.photo_id == Photo.id, Rating.user_id == user_id))
+    result = await db.execute(query)
 
+    return {
+        photo_id: {
+            "photo_id": photo_id,
+            "average": round(rating_sum / rating_count, 2) if rating_count else 0,
+            "count": rating_count,
+            "histogram": dict(zip(RATING_VALUES, histogram)),
+            "user_rating": own_rating,
+        }
+        for photo_id, rating_count, rating_sum, own_rating, *histogram in result
+    }
@@ -0,0 +1,105 @@
+from datetime import date, datetime, timedelta
+from typing import Optional
+from sqlalchemy import cast, Date, func
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.future import select
+from app.src.config.config import settings
+from app.src.util.db import get_db
+from app.src.util.models import Photo, SiteStats, User
+from app.src.util.models.comment import Comment
+from app.src.util.models.rating import Rating
+
+SITE_STATS_ID = 1
+
+DAILY_SERIES = {
+    "uploads": Photo.created_at,
+    "signups": User.registered_at,
+    "comments": Comment.created_at,
+    "ratings": Rating.created_at,
+}
+
+
+async def get_site_stats(db: AsyncSession) -> Optional[SiteStats]:
+    """
+    Retrieves the latest statistics snapshot with a primary key lookup.
+
+    Args:
+        db (AsyncSession): The database session.
+
+    Returns:
+        Optional[SiteStats]: The snapshot, None until the first refresh has run.
+    """
+    return await db.get(SiteStats, SITE_STATS_ID)
+
+
+async def count_per_day(db: AsyncSession, column, since: date) -> dict:
+    """
+    Counts the rows whose timestamp falls on each day since a date.
+
+    Args:
+        db (AsyncSession): The database session.
+        column: The timestamp column.
+        since (date): The first day.
+
+    Returns:
+        dict: Day to number of rows, for the days that have any.
+    """
+    day = cast(column, Date)
+    result = await db.execute(select(day, func.count()).where(column >= since).group_by(day))
+    return dict(result.all())
+
+
+async def compute_site_stats(db: AsyncSession) -> dict:
+    """
+    Computes the site-wide totals and the daily activity buckets.
+
+    The rating total is the sum of the per-photo rating counters rather than a scan of `ratings`.
+
+    Args:
+        db (AsyncSession): The database session.
+
+    Returns:
+        dict: The values of a `SiteStats` row.
+    """
+    active_since = datetime.utcnow() - timedelta(days=settings.STATS_ACTIVE_DAYS)
+    totals = (await db.execute(select(
+        select(func.count()).select_from(User).scalar_subquery(),
+        select(func.count()).select_from(User)
+        .where(User.is_active == True, User.last_login >= active_since).scalar_subquery(),
+        select(func.count()).select_from(Photo).scalar_subquery(),
+        select(func.count()).select_from(Comment).scalar_subquery(),
+        select(func.coalesce(func.sum(Photo.rating_count), 0)).scalar_subquery(),
+    ))).one()
+
+    today = datetime.utcnow().date()
+    days = [today - timedelta(days=offset) for offset in range(settings.STATS_DAYS - 1, -1, -1)]
+    counts = {name: await count_per_day(db, column, days[0]) for name, column in DAILY_SERIES.items()}
+    daily = [
+        {"day": day.isoformat(), **{name: counts[name].get(day, 0) for name in DAILY_SERIES}}
+        for day in days
+    ]
+
+    users, active_users, photos, comments, ratings = totals
+    return {
+        "users": users,
+        "active_users": active_users,
+        "photos": photos,
+        "comments": comments,
+        "ratings": ratings,
+        "daily": daily,
+    }
+
+
+async def refresh_site_stats():
+    """
+    Background job that replaces the statistics snapshot with freshly computed values.
+    """
+    async for session in get_db():
+        values = {**await compute_site_stats(session), "computed_at": datetime.utcnow()}
+        await session.execute(
+            insert(SiteStats)
+            .values(id=SITE_STATS_ID, **values)
+            .on_conflict_do_update(index_elements=[SiteStats.id], set_=values)
+        )
+        await session.commit()
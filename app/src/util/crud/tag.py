@@ -1,9 +1,22 @@
+from collections import OrderedDict
+from typing import Optional
 from fastapi import HTTPException, status
-from sqlalchemy.exc import IntegrityError
+from sqlalchemy import event, func
+from sqlalchemy.dialects.postgresql import insert
 from sqlalchemy.future import select
+from sqlalchemy.orm import selectinload
 from sqlalchemy.ext.asyncio import AsyncSession
+from app.src.config.config import settings
 from app.src.config.logging_config import log_function
-from app.src.util.models import Tag
+from app.src.services.tag_normalizer import clean_tag_name, normalize_tag_name
+from app.src.services.tag_suggest import tag_suggest_index
+from app.src.util.db import get_db
+from app.src.util.models import Tag, Photo
+from app.src.util.models.photo import photo_m2m_tag
+
+# Normalized tag name -> (ID, display name) for tags known to be committed. Tags resolved inside
+# a transaction are only added once that transaction commits.
+_tag_cache: OrderedDict = OrderedDict()
 
 
 async def create_tag(db: AsyncSession, tag_name: str) -> Tag:
@@ -19,7 +32,7 @@ async def create_tag(db: AsyncSession, tag_name: str) -> Tag:
 
     This function creates a new Tag object with the given tag_name, adds it to the database session, commits the changes, refreshes the tag object, and then returns it.
     """
-    tag = Tag(tag_name=tag_name)
+    tag = Tag(name=clean_tag_name(tag_name), normalized_name=normalize_tag_name(tag_name))
     db.add(tag)
     await db.commit()
     await db.refresh(tag)
@@ -28,7 +41,7 @@ async def create_tag(db: AsyncSession, tag_name: str) -> Tag:
 
 async def get_tag_by_name(db: AsyncSession, tag_name: str) -> Tag:
     """
-    Retrieve a tag from the database by its name.
+    Retrieve a tag from the database by its name, ignoring case and spacing differences.
 
     Parameters:
     - db (AsyncSession): The asynchronous database session.
@@ -40,7 +53,7 @@ async def get_tag_by_name(db: AsyncSession, tag_name: str) -> Tag:
     This function uses the provided database session to execute a SQL query to retrieve a tag with the given name.
     If a tag with the specified name exists in the database, it is returned. Otherwise, None is returned.
     """
-    result = await db.execute(select(Tag).filter(Tag.name == tag_name))
+    result = await db.execute(select(Tag).filter(Tag.normalized_name == normalize_tag_name(tag_name)))
     tag = result.scalars().first()
     if tag is None:
         raise HTTPException(
@@ -50,28 +63,193 @@ async def get_tag_by_name(db: AsyncSession, tag_name: str) -> Tag:
     return tag
 
 
+def split_tag_names(tag_names: list, max_number: int) -> dict:
+    """
+    Splits the raw comma-separated tag input into unique tags.
+
+    Names that normalize to the same canonical form (e.g. `Sunset` and `SUNSET`) count as one tag;
+    the first spelling is kept for display.
+
+    Parameters:
+    - tag_names (list): The raw tag form values; the first item holds the comma-separated names.
+    - max_number (int): The maximum number of tags to keep.
+
+    Returns:
+    - dict: Normalized name -> display name, in input order, truncated to `max_number`.
+    """
+    if not tag_names or not tag_names[0]:
+        return {}
+    tags = {}
+    for tag in tag_names[0].split(','):
+        name = clean_tag_name(tag)
+        if name:
+            tags.setdefault(normalize_tag_name(name), name)
+    return dict(list(tags.items())[:max_number])
+
+
+def _cache_tags(tags: dict):
+    for normalized_name, tag in tags.items():
+        _tag_cache[normalized_name] = tag
+        _tag_cache.move_to_end(normalized_name)
+    while len(_tag_cache) > settings.TAG_CACHE_SIZE:
+        _tag_cache.popitem(last=False)
+
+
 @log_function
 async def parse_tags(db: AsyncSession, tag_names: list, max_number: int) -> list:
-    tags = [tag.strip() for tag in tag_names[0].split(',')]
-    if len(tags) > max_number:
-        tags = tags[:max_number]
-    tag_instances = []
-    for tag_name in tags:
-        tag_instance = await db.execute(select(Tag).where(Tag.name == tag_name))
-        existing_tag = tag_instance.scalars().first()
-        if existing_tag:
-            tag_instances.append(existing_tag)
-        else:
-            new_tag = Tag(name=tag_name)
-            db.add(new_tag)
-            try:
-                await db.commit()
-                await db.refresh(new_tag)
-                tag_instances.append(new_tag)
-            except IntegrityError:
-                await db.rollback()
-                tag_instance = await db.execute(select(Tag).where(Tag.name == tag_name))
-                existing_tag = tag_instance.scalars().first()
-                if existing_tag:
-                    tag_instances.append(existing_tag)
-    return tag_instances
+    """
+    Resolves tag names to tag IDs, creating the missing tags.
+
+    Names are matched on their normalized form. Known tags are served from a process-wide cache.
+    The rest are inserted with a single `INSERT ... ON CONFLICT (normalized_name) DO NOTHING RETURNING`
+    statement, and tags that already existed are fetched with one SELECT. Nothing is committed here,
+    so the tags become part of the caller's transaction.
+
+    Parameters:
+    - db (AsyncSession): The asynchronous database session.
+    - tag_names (list): The raw tag form values; the first item holds the comma-separated names.
+    - max_number (int): The maximum number of tags to keep.
+
+    Returns:
+    - list: The tag IDs in input order.
+    """
+    tags = split_tag_names(tag_names, max_number)
+    resolved = {key: _tag_cache[key] for key in tags if key in _tag_cache}
+    missing = [key for key in tags if key not in resolved]
+
+    if missing:
+        result = await db.execute(
+            insert(Tag)
+            .values([{"name": tags[key], "normalized_name": key} for key in missing])
+            .on_conflict_do_nothing(index_elements=[Tag.normalized_name])
+            .returning(Tag.normalized_name, Tag.id, Tag.name)
+        )
+        resolved.update({key: (tag_id, name) for key, tag_id, name in result.tuples()})
+
+        existing = [key for key in missing if key not in resolved]
+        if existing:
+            result = await db.execute(
+                select(Tag.normalized_name, Tag.id, Tag.name).where(Tag.normalized_name.in_(existing))
+            )
+            existing_tags = {key: (tag_id, name) for key, tag_id, name in result.tuples()}
+            resolved.update(existing_tags)
+            _cache_tags(existing_tags)
+
+    if tags:
+        def on_commit(session):
+            _cache_tags(resolved)
+            tag_suggest_index.add_usage([name for _, name in resolved.values()])
+
+        event.listen(db.sync_session, "after_commit", on_commit, once=True)
+
+    return [resolved[key][0] for key in tags]
+
+
+def _tag_usage_query():
+    usage = func.count(photo_m2m_tag.c.id).label("usage")
+    return (
+        select(Tag.name, usage)
+        .outerjoin(photo_m2m_tag, photo_m2m_tag.c.tag == Tag.id)
+        .group_by(Tag.id)
+    ), usage
+
+
+async def get_tag_usage_counts(db: AsyncSession) -> list:
+    """
+    Retrieve every tag with the number of photos using it.
+
+    Parameters:
+    - db (AsyncSession): The asynchronous database session.
+
+    Returns:
+    - list: Pairs of tag name and usage count.
+    """
+    query, _ = _tag_usage_query()
+    result = await db.execute(query)
+    return result.tuples().all()
+
+
+async def suggest_tags_from_db(db: AsyncSession, prefix: str, limit: int) -> list:
+    """
+    Retrieve the most used tags starting with `prefix`, ignoring case, straight from the database.
+
+    Used while the in-memory suggestion index is not loaded; served by the
+    `normalized_name text_pattern_ops` index on `tags`.
+
+    Parameters:
+    - db (AsyncSession): The asynchronous database session.
+    - prefix (str): The typed prefix.
+    - limit (int): Maximum number of suggestions.
+
+    Returns:
+    - list: Pairs of tag name and usage count, most used first.
+    """
+    query, usage = _tag_usage_query()
+    result = await db.execute(
+        query
+        .where(Tag.normalized_name.startswith(normalize_tag_name(prefix), autoescape=True))
+        .order_by(usage.desc(), Tag.name)
+        .limit(limit)
+    )
+    return result.tuples().all()
+
+
+async def refresh_tag_suggest_index():
+    """Rebuild the in-memory tag suggestion index from the database."""
+    async for session in get_db():
+        tag_suggest_index.load(await get_tag_usage_counts(session))
+
+
+@log_function
+async def get_photos_by_tag(db: AsyncSession, tag_id: int, before: Optional[int] = None,
+                            limit: int = settings.TAG_PAGE_SIZE) -> tuple:
+    """
+    Retrieve one page of photos with a tag, newest first, using keyset pagination.
+
+    The page is read through the `(tag, photo)` unique index, so the cost does not depend on how many
+    photos the tag has or how deep the page is.
+
+    Parameters:
+    - db (AsyncSession): The asynchronous database session.
+    - tag_id (int): The ID of the tag.
+    - before (Optional[int]): Only return photos with an ID lower than this cursor.
+    - limit (int): The page size.
+
+    Returns:
+    - tuple: The photos of the page and the cursor for the next page, or None on the last page.
+    """
+    query = (
+        select(Photo)
+        .join(photo_m2m_tag, photo_m2m_tag.c.photo == Photo.id)
+        .where(photo_m2m_tag.c.tag == tag_id)
+        .options(selectinload(Photo.tags), selectinload(Photo.owner))
+        .order_by(photo_m2m_tag.c.photo.desc())
+        .limit(limit + 1)
+    )
+    if before is not None:
+        query = query.where(photo_m2m_tag.c.photo < before)
+
+    result = await db.execute(query)
+    photos = result.scalars().all()
+    next_cursor = photos[limit - 1].id if len(photos) > limit else None
+    return photos[:limit], next_cursor
+
+
+async def get_tag_photo_count(db: AsyncSession, tag: Tag) -> int:
+    """
+    Retrieve the number of photos with a tag.
+
+    The count is read from the tag suggestion index, which keeps usage counts in memory;
+    the database is only counted while the index is not loaded.
+
+    Parameters:
+    - db (AsyncSession): The asynchronous database session.
+    - tag (Tag): The tag.
+
+    Returns:
+    - int: The number of photos with the tag.
+    """
+    if tag_suggest_index.loaded:
+        return tag_suggest_index.count(tag.name)
+    result = await db.execute(select(func.count()).select_from(photo_m2m_tag).where(photo_m2m_tag.c.tag == tag.id))
+    return result.scalar()
@@ -0,0 +1,172 @@
+import heapq
+from collections import defaultdict
+from datetime import datetime
+from sqlalchemy import and_, distinct, func, text
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.future import select
+from app.src.config.config import settings
+from app.src.config.logging_config import log_function
+from app.src.util.crud.job import get_job_position, set_job_position
+from app.src.util.db import get_db
+from app.src.util.models import Photo, Tag
+from app.src.util.models.photo import photo_m2m_tag
+from app.src.util.models.tag_relation import TagCooccurrence, RelatedTags
+
+RELATED_TAGS_JOB = "related_tags"
+# The highest photo ID seen by the last run, and the transaction horizon it is processed after.
+RELATED_TAGS_PENDING_JOB = "related_tags_pending"
+RELATED_TAGS_HORIZON_JOB = "related_tags_horizon"
+
+
+async def get_related_tags(db: AsyncSession, tag_ids: list, exclude: tuple = ()) -> list:
+    """
+    Retrieves the precomputed related tags of one or more tags.
+
+    Reads one `related_tags` row per tag by primary key. When several tags are given, their
+    neighbours are merged, keeping the best score of each related tag.
+
+    Args:
+        db (AsyncSession): The database session.
+        tag_ids (list): The IDs of the tags.
+        exclude (tuple): Tag names to leave out, e.g. the tags being shown already.
+
+    Returns:
+        list: `(name, score)` pairs, best first.
+    """
+    if not tag_ids:
+        return []
+    result = await db.execute(select(RelatedTags.neighbors).where(RelatedTags.tag_id.in_(tag_ids)))
+
+    scores = {}
+    for neighbors in result.scalars():
+        for name, score in neighbors:
+            if name not in exclude and score > scores.get(name, 0):
+                scores[name] = score
+    return heapq.nlargest(settings.RELATED_TAGS_TOP_N, scores.items(), key=lambda item: item[1])
+
+
+async def _rank_related_tags(db: AsyncSession, tag_ids: list):
+    """
+    Recomputes the top related tags of the given tags from the co-occurrence counts.
+
+    Tags are ranked by lift: how much more often two tags appear together than they would
+    if they were independent, `count(a, b) * photos / (count(a) * count(b))`.
+    """
+    result = await db.execute(
+        select(TagCooccurrence.tag_id, TagCooccurrence.related_tag_id, TagCooccurrence.count)
+        .where(TagCooccurrence.tag_id.in_(tag_ids),
+               TagCooccurrence.count >= settings.RELATED_TAGS_MIN_SUPPORT)
+    )
+    pairs = result.tuples().all()
+    involved = set(tag_ids) | {related_tag_id for _, related_tag_id, _ in pairs}
+
+    result = await db.execute(
+        select(photo_m2m_tag.c.tag, func.count())
+        .where(photo_m2m_tag.c.tag.in_(involved))
+        .group_by(photo_m2m_tag.c.tag)
+    )
+    usage = dict(result.tuples().all())
+    result = await db.execute(select(Tag.id, Tag.name).where(Tag.id.in_(involved)))
+    names = dict(result.tuples().all())
+    total = (await db.execute(select(func.count()).select_from(Photo))).scalar()
+
+    candidates = defaultdict(list)
+    for tag_id, related_tag_id, count in pairs:
+        if usage.get(tag_id) and usage.get(related_tag_id) and related_tag_id in names:
+            lift = count * total / (usage[tag_id] * usage[related_tag_id])
+            candidates[tag_id].append((lift, names[related_tag_id]))
+
+    now = datetime.utcnow()
+    rows = [
+        {
+            "tag_id": tag_id,
+            "neighbors": [[name, round(lift, 3)] for lift, name in
+                          heapq.nlargest(settings.RELATED_TAGS_TOP_N, candidates[tag_id])],
+            "updated_at": now,
+        }
+        for tag_id in tag_ids if tag_id in names
+    ]
+    if rows:
+        stmt = insert(RelatedTags).values(rows)
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[RelatedTags.tag_id],
+            set_={"neighbors": stmt.excluded.neighbors, "updated_at": stmt.excluded.updated_at}
+        )
+        await db.execute(stmt)
+
+
+@log_function
+async def process_related_tags_batch(db: AsyncSession, last_photo_id: int, upto_photo_id: int) -> int:
+    """
+    Folds the tags of photos in `(last_photo_id, upto_photo_id]` into the co-occurrence counts and
+    re-ranks the related tags of every tag on those photos.
+
+    Args:
+        db (AsyncSession): The database session.
+        last_photo_id (int): The last photo ID already processed.
+        upto_photo_id (int): The last photo ID of this batch.
+
+    Returns:
+        int: The number of tags whose related tags were recomputed.
+    """
+    in_batch = and_(photo_m2m_tag.c.photo > last_photo_id, photo_m2m_tag.c.photo <= upto_photo_id)
+    a = photo_m2m_tag.alias("a")
+    b = photo_m2m_tag.alias("b")
+    pairs = (
+        select(a.c.tag, b.c.tag, func.count())
+        .select_from(a.join(b, and_(a.c.photo == b.c.photo, a.c.tag != b.c.tag)))
+        .where(a.c.photo > last_photo_id, a.c.photo <= upto_photo_id)
+        .group_by(a.c.tag, b.c.tag)
+    )
+    stmt = insert(TagCooccurrence).from_select(["tag_id", "related_tag_id", "count"], pairs)
+    stmt = stmt.on_conflict_do_update(
+        index_elements=[TagCooccurrence.tag_id, TagCooccurrence.related_tag_id],
+        set_={"count": TagCooccurrence.count + stmt.excluded.count}
+    )
+    await db.execute(stmt)
+
+    result = await db.execute(select(distinct(photo_m2m_tag.c.tag)).where(in_batch))
+    tag_ids = result.scalars().all()
+    if tag_ids:
+        await _rank_related_tags(db, tag_ids)
+    return len(tag_ids)
+
+
+async def update_related_tags():
+    """
+    Background job that brings the related tags up to date with photos uploaded since its last run.
+
+    A photo ID is drawn before its transaction commits, so a photo can become visible after a higher
+    ID was already processed. Each run therefore records the highest photo ID it sees together with
+    the snapshot's transaction horizon, and a later run only processes up to that ID once every
+    transaction running back then has finished: no photo below it can still appear.
+
+    Photos are processed in batches of `RELATED_TAGS_BATCH_SIZE` IDs; each batch commits together
+    with its checkpoint, so an interrupted run resumes where it stopped.
+    """
+    async for session in get_db():
+        last_photo_id = await get_job_position(session, RELATED_TAGS_JOB)
+        settled_photo_id = await get_job_position(session, RELATED_TAGS_PENDING_JOB)
+        horizon = await get_job_position(session, RELATED_TAGS_HORIZON_JOB)
+        result = await session.execute(text(
+            "SELECT (SELECT max(id) FROM photos), "
+            "pg_snapshot_xmin(pg_current_snapshot())::text::bigint, "
+            "pg_snapshot_xmax(pg_current_snapshot())::text::bigint"
+        ))
+        max_photo_id, oldest_running, next_transaction = result.one()
+        if oldest_running < horizon:
+            # Transactions that may still insert photos below `settled_photo_id` are running.
+            await session.rollback()
+            return
+
+        while last_photo_id < settled_photo_id:
+            upto_photo_id = min(settled_photo_id, last_photo_id + settings.RELATED_TAGS_BATCH_SIZE)
+            await process_related_tags_batch(session, last_photo_id, upto_photo_id)
+            await set_job_position(session, RELATED_TAGS_JOB, upto_photo_id)
+            await session.commit()
+            last_photo_id = upto_photo_id
+
+        await set_job_position(session, RELATED_TAGS_PENDING_JOB, max_photo_id or 0)
+        await set_job_position(session, RELATED_TAGS_HORIZON_JOB, next_transaction)
+        await session.commit()
@@ -1,5 +1,6 @@
 from datetime import datetime
-from sqlalchemy import delete
+from sqlalchemy import delete, literal
+from sqlalchemy.dialects.postgresql import insert
 from ..models.token import BlacklistedToken, Token
 from app.src.util.db import AsyncSessionLocal as SessionLocal, get_db
 from sqlalchemy.ext.asyncio import AsyncSession
@@ -26,6 +27,37 @@ async def is_token_blacklisted(db: AsyncSession, token: str) -> bool:
     return blacklisted_token is not None
 
 
+async def revoke_user_tokens(db: AsyncSession, user_id: int) -> int:
+    """
+    Revokes every token of a user with a single statement: the user's rows are deleted from `tokens`
+    and the unexpired ones are added to the blacklist checked on each request. Does not commit.
+
+    Args:
+        db (AsyncSession): The database session.
+        user_id (int): The ID of the user.
+
+    Returns:
+        int: The number of blacklisted tokens.
+    """
+    revoked = (
+        delete(Token)
+        .where(Token.user_id == user_id)
+        .returning(Token.token, Token.expires_at)
+        .cte("revoked")
+    )
+    stmt = (
+        insert(BlacklistedToken)
+        .from_select(
+            ["token", "blacklisted_on"],
+            select(revoked.c.token, literal(datetime.utcnow())).where(revoked.c.expires_at > datetime.utcnow()),
+        )
+        .on_conflict_do_nothing(index_elements=[BlacklistedToken.token])
+        .add_cte(revoked)
+    )
+    result = await db.execute(stmt)
+    return result.rowcount
+
+
 async def remove_expired_tokens():
     async for session in get_db():
         delete_stmt = delete(Token).where(Token.expires_at < datetime.utcnow())
@@ -1,14 +1,25 @@
+import asyncio
 from datetime import datetime
+from typing import Optional
+from fastapi import HTTPException, status
 from app.src.config.hash import hash_handler
-from app.src.services.un_generator import generate_unique_username
+from app.src.services.profile_cache import profile_cache
+from app.src.services.un_generator import generate_username
 from app.src.util.models.user import UserRole
 from app.src.util.schemas import user as schema_user
 from app.src.util.models import user as model_user, User
+from app.src.config.config import settings
 from app.src.config.jwt import create_access_token
+from app.src.util.crud.token import revoke_user_tokens
 from app.src.config.logging_config import log_function
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.future import select
-from sqlalchemy import update
+from sqlalchemy import update, case, exists, literal, func
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.exc import IntegrityError
+
+USERNAME_ATTEMPTS = 5
+FIRST_ADMIN_LOCK = 7_301_001
 
 
 @log_function
@@ -16,10 +27,11 @@ async def create_user(db: AsyncSession, user: dict[str, str]) -> User:
     """
     Create a new user in the database.
 
-    This function creates a new user in the database by hashing the provided password
-    and storing the user information. If the created user is the first user in the
-    database (i.e., with ID 1), the user is assigned the "admin" role. After creating
-    the user, an access token is generated for the user.
+    The user is stored by a single `INSERT ... ON CONFLICT (username) DO NOTHING RETURNING`, which
+    also picks the role: the first user becomes an admin, decided by an `EXISTS` on `users`. A taken
+    random username is retried with a new one, a taken email is reported by the unique constraint.
+    The password is hashed on a worker thread so bcrypt does not block the event loop. The user and
+    their access token are committed together.
 
     Args:
         db (AsyncSession): The asynchronous database session.
@@ -28,24 +40,60 @@ async def create_user(db: AsyncSession, user: dict[str, str]) -> User:
     Returns:
         model_user.User: The newly created user object with all its attributes.
 
+    Raises:
+        HTTPException: If the email is already registered (HTTP 409).
+    """
+    hashed_password = await asyncio.to_thread(hash_handler.hash_password, user["password"])
+    role = case(
+        (select(User.id).exists(), literal(UserRole.USER, User.role.type)),
+        else_=literal(UserRole.ADMIN, User.role.type),
+    )
 
+    db_user = None
+    try:
+        for _ in range(USERNAME_ATTEMPTS):
+            result = await db.execute(
+                insert(User)
+                .values(email=user["email"], hashed_password=hashed_password, role=role, username=generate_username())
+                .on_conflict_do_nothing(index_elements=[User.username])
+                .returning(User)
+            )
+            db_user = result.scalar()
+            if db_user is not None:
+                break
+    except IntegrityError:
+        await db.rollback()
+        raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail="Email already registered")
+    if db_user is None:
+        await db.rollback()
+        raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail="Could not pick a username")
+
+    if db_user.role == UserRole.ADMIN:
+        await ensure_single_first_admin(db, db_user)
 
-    """
-    user_count = await get_user_count(db)
-    hashed_password = hash_handler.hash_password(user["password"])
-    if user_count == 0:
-        role = UserRole.ADMIN
-    else:
-        role = UserRole.USER
-    username = await generate_unique_username(db)
-    db_user = model_user.User(email=user["email"], hashed_password=hashed_password, role=role, username=username)
-    db.add(db_user)
-    await db.commit()
-    await db.refresh(db_user)
     await create_access_token(data={"sub": db_user.email}, user_id=db_user.id, db=db)
     return db_user
 
 
+async def ensure_single_first_admin(db: AsyncSession, db_user: User):
+    """
+    Demotes a user created as the first admin if another signup got there first.
+
+    Two concurrent first signups can both see an empty `users` table. Each then takes the same
+    transaction-level advisory lock; the second one only gets it after the first commits, sees the
+    other user and becomes a regular user.
+
+    Args:
+        db (AsyncSession): The asynchronous database session, in the transaction that created the user.
+        db_user (User): The user created with the admin role.
+    """
+    await db.execute(select(func.pg_advisory_xact_lock(FIRST_ADMIN_LOCK)))
+    result = await db.execute(select(exists().where(User.id != db_user.id)))
+    if result.scalar():
+        db_user.role = UserRole.USER
+        await db.flush()
+
+
 @log_function
 async def get_user_by_email(db: AsyncSession, email: str):
     """
@@ -101,6 +149,43 @@ async def get_users(db: AsyncSession, skip: int = 0, limit: int = 100):
     return result.scalars().all()
 
 
+async def get_people_page(db: AsyncSession, prefix: Optional[str] = None, after: Optional[str] = None,
+                          limit: int = settings.PEOPLE_PAGE_SIZE) -> tuple:
+    """
+    Retrieve one page of the people directory: active users ordered by username, using keyset pagination.
+
+    Only the columns the directory shows are selected, and the query is served by the partial
+    `username COLLATE "C"` index on active users, so neither the prefix search nor deep pages
+    scan the table.
+
+    Args:
+        db (AsyncSession): The database session.
+        prefix (Optional[str]): Only users whose username starts with this text.
+        after (Optional[str]): The `next_cursor` of the previous page; the first page when omitted.
+        limit (int): The page size.
+
+    Returns:
+        tuple: Rows with `username`, `registered_at` and `photos_uploaded`, and the cursor for the
+        next page, or None on the last page.
+    """
+    username = User.username.collate("C")
+    query = (
+        select(User.username, User.registered_at, User.photos_uploaded)
+        .where(User.is_active == True)
+        .order_by(username)
+        .limit(limit + 1)
+    )
+    if prefix:
+        query = query.where(username.startswith(prefix, autoescape=True))
+    if after is not None:
+        query = query.where(username > after)
+
+    result = await db.execute(query)
+    people = result.all()
+    next_cursor = people[limit - 1].username if len(people) > limit else None
+    return people[:limit], next_cursor
+
+
 @log_function
 async def update_user_last_login(db: AsyncSession, user_id: int):
     """
@@ -120,7 +205,12 @@ async def update_user_last_login(db: AsyncSession, user_id: int):
 
 async def deactivate_user(db: AsyncSession, user_id: int):
     """
-    Deactivates a user by setting the is_active field to False.
+    Bans a user: sets the is_active field to False and revokes all of their tokens.
+
+    The flag, the token revocation and the eviction of the user's cached profile happen in one
+    transaction, so the ban is in force for the user's next request, on every worker.
+    `get_current_user` rejects inactive users from the row it loads anyway, so enforcing the ban
+    adds no work per request.
 
     Args:
         db (AsyncSession): The asynchronous database session.
@@ -135,24 +225,11 @@ async def deactivate_user(db: AsyncSession, user_id: int):
         .values(is_active=False)
     )
     await db.execute(stmt)
+    await revoke_user_tokens(db, user_id)
+    profile_cache.invalidate_after_commit(db, user_id)
     await db.commit()
 
 
-async def get_user_count(db: AsyncSession) -> int:
-    """
-    Retrieves the count of users in the database.
-
-    Args:
-        db (AsyncSession): The asynchronous database session.
-
-    Returns:
-        int: The number of users in the database.
-    """
-    result = await db.execute(select(User))
-    users = result.scalars().all()
-    return len(users)
-
-
 async def get_user_by_username(db: AsyncSession, username: str):
     """
         Retrieves a user from the database by their username.
@@ -1,7 +1,16 @@
 from .photo import Photo
 from .user import User
+from .comment import Comment
 from .tag import Tag
 from .token import Token, BlacklistedToken
+from .job import JobCheckpoint
+from .tag_relation import TagCooccurrence, RelatedTags
+from .leaderboard import LeaderboardEntry
+from .moderation import BannedTerm, ModerationQueueItem
+from .site_stats import SiteStats
+from .asset_purge import AssetPurge
 
-__all__ = ["User", "Photo", "Tag", "BlacklistedToken"]
+__all__ = ["User", "Photo", "Comment", "Tag", "BlacklistedToken", "JobCheckpoint", "TagCooccurrence", "RelatedTags",
+           "LeaderboardEntry", "BannedTerm", "ModerationQueueItem", "SiteStats",
+           "AssetPurge"]
 
@@ -0,0 +1,27 @@
+from sqlalchemy import Column, Integer, String, DateTime
+from datetime import datetime
+from app.src.util.db import Base
+
+
+class AssetPurge(Base):
+    """
+    Outbox entry for an image to delete from Cloudinary, written in the transaction that deletes the photo.
+
+    Attributes:
+    - id (int): The primary key; entries are purged in this order.
+    - public_id (str): The Cloudinary public ID of the image; its derived images go with it.
+    - attempts (int): The number of failed purge attempts.
+    - next_attempt_at (datetime): The earliest time of the next attempt.
+    - last_error (str): The error of the last failed attempt.
+    - created_at (datetime): The time the entry was queued.
+    """
+
+    __tablename__ = "asset_purges"
+    __table_args__ = {'extend_existing': True}
+
+    id = Column(Integer, primary_key=True)
+    public_id = Column(String, nullable=False, unique=True)
+    attempts = Column(Integer, nullable=False, default=0)
+    next_attempt_at = Column(DateTime, nullable=False, default=datetime.utcnow, index=True)
+    last_error = Column(String, nullable=True)
+    created_at = Column(DateTime, default=datetime.utcnow)
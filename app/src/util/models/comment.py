@@ -1,4 +1,4 @@
-from sqlalchemy import Column, ForeignKey, Integer, String, DateTime
+from sqlalchemy import Column, ForeignKey, Integer, String, DateTime, Index
 from sqlalchemy.orm import relationship
 from datetime import datetime
 from app.src.util.db import Base
@@ -19,7 +19,10 @@ class Comment(Base):
     """
 
     __tablename__ = "comments"
-    __table_args__ = {'extend_existing': True}
+    __table_args__ = (
+        Index("ix_comments_photo_id_created_at_id", "photo_id", "created_at", "id"),
+        {'extend_existing': True},
+    )
 
     id = Column(Integer, primary_key=True)
     content = Column(String)
@@ -0,0 +1,21 @@
+from sqlalchemy import Column, String, DateTime, BigInteger
+from datetime import datetime
+from app.src.util.db import Base
+
+
+class JobCheckpoint(Base):
+    """
+    Progress marker for incremental background jobs.
+
+    Attributes:
+    - name (str): The unique name of the job.
+    - position (int): The last source row ID the job has processed.
+    - updated_at (datetime): The timestamp of the last run that moved the checkpoint.
+    """
+
+    __tablename__ = "job_checkpoints"
+    __table_args__ = {'extend_existing': True}
+
+    name = Column(String, primary_key=True)
+    position = Column(BigInteger, nullable=False, default=0)
+    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
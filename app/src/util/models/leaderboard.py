@@ -0,0 +1,33 @@
+from sqlalchemy import Column, Integer, String, Float, ForeignKey, DateTime
+from sqlalchemy.orm import relationship
+from datetime import datetime
+from app.src.util.db import Base
+
+
+class LeaderboardEntry(Base):
+    """
+    One row of a materialized top-rated photos ranking.
+
+    Attributes:
+    - period (str): The ranking window: "day", "week" or "all".
+    - rank (int): The 1-based position in the ranking.
+    - photo_id (int): The ranked photo.
+    - score (float): The Bayesian average the ranking is ordered by.
+    - rating_count (int): The number of ratings in the window.
+    - average_rating (float): The plain average rating in the window.
+    - computed_at (datetime): The timestamp of the snapshot.
+    - photo (Photo): The ranked photo.
+    """
+
+    __tablename__ = "leaderboard_entries"
+    __table_args__ = {'extend_existing': True}
+
+    period = Column(String, primary_key=True)
+    rank = Column(Integer, primary_key=True)
+    photo_id = Column(Integer, ForeignKey("photos.id", ondelete="CASCADE"), nullable=False)
+    score = Column(Float, nullable=False)
+    rating_count = Column(Integer, nullable=False)
+    average_rating = Column(Float, nullable=False)
+    computed_at = Column(DateTime, default=datetime.utcnow)
+
+    photo = relationship("Photo", lazy='selectin')
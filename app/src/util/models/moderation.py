@@ -0,0 +1,49 @@
+from sqlalchemy import Column, Integer, String, DateTime, ForeignKey, JSON
+from sqlalchemy.orm import relationship
+from datetime import datetime
+from app.src.util.db import Base
+
+
+class BannedTerm(Base):
+    """
+    A word or phrase that comments are checked for.
+
+    Attributes:
+    - id (int): The unique identifier of the term.
+    - term (str): The banned word or phrase, matched case-insensitively on word boundaries.
+    - action (str): "flag" to queue matching comments for review, "hold" to also hide them until approved.
+    - created_at (datetime): The timestamp of when the term was added.
+    """
+
+    __tablename__ = "banned_terms"
+    __table_args__ = {'extend_existing': True}
+
+    id = Column(Integer, primary_key=True)
+    term = Column(String, nullable=False, unique=True)
+    action = Column(String, nullable=False, default="flag")
+    created_at = Column(DateTime, default=datetime.utcnow)
+
+
+class ModerationQueueItem(Base):
+    """
+    A comment waiting for a moderator because it contains banned terms.
+
+    Attributes:
+    - id (int): The unique identifier of the queue item.
+    - comment_id (int): The flagged comment.
+    - status (str): "flagged" while the comment is visible, "held" while it is hidden.
+    - matched_terms (list): The banned terms found in the comment.
+    - created_at (datetime): The timestamp of when the comment was flagged.
+    - comment (Comment): The flagged comment.
+    """
+
+    __tablename__ = "moderation_queue"
+    __table_args__ = {'extend_existing': True}
+
+    id = Column(Integer, primary_key=True)
+    comment_id = Column(Integer, ForeignKey("comments.id", ondelete="CASCADE"), nullable=False, unique=True)
+    status = Column(String, nullable=False)
+    matched_terms = Column(JSON, nullable=False)
+    created_at = Column(DateTime, default=datetime.utcnow)
+
+    comment = relationship("Comment", lazy='selectin')
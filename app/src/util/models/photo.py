@@ -1,6 +1,7 @@
-from sqlalchemy import Column, Integer, String, ForeignKey, Table
+from sqlalchemy import Column, Integer, String, ForeignKey, Table, UniqueConstraint, Index, DateTime
 from sqlalchemy.orm import relationship
 from app.src.util.db import Base
+from datetime import datetime
 
 photo_m2m_tag = Table(
     "photo_m2m_tag",
@@ -8,6 +9,8 @@ photo_m2m_tag = Table(
     Column("id", Integer, primary_key=True),
     Column("photo", Integer, ForeignKey("photos.id", ondelete="CASCADE")),
     Column("tag", Integer, ForeignKey("tags.id", ondelete="CASCADE")),
+    UniqueConstraint("tag", "photo", name="uq_photo_m2m_tag_tag_photo"),
+    Index("ix_photo_m2m_tag_photo", "photo"),
     extend_existing=True)
 
 
@@ -23,19 +26,45 @@ class Photo(Base):
     url (str): The URL of the photo.
     public_id(str): The unique identifier of the photo.
     user_id (int): The foreign key to the user who owns the photo.
+    created_at (datetime): The upload time; None for photos uploaded before it was recorded.
+    rating_count (int): The number of ratings the photo received.
+    rating_sum (int): The sum of all rating values, kept together with `rating_count`.
+    rating_count_1 .. rating_count_5 (int): The number of ratings with each star value.
+    average_rating (float): The average rating rounded to two decimals, None if not rated yet.
+    rating_histogram (dict): The number of ratings per star value, 1 to 5.
     owner (User): The user who owns the photo.
     tags (List[Tag]): The list of tags associated with the photo.
     comments (List[Comment]): The list of comments associated with the photo.
     """
 
     __tablename__ = 'photos'
-    __table_args__ = {'extend_existing': True}
+    __table_args__ = (
+        Index("ix_photos_user_id_id", "user_id", "id"),
+        {'extend_existing': True},
+    )
 
     id = Column(Integer, primary_key=True)
     description = Column(String, nullable=True)
     url = Column(String)
     public_id = Column(String)
     user_id = Column(Integer, ForeignKey('users.id'))
+    created_at = Column(DateTime, default=datetime.utcnow, index=True)
+    rating_count = Column(Integer, nullable=False, default=0, server_default="0")
+    rating_sum = Column(Integer, nullable=False, default=0, server_default="0")
+    rating_count_1 = Column(Integer, nullable=False, default=0, server_default="0")
+    rating_count_2 = Column(Integer, nullable=False, default=0, server_default="0")
+    rating_count_3 = Column(Integer, nullable=False, default=0, server_default="0")
+    rating_count_4 = Column(Integer, nullable=False, default=0, server_default="0")
+    rating_count_5 = Column(Integer, nullable=False, default=0, server_default="0")
     owner = relationship("User", backref="photos", lazy='selectin')
     tags = relationship("Tag", secondary=photo_m2m_tag, back_populates="photos", lazy='selectin')
 
+    @property
+    def average_rating(self):
+        if not self.rating_count:
+            return None
+        return round(self.rating_sum / self.rating_count, 2)
+
+    @property
+    def rating_histogram(self):
+        return {stars: getattr(self, f"rating_count_{stars}") or 0 for stars in range(1, 6)}
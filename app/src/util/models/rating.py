@@ -1,4 +1,5 @@
-from sqlalchemy import Column, Integer,ForeignKey
+from sqlalchemy import Column, Integer, ForeignKey, UniqueConstraint, DateTime, Index
+from datetime import datetime
 from sqlalchemy.orm import relationship
 from app.src.util.db import Base
 
@@ -11,16 +12,24 @@ class Rating(Base):
     - rating (int): The rating value, typically an integer between 1 and 5.
     - user_id (int): The foreign key referencing the user who made the rating.
     - photo_id (int): The foreign key referencing the photo being rated.
+    - created_at (datetime): The timestamp of when the rating was given.
     - owner (User): The relationship with the User who made the rating.
     - photo (Photo): The relationship with the Photo being rated.
     """
 
     __tablename__ = 'ratings'
-    __table_args__ = {'extend_existing': True}
+    __table_args__ = (
+        UniqueConstraint('photo_id', 'user_id', name='uq_ratings_photo_id_user_id'),
+        Index('ix_ratings_created_at_id', 'created_at', 'id'),
+        Index('ix_ratings_rating_id', 'rating', 'id'),
+        Index('ix_ratings_user_id_id', 'user_id', 'id'),
+        {'extend_existing': True},
+    )
 
     id = Column(Integer, primary_key=True)
-    rating = Column(Integer, index=True)
+    rating = Column(Integer)
     user_id = Column(Integer, ForeignKey('users.id'))
     photo_id = Column(Integer, ForeignKey('photos.id'))
+    created_at = Column(DateTime, default=datetime.utcnow)
     owner = relationship("User", backref="ratings", lazy='selectin')
     photo = relationship("Photo", backref='ratings', lazy='selectin')
\ No newline at end of file
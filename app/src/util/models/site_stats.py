@@ -0,0 +1,32 @@
+from sqlalchemy import Column, Integer, DateTime, JSON
+from datetime import datetime
+from app.src.util.db import Base
+
+
+class SiteStats(Base):
+    """
+    Precomputed site-wide statistics shown on the admin dashboard; a single row, refreshed periodically.
+
+    Attributes:
+    - id (int): Always 1.
+    - users (int): The number of users.
+    - active_users (int): The number of active users who logged in within `STATS_ACTIVE_DAYS`.
+    - photos (int): The number of photos.
+    - comments (int): The number of comments.
+    - ratings (int): The number of ratings.
+    - daily (list): One bucket per day of the last `STATS_DAYS` days, oldest first, with the "day"
+      and its "uploads", "signups", "comments" and "ratings".
+    - computed_at (datetime): The timestamp of the snapshot.
+    """
+
+    __tablename__ = "site_stats"
+    __table_args__ = {'extend_existing': True}
+
+    id = Column(Integer, primary_key=True)
+    users = Column(Integer, nullable=False)
+    active_users = Column(Integer, nullable=False)
+    photos = Column(Integer, nullable=False)
+    comments = Column(Integer, nullable=False)
+    ratings = Column(Integer, nullable=False)
+    daily = Column(JSON, nullable=False)
+    computed_at = Column(DateTime, default=datetime.utcnow)
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String
+from sqlalchemy import Column, Integer, String, Index
 from sqlalchemy.orm import relationship
 from app.src.util.db import Base
 from app.src.util.models.photo import photo_m2m_tag
@@ -15,7 +15,9 @@ class Tag(Base):
     tag_id : sqlalchemy.Column
         The primary key column for the Tag.
     name : sqlalchemy.Column
-        The unique name of the Tag.
+        The unique name of the Tag, as first typed.
+    normalized_name : sqlalchemy.Column
+        The canonical, case-folded form of the name that identifies the Tag.
 
     Methods
     -------
@@ -27,7 +29,14 @@ class Tag(Base):
     __table_args__ = {'extend_existing': True}
     id = Column(Integer, primary_key=True, autoincrement=True)
     name = Column(String, unique=True, nullable=False)
-    photos = relationship("Photo", secondary=photo_m2m_tag, back_populates="tags", lazy='selectin')
+    normalized_name = Column(String, nullable=False)
+    photos = relationship("Photo", secondary=photo_m2m_tag, back_populates="tags", lazy='raise')
 
     def __repr__(self):
         return f"<Tag(tag_name={self.name})>"
+
+
+# Canonical tag identity. text_pattern_ops lets the same index serve equality lookups,
+# ON CONFLICT (normalized_name) and prefix searches (`normalized_name LIKE 'abc%'`) for autocomplete.
+Index("ix_tags_normalized_name", Tag.normalized_name, unique=True,
+      postgresql_ops={"normalized_name": "text_pattern_ops"})
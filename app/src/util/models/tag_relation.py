@@ -0,0 +1,41 @@
+from sqlalchemy import Column, Integer, ForeignKey, DateTime, JSON
+from datetime import datetime
+from app.src.util.db import Base
+
+
+class TagCooccurrence(Base):
+    """
+    Number of photos on which two tags appear together.
+
+    Each pair is stored in both directions so the neighbours of a tag are one index range.
+
+    Attributes:
+    - tag_id (int): The tag.
+    - related_tag_id (int): The tag appearing together with `tag_id`.
+    - count (int): The number of photos carrying both tags.
+    """
+
+    __tablename__ = "tag_cooccurrence"
+    __table_args__ = {'extend_existing': True}
+
+    tag_id = Column(Integer, ForeignKey("tags.id", ondelete="CASCADE"), primary_key=True)
+    related_tag_id = Column(Integer, ForeignKey("tags.id", ondelete="CASCADE"), primary_key=True)
+    count = Column(Integer, nullable=False, default=0)
+
+
+class RelatedTags(Base):
+    """
+    Precomputed top related tags of a tag, ranked by lift.
+
+    Attributes:
+    - tag_id (int): The tag.
+    - neighbors (list): `[name, score]` pairs, best first.
+    - updated_at (datetime): The timestamp of the last recomputation.
+    """
+
+    __tablename__ = "related_tags"
+    __table_args__ = {'extend_existing': True}
+
+    tag_id = Column(Integer, ForeignKey("tags.id", ondelete="CASCADE"), primary_key=True)
+    neighbors = Column(JSON, nullable=False, default=list)
+    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
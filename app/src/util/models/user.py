@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, Boolean, DateTime, Enum as SQLEnum
+from sqlalchemy import Column, Integer, String, Boolean, DateTime, Index, Enum as SQLEnum
 from sqlalchemy.orm import relationship
 from sqlalchemy.ext.asyncio import AsyncAttrs
 from app.src.util.db import Base
@@ -40,5 +40,10 @@ class User(AsyncAttrs, Base):
     is_active = Column(Boolean, default=True)
     photos_uploaded = Column(Integer, default=0)
 
-    tokens = relationship("Token", backref="user", cascade="all, delete-orphan", lazy='selectin')
+    # Not eager: the user is loaded on every authenticated request and never needs its tokens there.
+    tokens = relationship("Token", backref="user", cascade="all, delete-orphan")
 
+
+# People directory. The "C" collation orders by code point, so one index serves the username
+# prefix search (`LIKE 'abc%'`) as well as the ORDER BY and keyset condition of the pages.
+Index("ix_users_active_username_c", User.username.collate("C"), postgresql_where=User.is_active == True)
@@ -0,0 +1,20 @@
+from datetime import datetime
+from typing import List, Optional
+from pydantic import BaseModel, Field
+from app.src.config.config import settings
+
+
+class BulkDeleteRequest(BaseModel):
+    """
+    Schema for selecting rows to delete in bulk. All given criteria must match.
+
+    Attributes:
+        ids (Optional[List[int]]): Only delete rows with these IDs.
+        user_id (Optional[int]): Only delete rows of this user.
+        created_from (Optional[datetime]): Only delete rows created at or after this time.
+        created_to (Optional[datetime]): Only delete rows created before this time.
+    """
+    ids: Optional[List[int]] = Field(None, min_length=1, max_length=settings.BULK_DELETE_MAX_IDS)
+    user_id: Optional[int] = None
+    created_from: Optional[datetime] = None
+    created_to: Optional[datetime] = None
@@ -1,4 +1,5 @@
 from datetime import datetime
+from typing import List, Optional
 from pydantic import BaseModel
 
 
@@ -53,3 +54,15 @@ class Comment(CommentBase):
 
     class Config:
         from_attributes = True
+
+
+class CommentsPage(BaseModel):
+    """
+    Schema for one page of a photo's comments.
+
+    Attributes:
+        comments (List[Comment]): The comments on this page, oldest first.
+        next_cursor (Optional[str]): Cursor for the next page, None on the last page.
+    """
+    comments: List[Comment]
+    next_cursor: Optional[str] = None
@@ -0,0 +1,21 @@
+from datetime import datetime
+from pydantic import BaseModel
+
+
+class BannedTermResponse(BaseModel):
+    """
+    Schema for returning a banned term.
+
+    Attributes:
+        id (int): The ID of the term.
+        term (str): The banned word or phrase.
+        action (str): "flag" or "hold".
+        created_at (datetime): When the term was added.
+    """
+    id: int
+    term: str
+    action: str
+    created_at: datetime
+
+    class Config:
+        from_attributes = True
@@ -1,5 +1,5 @@
 from pydantic import BaseModel, conlist
-from typing import List, Optional
+from typing import List, Optional, Literal
 
 from app.src.util.schemas.tag import TagResponse
 
@@ -27,3 +27,33 @@ class PhotoResponse(BaseModel):
 
     class Config:
         from_attributes = True
+
+
+class QRCodeBatchRequest(BaseModel):
+    """
+    Schema for requesting QR codes for several photos at once.
+
+    Attributes:
+        photo_ids (List[int]): IDs of the photos to encode.
+        image_format (str): Image format of each code, "png" or "svg".
+        bundle (str): "zip" for one file per photo, "sheet" for a single printable SVG sheet.
+    """
+    photo_ids: conlist(int, min_length=1)
+    image_format: Literal["png", "svg"] = "svg"
+    bundle: Literal["zip", "sheet"] = "zip"
+
+
+class TagPhotosPage(BaseModel):
+    """
+    Schema for one page of photos with a given tag.
+
+    Attributes:
+        tag (str): The tag name.
+        photo_count (int): The total number of photos with the tag.
+        photos (List[PhotoResponse]): The photos on this page, newest first.
+        next_cursor (Optional[int]): Cursor for the next page, None on the last page.
+    """
+    tag: str
+    photo_count: int
+    photos: List[PhotoResponse]
+    next_cursor: Optional[int] = None
@@ -1,4 +1,7 @@
-from pydantic import BaseModel
+from datetime import datetime
+from typing import Dict, Optional
+from pydantic import BaseModel, conlist
+from app.src.util.schemas.photo import PhotoResponse
 
 class RatingBase(BaseModel):
     """
@@ -39,4 +42,56 @@ class RatingResponse(RatingBase):
 
     class Config:
 
-        from_attributes = True
\ No newline at end of file
+        from_attributes = True
+
+
+class LeaderboardEntryResponse(BaseModel):
+    """
+    Model for one entry of a top-rated photos ranking.
+
+    Attributes:
+    rank (int): The 1-based position in the ranking.
+    score (float): The Bayesian average the ranking is ordered by.
+    rating_count (int): The number of ratings in the ranking period.
+    average_rating (float): The plain average rating in the ranking period.
+    computed_at (datetime): When the ranking was computed.
+    photo (PhotoResponse): The ranked photo.
+    """
+    rank: int
+    score: float
+    rating_count: int
+    average_rating: float
+    computed_at: Optional[datetime] = None
+    photo: PhotoResponse
+
+    class Config:
+
+        from_attributes = True
+
+
+class PhotoRatingsBatchRequest(BaseModel):
+    """
+    Model for requesting the rating summaries of several photos at once.
+
+    Attributes:
+    photo_ids (List[int]): The IDs of the photos.
+    """
+    photo_ids: conlist(int, min_length=1)
+
+
+class PhotoRatingSummary(BaseModel):
+    """
+    Model for the rating summary of one photo.
+
+    Attributes:
+    photo_id (int): The ID of the photo.
+    average (float): The average rating, 0 when the photo has no ratings.
+    count (int): The number of ratings.
+    histogram (Dict[int, int]): The number of ratings per star value, 1 to 5.
+    user_rating (Optional[int]): The logged-in viewer's rating, if any.
+    """
+    photo_id: int
+    average: float
+    count: int
+    histogram: Dict[int, int]
+    user_rating: Optional[int] = None
@@ -38,3 +38,25 @@ class PhotoTaggingResponse(BaseModel):
 
 class TagResponse(BaseModel):
     name: str
+
+
+class TagSuggestion(BaseModel):
+    """Schema for a tag autocomplete suggestion.
+
+    Attributes:
+        name (str): The name of the tag.
+        count (int): The number of photos using the tag.
+    """
+    name: str
+    count: int
+
+
+class RelatedTag(BaseModel):
+    """Schema for a related tag suggestion.
+
+    Attributes:
+        name (str): The name of the related tag.
+        score (float): The lift of the pair; higher means the tags go together more often than by chance.
+    """
+    name: str
+    score: float